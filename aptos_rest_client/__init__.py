@@ -1 +1,10 @@
 from .client import CustomRestClient
+from .async_client import AsyncCustomRestClient
+from .rpc_pool import RpcPool
+from .http_pool import HttpPool
+from .wallet_snapshot import WalletSnapshot
+from .coalescing import RequestCoalescer
+from .retry import RetryPolicy
+from .metrics import RpcMetrics
+from .view import ViewCall
+from .view import ViewArgument
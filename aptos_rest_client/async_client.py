@@ -0,0 +1,401 @@
+import asyncio
+from typing import Any, Dict, List, Tuple, Union
+
+import httpx
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.async_client import RestClient
+from aptos_sdk.async_client import ApiError
+from aptos_sdk.async_client import ResourceNotFound
+from aptos_sdk.async_client import ClientConfig
+from aptos_sdk.metadata import Metadata
+from aptos_sdk.transactions import SignedTransaction
+
+from .http_pool import HttpPool
+from .rpc_pool import RpcPool
+from .rpc_pool import AsyncRoutingTransport
+from .rpc_pool import get_proxy_url
+from .rpc_pool import PREFERRED_NODE_EXTENSION
+from .resource_cache import resource_cache
+from .json_codec import get_response_json
+from .sequence_numbers import SequenceNumbers
+from .sequence_numbers import is_sequence_number_error
+from .view import ViewCall
+from .view import ViewCache
+from .view import view_cache
+from .view import get_table_item_key
+from .gas_price import GasPriceOracle
+from .gas_price import GasPriceEstimate
+from .bcs_resources import BcsResources
+from .bcs_resources import BCS_CONTENT_TYPE
+from .batch_submit import BatchSubmitter
+from .batch_submit import SubmitBatch
+from .batch_submit import SIGNED_TRANSACTION_CONTENT_TYPE
+from .coalescing import AsyncCoalescingTransport
+from .retry import AsyncRetryTransport
+from .wallet_snapshot import WalletSnapshot
+from .wallet_snapshot import get_resources_page
+from .wallet_snapshot import get_resources_page_url
+from .wallet_snapshot import get_response_ledger_version
+from .wallet_snapshot import CURSOR_HEADER
+
+
+_chain_ids: Dict[str, int] = {}
+
+
+class AsyncCustomRestClient(RestClient):
+    def __init__(
+            self,
+            base_url: str,
+            proxies: dict = None,
+
+    ):
+        # Connections are shared by HttpPool, SDK init would open a new pool per client
+        self.base_url = base_url
+        self.proxy_url = get_proxy_url(proxies)
+        self.client_config = ClientConfig()
+        self.routing_transport = AsyncRoutingTransport(
+            base_url=base_url,
+            pool=RpcPool.get_pool(base_url),
+            transport=HttpPool.get_async_transport(proxies)
+        )
+        self.client = httpx.AsyncClient(
+            transport=AsyncCoalescingTransport(
+                transport=AsyncRetryTransport(transport=self.routing_transport)
+            ),
+            timeout=httpx.Timeout(60.0, pool=None),
+            headers={Metadata.APTOS_HEADER: Metadata.get_aptos_header_val()}
+        )
+
+    @property
+    def node_url(self) -> str:
+        """
+        Url of the node that served the last successful request, e.g. transaction submission
+        :return:
+        """
+        return self.routing_transport.sticky_node_url
+
+    async def chain_id(self) -> int:
+        chain_id = _chain_ids.get(self.base_url)
+        if chain_id is None:
+            chain_id = int((await self.info())["chain_id"])
+            _chain_ids[self.base_url] = chain_id
+
+        return chain_id
+
+    async def account_resource(
+            self,
+            account_address: AccountAddress,
+            resource_type: str,
+            ledger_version: int = None,
+            cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Gets account resource, latest state reads are served from resource cache
+        :param account_address:
+        :param resource_type:
+        :param ledger_version: historical reads are not cached
+        :param cache: False to force node request, e.g. for frequently changing supply
+        :return:
+        """
+        if ledger_version or not cache:
+            return await super().account_resource(account_address, resource_type, ledger_version)
+
+        entry = resource_cache.get(self.base_url, account_address, resource_type)
+        if entry is not None:
+            return resource_cache.get_value_from_entry(entry, resource_type, not_found_error=ResourceNotFound)
+
+        bcs_struct = BcsResources.get_struct(resource_type)
+        response = await self.client.get(
+            f"{self.base_url}/accounts/{account_address}/resource/{resource_type}",
+            headers={"Accept": BCS_CONTENT_TYPE} if bcs_struct is not None else None
+        )
+
+        return resource_cache.get_value_from_response(
+            base_url=self.base_url,
+            account_address=account_address,
+            resource_type=resource_type,
+            response=response,
+            not_found_error=ResourceNotFound,
+            api_error=ApiError,
+            bcs_struct=bcs_struct
+        )
+
+    async def account_resources(
+            self,
+            account_address: AccountAddress,
+            ledger_version: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets all account resources, pages are read at the ledger version of the first one
+        :param account_address:
+        :param ledger_version:
+        :return:
+        """
+        resources, _ = await self.get_account_resources_at_version(account_address, ledger_version)
+        return resources
+
+    async def get_account_resources_at_version(
+            self,
+            account_address: AccountAddress,
+            ledger_version: int = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Gets all account resources with pagination
+        :param account_address:
+        :param ledger_version: latest if not set
+        :return: resources list and ledger version they were read at
+        """
+        resources = []
+        cursor = None
+
+        while True:
+            response = await self.client.get(get_resources_page_url(
+                base_url=self.base_url,
+                account_address=account_address,
+                cursor=cursor,
+                ledger_version=ledger_version
+            ))
+            resources.extend(get_resources_page(account_address, response, api_error=ApiError))
+
+            if not ledger_version:
+                ledger_version = get_response_ledger_version(response)
+
+            cursor = response.headers.get(CURSOR_HEADER)
+            if not cursor:
+                return resources, ledger_version
+
+    async def get_wallet_snapshot(self, account_address: AccountAddress) -> WalletSnapshot:
+        """
+        Gets snapshot of all account resources, resource cache is seeded with them
+        :param account_address:
+        :return:
+        """
+        resources, ledger_version = await self.get_account_resources_at_version(account_address)
+        snapshot = WalletSnapshot(
+            account_address=account_address,
+            resources=resources,
+            ledger_version=ledger_version
+        )
+        snapshot.seed_resource_cache(self.base_url)
+
+        return snapshot
+
+    async def gas_price_estimate(self, ttl: float = None) -> GasPriceEstimate:
+        """
+        Gets gas unit price estimate of node, estimate is shared by all clients of node for ttl
+        :param ttl: cache ttl in seconds, 0 to force node request
+        :return:
+        """
+        estimate = GasPriceOracle.get(self.base_url) if ttl != 0 else None
+        if estimate is not None:
+            return estimate
+
+        response = await self.client.get(f"{self.base_url}/estimate_gas_price")
+        estimate = GasPriceOracle.get_estimate_from_response(response, api_error=ApiError)
+        GasPriceOracle.put(self.base_url, estimate, ttl)
+
+        return estimate
+
+    async def view(
+            self,
+            call: ViewCall,
+            ledger_version: int = None,
+            ttl: float = None
+    ) -> List[Any]:
+        """
+        Calls view function, latest state results are served from view cache
+        :param call:
+        :param ledger_version: historical calls are not cached
+        :param ttl: cache ttl in seconds, 0 to force node request
+        :return: view function return values
+        """
+        url = f"{self.base_url}/view"
+        if ledger_version:
+            url += f"?ledger_version={ledger_version}"
+            response = await self.client.post(url, json=call.to_payload())
+            return ViewCache.get_value_from_response(response, api_error=ApiError)
+
+        key = call.get_key()
+        entry = view_cache.get(self.base_url, key) if ttl != 0 else None
+        if entry is not None:
+            return entry.value
+
+        response = await self.client.post(url, json=call.to_payload())
+        value = ViewCache.get_value_from_response(response, api_error=ApiError)
+        view_cache.put(self.base_url, key, value, ttl)
+
+        return value
+
+    async def view_many(
+            self,
+            calls: List[ViewCall],
+            max_concurrency: int = 32,
+            ttl: float = None
+    ) -> List[Union[List[Any], Exception]]:
+        """
+        Calls view functions concurrently, e.g. same function for many wallets
+        :param calls:
+        :param max_concurrency: max concurrent requests
+        :param ttl:
+        :return: results in order of calls, failed calls are returned as exceptions
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def view_with_semaphore(call: ViewCall) -> List[Any]:
+            async with semaphore:
+                return await self.view(call, ttl=ttl)
+
+        return await asyncio.gather(
+            *[view_with_semaphore(call) for call in calls],
+            return_exceptions=True
+        )
+
+    async def get_table_item(
+            self,
+            handle: str,
+            key_type: str,
+            value_type: str,
+            key: Any,
+            ledger_version: int = None,
+            ttl: float = None
+    ) -> Any:
+        """
+        Gets table item, latest state items are served from view cache
+        :param handle:
+        :param key_type:
+        :param value_type:
+        :param key:
+        :param ledger_version: historical reads are not cached
+        :param ttl: cache ttl in seconds, 0 to force node request
+        :return:
+        """
+        if ledger_version:
+            return await super().get_table_item(handle, key_type, value_type, key, ledger_version)
+
+        cache_key = get_table_item_key(handle, key_type, value_type, key)
+        entry = view_cache.get(self.base_url, cache_key) if ttl != 0 else None
+        if entry is not None:
+            return entry.value
+
+        value = await super().get_table_item(handle, key_type, value_type, key)
+        view_cache.put(self.base_url, cache_key, value, ttl)
+
+        return value
+
+    async def get_next_sequence_number(self, account_address: AccountAddress, allocate: bool = False) -> int:
+        """
+        Gets next sequence number of account, it's fetched from node once and then counted locally
+        :param account_address:
+        :param allocate: True to take the number for a transaction to be submitted
+        :return:
+        """
+        while True:
+            sequence_number = SequenceNumbers.get_next(self.base_url, account_address, allocate=allocate)
+            if sequence_number is not None:
+                return sequence_number
+
+            SequenceNumbers.set_fetched(
+                self.base_url,
+                account_address,
+                await self.fetch_sequence_number(account_address)
+            )
+
+    async def fetch_sequence_number(self, account_address: AccountAddress) -> int:
+        """
+        Gets sequence number of account from the node it last submitted to, pool nodes may lag behind it
+        :param account_address:
+        :return:
+        """
+        node_url = SequenceNumbers.get_node_url(self.base_url, account_address) or self.node_url
+        response = await self.client.get(
+            f"{self.base_url}/accounts/{account_address}",
+            extensions={PREFERRED_NODE_EXTENSION: node_url}
+        )
+        if response.status_code >= 400:
+            raise ApiError(f"{response.text} - {account_address}", response.status_code)
+
+        return int(get_response_json(response)["sequence_number"])
+
+    def release_sequence_number(self, account_address: AccountAddress, sequence_number: int):
+        SequenceNumbers.release(self.base_url, account_address, sequence_number)
+
+    def resync_sequence_number(self, account_address: AccountAddress):
+        SequenceNumbers.resync(self.base_url, account_address)
+
+    async def submit_bcs_transaction(self, signed_transaction: SignedTransaction) -> str:
+        sender = signed_transaction.transaction.sender
+        self.invalidate_account_resources(sender)
+
+        try:
+            if BatchSubmitter.is_enabled(self.base_url):
+                txn_hash = await self.submit_batched_transaction(signed_transaction)
+            else:
+                txn_hash = await super().submit_bcs_transaction(signed_transaction)
+
+        except ApiError as e:
+            if is_sequence_number_error(e):
+                self.resync_sequence_number(sender)
+            raise
+
+        SequenceNumbers.set_node_url(self.base_url, sender, self.node_url)
+
+        return txn_hash
+
+    async def submit_batched_transaction(self, signed_transaction: SignedTransaction) -> str:
+        """
+        Submits transaction in one /transactions/batch request with transactions of other wallets
+        :param signed_transaction:
+        :return: transaction hash
+        """
+        future, batch, is_leader = BatchSubmitter.join(self.base_url, self.proxy_url, True, signed_transaction)
+
+        if is_leader:
+            await asyncio.wait([asyncio.wrap_future(batch.filled)], timeout=BatchSubmitter.max_wait_sec)
+            BatchSubmitter.close(self.base_url, self.proxy_url, True, batch)
+            await self.submit_batch(batch)
+
+        txn_hash = await asyncio.wrap_future(future)
+        if not is_leader and batch.node_url:
+            # Receipt is waited for on the node the leader submitted to
+            self.routing_transport.stick_to(batch.node_url)
+
+        return txn_hash
+
+    async def submit_batch(self, batch: SubmitBatch):
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/transactions/batch",
+                headers={"Content-Type": SIGNED_TRANSACTION_CONTENT_TYPE},
+                content=batch.get_content()
+            )
+
+        except Exception as e:
+            batch.set_exception(e)
+            return
+
+        batch.node_url = self.node_url
+        if response.status_code == 404:
+            # Node without batch route, transactions of the batch are submitted one by one
+            BatchSubmitter.set_unsupported(self.base_url)
+            for signed_transaction, future in zip(batch.transactions, batch.futures):
+                try:
+                    future.set_result(await super().submit_bcs_transaction(signed_transaction))
+
+                except Exception as e:
+                    future.set_exception(e)
+            return
+
+        BatchSubmitter.resolve(batch, response, api_error=ApiError)
+
+    def invalidate_account_resources(self, account_address, ledger_version: int = None):
+        """
+        Drops cached resources of account, called on submit and on committed transaction
+        :param account_address:
+        :param ledger_version: version of committed transaction
+        :return:
+        """
+        if account_address is None:
+            return
+
+        resource_cache.invalidate_account(self.base_url, account_address, ledger_version)
+        view_cache.invalidate_account(self.base_url, account_address)
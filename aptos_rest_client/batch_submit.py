@@ -0,0 +1,162 @@
+import json
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Tuple, Type, Union
+
+import httpx
+from aptos_sdk.bcs import Serializer
+from aptos_sdk.client import ApiError
+from aptos_sdk.transactions import SignedTransaction
+
+from .rpc_pool import normalize_url
+from .json_codec import get_response_json
+
+
+SIGNED_TRANSACTION_CONTENT_TYPE = "application/x.aptos.signed_transaction+bcs"
+TRANSACTION_HASH_PREFIX = hashlib.sha3_256(b"APTOS::Transaction").digest()
+
+
+def get_transaction_hash(signed_transaction: SignedTransaction) -> str:
+    """
+    Gets hash of user transaction as node computes it, batch response has no hashes
+    :param signed_transaction:
+    :return:
+    """
+    # User transaction variant of Transaction enum is 0
+    return "0x" + hashlib.sha3_256(TRANSACTION_HASH_PREFIX + b"\x00" + signed_transaction.bytes()).hexdigest()
+
+
+class SubmitBatch:
+    def __init__(self):
+        self.transactions: List[SignedTransaction] = []
+        self.futures: List[Future] = []
+        # Node the leader submitted batch to, set before results
+        self.node_url: Union[str, None] = None
+
+        # Set when batch is full, leader sends it without waiting for the rest of window
+        self.filled = Future()
+        self.filled.set_running_or_notify_cancel()
+
+    def add(self, signed_transaction: SignedTransaction) -> Future:
+        future = Future()
+        # Running future can't be cancelled by a waiter, e.g. by cancelled asyncio task
+        future.set_running_or_notify_cancel()
+
+        self.transactions.append(signed_transaction)
+        self.futures.append(future)
+
+        return future
+
+    def get_content(self) -> bytes:
+        serializer = Serializer()
+        serializer.sequence(self.transactions, Serializer.struct)
+        return serializer.output()
+
+    def set_exception(self, exception: Exception):
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(exception)
+
+
+class BatchSubmitter:
+    """
+    Process-wide batches of signed transactions submitted to the same node through the same proxy.
+    First transaction of a batch makes its caller the leader: it waits for transactions of other
+    wallets up to max_wait_sec and sends all of them with one /transactions/batch request.
+    Every caller waits for the result of its own transaction, failures of batch response
+    are raised to the wallet whose transaction failed. Disabled by default.
+    """
+    enabled = False
+    max_wait_sec = 0.05
+    # Default batch size limit of Aptos node
+    max_batch_size = 100
+
+    __batches: Dict[Tuple[str, Union[str, None], bool], SubmitBatch] = {}
+    __unsupported: set = set()
+    __lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, enabled: bool):
+        cls.enabled = enabled
+
+    @classmethod
+    def is_enabled(cls, base_url: str) -> bool:
+        return cls.enabled and normalize_url(base_url) not in cls.__unsupported
+
+    @classmethod
+    def set_unsupported(cls, base_url: str):
+        with cls.__lock:
+            cls.__unsupported.add(normalize_url(base_url))
+
+    @classmethod
+    def join(
+            cls,
+            base_url: str,
+            proxy_url: Union[str, None],
+            is_async: bool,
+            signed_transaction: SignedTransaction
+    ) -> Tuple[Future, SubmitBatch, bool]:
+        """
+        Adds transaction to open batch or opens a new one.
+        Sync and async callers are batched apart, leader sends batch with its own client.
+        :param base_url:
+        :param proxy_url:
+        :param is_async:
+        :param signed_transaction:
+        :return: future of transaction hash, batch and True if caller is the leader
+        """
+        key = (normalize_url(base_url), proxy_url, is_async)
+
+        with cls.__lock:
+            batch = cls.__batches.get(key)
+            is_leader = batch is None
+            if is_leader:
+                batch = SubmitBatch()
+                cls.__batches[key] = batch
+
+            future = batch.add(signed_transaction)
+
+            if len(batch.transactions) >= cls.max_batch_size:
+                # Next transaction opens a new batch
+                del cls.__batches[key]
+                batch.filled.set_result(True)
+
+            return future, batch, is_leader
+
+    @classmethod
+    def close(cls, base_url: str, proxy_url: Union[str, None], is_async: bool, batch: SubmitBatch):
+        key = (normalize_url(base_url), proxy_url, is_async)
+
+        with cls.__lock:
+            if cls.__batches.get(key) is batch:
+                del cls.__batches[key]
+
+            if not batch.filled.done():
+                batch.filled.set_result(False)
+
+    @staticmethod
+    def resolve(batch: SubmitBatch, response: httpx.Response, api_error: Type[Exception] = ApiError):
+        """
+        Sets results of batch transactions from node response.
+        Node accepts batch with 202 and reports rejected transactions by index with 206.
+        :param batch:
+        :param response:
+        :param api_error: exception class raised by waiters of failed transactions
+        :return:
+        """
+        if response.status_code >= 400:
+            batch.set_exception(api_error(response.text, response.status_code))
+            return
+
+        failures = {}
+        if response.status_code == 206:
+            for failure in get_response_json(response).get("transaction_failures") or []:
+                failures[int(failure["transaction_index"])] = failure["error"]
+
+        for index, (signed_transaction, future) in enumerate(zip(batch.transactions, batch.futures)):
+            if index in failures:
+                # Error json keeps error code, e.g. sequence_number_too_old, for callers to tell the reason
+                future.set_exception(api_error(json.dumps(failures[index]), 400))
+            else:
+                future.set_result(get_transaction_hash(signed_transaction))
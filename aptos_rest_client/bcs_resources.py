@@ -0,0 +1,221 @@
+from typing import Any, Dict, List, Tuple, Type, Union
+
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.bcs import Deserializer
+from aptos_sdk.bcs import Serializer
+
+
+BCS_CONTENT_TYPE = "application/x-bcs"
+
+
+class BcsResourceError(Exception):
+    pass
+
+
+class BcsResource:
+    """
+    Resource struct decoded from node BCS response.
+    Subclasses read fields in Move struct order and build the same data as node json response,
+    so cached resources and callers don't depend on the read format.
+    """
+
+    @classmethod
+    def deserialize(cls, deserializer: Deserializer) -> "BcsResource":
+        raise NotImplementedError
+
+    def serialize(self, serializer: Serializer):
+        raise NotImplementedError
+
+    def to_resource_data(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @classmethod
+    def from_resource_data(cls, data: Dict[str, Any]) -> "BcsResource":
+        raise NotImplementedError
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BcsResource":
+        deserializer = Deserializer(data)
+        resource = cls.deserialize(deserializer)
+
+        # Layout mismatch must not be taken for a valid resource
+        if deserializer.remaining():
+            raise BcsResourceError(f"{cls.__name__} has {deserializer.remaining()} unread bytes")
+
+        return resource
+
+    def to_bytes(self) -> bytes:
+        serializer = Serializer()
+        self.serialize(serializer)
+        return serializer.output()
+
+    def to_resource(self, resource_type: str) -> Dict[str, Any]:
+        return {"type": resource_type, "data": self.to_resource_data()}
+
+
+class EventHandle(BcsResource):
+    def __init__(self, counter: int, creation_num: int, account_address: AccountAddress):
+        self.counter = counter
+        self.creation_num = creation_num
+        self.account_address = account_address
+
+    @classmethod
+    def deserialize(cls, deserializer: Deserializer) -> "EventHandle":
+        return cls(
+            counter=deserializer.u64(),
+            creation_num=deserializer.u64(),
+            account_address=AccountAddress.deserialize(deserializer)
+        )
+
+    def serialize(self, serializer: Serializer):
+        serializer.u64(self.counter)
+        serializer.u64(self.creation_num)
+        self.account_address.serialize(serializer)
+
+    def to_resource_data(self) -> Dict[str, Any]:
+        return {
+            "counter": str(self.counter),
+            "guid": {
+                "id": {
+                    "addr": str(self.account_address),
+                    "creation_num": str(self.creation_num)
+                }
+            }
+        }
+
+    @classmethod
+    def from_resource_data(cls, data: Dict[str, Any]) -> "EventHandle":
+        return cls(
+            counter=int(data["counter"]),
+            creation_num=int(data["guid"]["id"]["creation_num"]),
+            account_address=AccountAddress.from_hex(data["guid"]["id"]["addr"])
+        )
+
+
+class CoinStore(BcsResource):
+    """
+    0x1::coin::CoinStore<CoinType>
+    """
+
+    def __init__(
+            self,
+            value: int,
+            frozen: bool,
+            deposit_events: EventHandle,
+            withdraw_events: EventHandle
+    ):
+        self.value = value
+        self.frozen = frozen
+        self.deposit_events = deposit_events
+        self.withdraw_events = withdraw_events
+
+    @classmethod
+    def deserialize(cls, deserializer: Deserializer) -> "CoinStore":
+        return cls(
+            value=deserializer.u64(),
+            frozen=deserializer.bool(),
+            deposit_events=EventHandle.deserialize(deserializer),
+            withdraw_events=EventHandle.deserialize(deserializer)
+        )
+
+    def serialize(self, serializer: Serializer):
+        serializer.u64(self.value)
+        serializer.bool(self.frozen)
+        self.deposit_events.serialize(serializer)
+        self.withdraw_events.serialize(serializer)
+
+    def to_resource_data(self) -> Dict[str, Any]:
+        return {
+            "coin": {"value": str(self.value)},
+            "frozen": self.frozen,
+            "deposit_events": self.deposit_events.to_resource_data(),
+            "withdraw_events": self.withdraw_events.to_resource_data()
+        }
+
+    @classmethod
+    def from_resource_data(cls, data: Dict[str, Any]) -> "CoinStore":
+        return cls(
+            value=int(data["coin"]["value"]),
+            frozen=data["frozen"],
+            deposit_events=EventHandle.from_resource_data(data["deposit_events"]),
+            withdraw_events=EventHandle.from_resource_data(data["withdraw_events"])
+        )
+
+
+class PairReserve(BcsResource):
+    """
+    Uniswap v2 like pair reserve, e.g. PancakeSwap swap::TokenPairReserve<X, Y>
+    """
+
+    def __init__(self, reserve_x: int, reserve_y: int, block_timestamp_last: int):
+        self.reserve_x = reserve_x
+        self.reserve_y = reserve_y
+        self.block_timestamp_last = block_timestamp_last
+
+    @classmethod
+    def deserialize(cls, deserializer: Deserializer) -> "PairReserve":
+        return cls(
+            reserve_x=deserializer.u64(),
+            reserve_y=deserializer.u64(),
+            block_timestamp_last=deserializer.u64()
+        )
+
+    def serialize(self, serializer: Serializer):
+        serializer.u64(self.reserve_x)
+        serializer.u64(self.reserve_y)
+        serializer.u64(self.block_timestamp_last)
+
+    def to_resource_data(self) -> Dict[str, Any]:
+        return {
+            "reserve_x": str(self.reserve_x),
+            "reserve_y": str(self.reserve_y),
+            "block_timestamp_last": str(self.block_timestamp_last)
+        }
+
+    @classmethod
+    def from_resource_data(cls, data: Dict[str, Any]) -> "PairReserve":
+        return cls(
+            reserve_x=int(data["reserve_x"]),
+            reserve_y=int(data["reserve_y"]),
+            block_timestamp_last=int(data["block_timestamp_last"])
+        )
+
+
+class BcsResources:
+    """
+    Resource types read from node as BCS instead of json.
+    BCS body of a CoinStore is ~100 bytes against ~500 bytes of json and needs no json parsing.
+    Disabled by default, resources without registered struct are always read as json.
+    """
+    enabled = False
+
+    # (resource type prefix, struct class)
+    __structs: List[Tuple[str, Type[BcsResource]]] = [
+        ("0x1::coin::CoinStore<", CoinStore),
+    ]
+
+    @classmethod
+    def configure(cls, enabled: bool):
+        cls.enabled = enabled
+
+    @classmethod
+    def register(cls, resource_type_prefix: str, struct: Type[BcsResource]):
+        """
+        Registers struct class for resource types starting with prefix
+        :param resource_type_prefix: e.g. "0x1::coin::CoinStore<"
+        :param struct:
+        :return:
+        """
+        if (resource_type_prefix, struct) not in cls.__structs:
+            cls.__structs.append((resource_type_prefix, struct))
+
+    @classmethod
+    def get_struct(cls, resource_type: str) -> Union[Type[BcsResource], None]:
+        if not cls.enabled:
+            return None
+
+        for resource_type_prefix, struct in cls.__structs:
+            if resource_type.startswith(resource_type_prefix):
+                return struct
+
+        return None
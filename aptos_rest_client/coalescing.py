@@ -0,0 +1,192 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Tuple, Union
+
+import httpx
+
+from .rpc_pool import PREFERRED_NODE_EXTENSION
+
+
+class CachedResponseData:
+    def __init__(
+            self,
+            status_code: int,
+            headers: list,
+            content: bytes,
+            extensions: dict
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.extensions = extensions
+
+    def build_response(self) -> httpx.Response:
+        # Raw (not decoded) body is kept, every waiter's client decodes its own copy
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            extensions=self.extensions
+        )
+
+
+class RequestCoalescer:
+    """
+    Process-wide registry of read requests in flight.
+    Identical requests sent while the first one is not answered yet wait for its response
+    instead of going to network. Futures are thread safe, so sync clients and async clients
+    of different event loops share one call.
+    """
+    # POST routes without side effects
+    read_post_paths = ("/view", "/item")
+
+    __in_flight: Dict[Tuple[str, str, str, bytes, Union[str, None]], Future] = {}
+    __lock = threading.Lock()
+
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def is_coalesced(cls, request: httpx.Request) -> bool:
+        if request.method == "GET":
+            return True
+
+        return request.method == "POST" and request.url.path.endswith(cls.read_post_paths)
+
+    @staticmethod
+    def get_key(request: httpx.Request) -> Tuple[str, str, str, bytes, Union[str, None]]:
+        # Same url is read as json or bcs depending on Accept header, and from the node it's pinned to
+        return (
+            request.method,
+            str(request.url),
+            request.headers.get("accept", ""),
+            request.content,
+            request.extensions.get(PREFERRED_NODE_EXTENSION)
+        )
+
+    @classmethod
+    def join(cls, key: Tuple[str, str, str, bytes, Union[str, None]]) -> Tuple[Future, bool]:
+        """
+        Joins request in flight or registers a new one
+        :param key:
+        :return: future of the response and True if caller has to send the request
+        """
+        with cls.__lock:
+            future = cls.__in_flight.get(key)
+            if future is not None:
+                cls.hits += 1
+                return future, False
+
+            future = Future()
+            # Running future can't be cancelled by a waiter, e.g. by cancelled asyncio task
+            future.set_running_or_notify_cancel()
+            cls.__in_flight[key] = future
+            cls.misses += 1
+
+            return future, True
+
+    @classmethod
+    def complete(
+            cls,
+            key: Tuple[str, str, str, bytes, Union[str, None]],
+            future: Future,
+            response_data: Union[CachedResponseData, None] = None,
+            error: Union[BaseException, None] = None
+    ):
+        with cls.__lock:
+            cls.__in_flight.pop(key, None)
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(response_data)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        total = cls.hits + cls.misses
+
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": round(cls.hits / total, 4) if total else 0.0
+        }
+
+    @classmethod
+    def reset_stats(cls):
+        with cls.__lock:
+            cls.hits = 0
+            cls.misses = 0
+
+
+class CoalescingTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not RequestCoalescer.is_coalesced(request):
+            return self.transport.handle_request(request)
+
+        request.read()
+        key = RequestCoalescer.get_key(request)
+        future, is_leader = RequestCoalescer.join(key)
+
+        if not is_leader:
+            return future.result().build_response()
+
+        try:
+            response = self.transport.handle_request(request)
+            response_data = CachedResponseData(
+                status_code=response.status_code,
+                headers=response.headers.raw,
+                content=b"".join(response.iter_raw()),
+                extensions=response.extensions
+            )
+
+        except BaseException as e:
+            RequestCoalescer.complete(key, future, error=e)
+            raise
+
+        RequestCoalescer.complete(key, future, response_data=response_data)
+
+        return response_data.build_response()
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncCoalescingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not RequestCoalescer.is_coalesced(request):
+            return await self.transport.handle_async_request(request)
+
+        await request.aread()
+        key = RequestCoalescer.get_key(request)
+        future, is_leader = RequestCoalescer.join(key)
+
+        if not is_leader:
+            response_data = await asyncio.wrap_future(future)
+            return response_data.build_response()
+
+        try:
+            response = await self.transport.handle_async_request(request)
+            response_data = CachedResponseData(
+                status_code=response.status_code,
+                headers=response.headers.raw,
+                content=b"".join([chunk async for chunk in response.aiter_raw()]),
+                extensions=response.extensions
+            )
+
+        except BaseException as e:
+            RequestCoalescer.complete(key, future, error=e)
+            raise
+
+        RequestCoalescer.complete(key, future, response_data=response_data)
+
+        return response_data.build_response()
+
+    async def aclose(self):
+        await self.transport.aclose()
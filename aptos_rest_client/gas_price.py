@@ -0,0 +1,103 @@
+import time
+import threading
+from typing import Any, Dict, Type, Union
+
+import httpx
+from aptos_sdk.client import ApiError
+
+from .rpc_pool import normalize_url
+from .json_codec import get_response_json
+
+
+class GasPriceEstimate:
+    """
+    Gas unit price buckets of /estimate_gas_price, node omits buckets it can't estimate
+    """
+
+    def __init__(
+            self,
+            deprioritized_gas_estimate: int,
+            gas_estimate: int,
+            prioritized_gas_estimate: int
+    ):
+        self.deprioritized_gas_estimate = deprioritized_gas_estimate
+        self.gas_estimate = gas_estimate
+        self.prioritized_gas_estimate = prioritized_gas_estimate
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "GasPriceEstimate":
+        gas_estimate = int(data["gas_estimate"])
+
+        return cls(
+            deprioritized_gas_estimate=int(data.get("deprioritized_gas_estimate") or gas_estimate),
+            gas_estimate=gas_estimate,
+            prioritized_gas_estimate=int(data.get("prioritized_gas_estimate") or gas_estimate)
+        )
+
+    def get_price(self, bucket: str) -> int:
+        """
+        Gets gas unit price of bucket
+        :param bucket: "deprioritized", "regular" or "prioritized"
+        :return:
+        """
+        if bucket == "deprioritized":
+            return self.deprioritized_gas_estimate
+
+        if bucket == "prioritized":
+            return self.prioritized_gas_estimate
+
+        return self.gas_estimate
+
+
+class CachedGasPrice:
+    def __init__(self, estimate: GasPriceEstimate, expires_at: float):
+        self.estimate = estimate
+        self.expires_at = expires_at
+
+
+class GasPriceOracle:
+    """
+    Process-wide gas price estimates by node.
+    Estimate is requested once per ttl and shared by all wallets, concurrent requests
+    of expired estimate are merged by request coalescing of clients.
+    """
+    default_ttl = 10
+
+    __estimates: Dict[str, CachedGasPrice] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def get(cls, base_url: str) -> Union[GasPriceEstimate, None]:
+        with cls.__lock:
+            cached = cls.__estimates.get(normalize_url(base_url))
+            if cached is None or time.monotonic() >= cached.expires_at:
+                return None
+
+            return cached.estimate
+
+    @classmethod
+    def put(cls, base_url: str, estimate: GasPriceEstimate, ttl: Union[float, None] = None):
+        ttl = cls.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with cls.__lock:
+            cls.__estimates[normalize_url(base_url)] = CachedGasPrice(
+                estimate=estimate,
+                expires_at=time.monotonic() + ttl
+            )
+
+    @classmethod
+    def clear(cls):
+        with cls.__lock:
+            cls.__estimates = {}
+
+    @staticmethod
+    def get_estimate_from_response(
+            response: httpx.Response,
+            api_error: Type[Exception] = ApiError
+    ) -> GasPriceEstimate:
+        if response.status_code >= 400:
+            raise api_error(response.text, response.status_code)
+
+        return GasPriceEstimate.from_data(get_response_json(response))
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+from typing import Dict, List, Tuple, Union
+
+import httpx
+
+from .rpc_pool import get_proxy_url
+from .metrics import MetricsTransport
+from .metrics import AsyncMetricsTransport
+
+
+class HttpPool:
+    """
+    Process-wide keep-alive connection pools, one per proxy.
+    Rest clients of all module instances send requests through the shared
+    transports, so TCP/TLS (and proxy CONNECT) handshakes are paid once per host.
+    Async transports are bound to the event loop they were created in.
+    Transports are metered, so every request of the process is counted in RpcMetrics.
+    """
+    http2 = False
+    limits = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=30
+    )
+
+    __transports: Dict[Tuple[Union[str, None], bool], MetricsTransport] = {}
+    __async_transports: Dict[Tuple[int, Union[str, None], bool], AsyncMetricsTransport] = {}
+    __clients: Dict[Union[str, None], httpx.Client] = {}
+    # Invalidated transports may still be held by clients, they are closed with the rest of the pool
+    __retired_transports: List[Union[MetricsTransport, httpx.Client]] = []
+    __retired_async_transports: List[Tuple[int, AsyncMetricsTransport]] = []
+    __lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, http2: bool):
+        """
+        Sets http2 usage for transports created after the call
+        :param http2:
+        :return:
+        """
+        cls.http2 = http2
+
+    @classmethod
+    def get_transport(cls, proxies: Union[dict, str, None] = None) -> httpx.BaseTransport:
+        key = (get_proxy_url(proxies), cls.http2)
+
+        with cls.__lock:
+            transport = cls.__transports.get(key)
+            if transport is None:
+                transport = MetricsTransport(
+                    transport=httpx.HTTPTransport(
+                        proxy=httpx.Proxy(key[0]) if key[0] else None,
+                        http2=key[1],
+                        limits=cls.limits
+                    ),
+                    proxy_url=key[0]
+                )
+                cls.__transports[key] = transport
+
+            return transport
+
+    @classmethod
+    def get_async_transport(cls, proxies: Union[dict, str, None] = None) -> httpx.AsyncBaseTransport:
+        loop_id = id(asyncio.get_running_loop())
+        key = (loop_id, get_proxy_url(proxies), cls.http2)
+
+        with cls.__lock:
+            transport = cls.__async_transports.get(key)
+            if transport is None:
+                transport = AsyncMetricsTransport(
+                    transport=httpx.AsyncHTTPTransport(
+                        proxy=httpx.Proxy(key[1]) if key[1] else None,
+                        http2=key[2],
+                        limits=cls.limits
+                    ),
+                    proxy_url=key[1]
+                )
+                cls.__async_transports[key] = transport
+
+            return transport
+
+    @classmethod
+    def get_client(cls, proxies: Union[dict, str, None] = None) -> httpx.Client:
+        """
+        Gets shared client for plain http requests, such as proxy checks
+        :param proxies:
+        :return:
+        """
+        proxy_url = get_proxy_url(proxies)
+        transport = cls.get_transport(proxies)
+
+        with cls.__lock:
+            client = cls.__clients.get(proxy_url)
+            if client is None:
+                client = httpx.Client(transport=transport)
+                cls.__clients[proxy_url] = client
+
+            return client
+
+    @classmethod
+    def invalidate_proxy(cls, proxies: Union[dict, str, None]):
+        """
+        Drops pooled transports of the proxy, used when proxy exit ip is rotated.
+        Clients created after the call open new connections, clients holding the old
+        transports keep using them until they are done, they are not closed under them.
+        :param proxies:
+        :return:
+        """
+        proxy_url = get_proxy_url(proxies)
+
+        with cls.__lock:
+            client = cls.__clients.pop(proxy_url, None)
+            if client is not None:
+                cls.__retired_transports.append(client)
+
+            for key in list(cls.__transports):
+                if key[0] == proxy_url:
+                    cls.__retired_transports.append(cls.__transports.pop(key))
+
+            for key in list(cls.__async_transports):
+                if key[1] == proxy_url:
+                    cls.__retired_async_transports.append((key[0], cls.__async_transports.pop(key)))
+
+    @classmethod
+    def close_all(cls):
+        """
+        Closes sync transports and clients
+        :return:
+        """
+        with cls.__lock:
+            transports = list(cls.__transports.values()) + cls.__retired_transports
+            clients = list(cls.__clients.values())
+            cls.__transports = {}
+            cls.__clients = {}
+            cls.__retired_transports = []
+
+        for transport in transports:
+            transport.close()
+
+        for client in clients:
+            client.close()
+
+    @classmethod
+    async def aclose_loop_transports(cls):
+        """
+        Closes async transports of the running event loop
+        :return:
+        """
+        loop_id = id(asyncio.get_running_loop())
+
+        with cls.__lock:
+            keys = [key for key in cls.__async_transports if key[0] == loop_id]
+            transports = [cls.__async_transports.pop(key) for key in keys]
+
+            transports += [transport for key, transport in cls.__retired_async_transports if key == loop_id]
+            cls.__retired_async_transports = [
+                (key, transport) for key, transport in cls.__retired_async_transports if key != loop_id
+            ]
+
+        for transport in transports:
+            await transport.aclose()
+
+    @classmethod
+    async def aclose_all(cls):
+        """
+        Closes async transports of the running event loop, sync transports and clients
+        :return:
+        """
+        await cls.aclose_loop_transports()
+        cls.close_all()
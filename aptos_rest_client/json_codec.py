@@ -0,0 +1,46 @@
+import json
+from typing import Any, Callable, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def get_default_decoder() -> Callable[[Union[bytes, str]], Any]:
+    """
+    Gets fastest available json decoder: orjson, msgspec or stdlib json
+    :return:
+    """
+    if orjson is not None:
+        return orjson.loads
+
+    if msgspec is not None:
+        return msgspec.json.decode
+
+    return json.loads
+
+
+json_loads: Callable[[Union[bytes, str]], Any] = get_default_decoder()
+
+
+def set_json_decoder(decoder: Callable[[Union[bytes, str]], Any]):
+    """
+    Sets decoder used for rpc responses, decoder takes bytes or str
+    :param decoder:
+    :return:
+    """
+    global json_loads
+    json_loads = decoder
+
+
+def get_response_json(response: httpx.Response) -> Any:
+    # Raw bytes are decoded without building intermediate str as in httpx Response.json
+    return json_loads(response.content)
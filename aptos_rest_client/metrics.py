@@ -0,0 +1,337 @@
+import re
+import json
+import time
+import bisect
+import threading
+from typing import Dict, List, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+
+
+ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]+")
+NUMBER_PATTERN = re.compile(r"^\d+$")
+
+
+def normalize_route(path: str) -> str:
+    """
+    Gets low cardinality route template of url path
+    /v1/accounts/0x1a.../resource/0x1::coin::CoinStore<...> -> /v1/accounts/{address}/resource/{resource_type}
+    :param path:
+    :return:
+    """
+    segments = path.split("/")
+    route_segments = []
+
+    for index, segment in enumerate(segments):
+        if index > 0 and segments[index - 1] == "resource":
+            route_segments.append("{resource_type}")
+            break
+
+        if "::" in segment:
+            route_segments.append("{type}")
+        elif ADDRESS_PATTERN.fullmatch(segment):
+            route_segments.append("{address}")
+        elif NUMBER_PATTERN.match(segment):
+            route_segments.append("{number}")
+        else:
+            route_segments.append(segment)
+
+    return "/".join(route_segments)
+
+
+def get_proxy_label(proxy_url: Union[str, None]) -> str:
+    # Credentials are not written to metrics
+    if not proxy_url:
+        return "direct"
+
+    parsed_url = urlparse(proxy_url)
+    return f"{parsed_url.hostname}:{parsed_url.port}"
+
+
+class LatencyHistogram:
+    # Upper bounds of buckets in milliseconds, last bucket is unbounded
+    buckets_ms = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Union[float, None] = None
+        self.max_ms: Union[float, None] = None
+
+    def add(self, latency_ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.min_ms = latency_ms if self.min_ms is None else min(self.min_ms, latency_ms)
+        self.max_ms = latency_ms if self.max_ms is None else max(self.max_ms, latency_ms)
+
+    def get_percentile(self, percentile: float) -> Union[float, None]:
+        """
+        Gets percentile estimate, upper bound of the bucket it falls into
+        :param percentile: 0 - 100
+        :return:
+        """
+        if not self.count:
+            return None
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if index < len(self.buckets_ms):
+                    return min(float(self.buckets_ms[index]), self.max_ms)
+                return self.max_ms
+
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        bucket_names = [f"le_{bound}ms" for bound in self.buckets_ms] + ["inf"]
+
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "min_ms": round(self.min_ms, 2) if self.min_ms is not None else None,
+            "max_ms": round(self.max_ms, 2) if self.max_ms is not None else None,
+            "p50_ms": self.get_percentile(50),
+            "p90_ms": self.get_percentile(90),
+            "p99_ms": self.get_percentile(99),
+            "buckets": {
+                name: bucket_count for name, bucket_count in zip(bucket_names, self.counts) if bucket_count
+            },
+        }
+
+
+class RouteStats:
+    def __init__(self):
+        self.requests = 0
+        self.transport_errors = 0
+        self.status_codes: Dict[int, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "transport_errors": self.transport_errors,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class RpcMetrics:
+    """
+    Process-wide request stats grouped by host, method, route template and proxy.
+    Latency is measured until response headers, body bytes are added when body is read.
+    """
+    __stats: Dict[Tuple[str, str, str, str], RouteStats] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def get_key(cls, request: httpx.Request, proxy_label: str) -> Tuple[str, str, str, str]:
+        return request.url.host, request.method, normalize_route(request.url.path), proxy_label
+
+    @classmethod
+    def get_route_stats(cls, key: Tuple[str, str, str, str]) -> RouteStats:
+        route_stats = cls.__stats.get(key)
+        if route_stats is None:
+            route_stats = RouteStats()
+            cls.__stats[key] = route_stats
+
+        return route_stats
+
+    @classmethod
+    def record_response(
+            cls,
+            key: Tuple[str, str, str, str],
+            status_code: int,
+            latency_ms: float,
+            bytes_sent: int
+    ):
+        with cls.__lock:
+            route_stats = cls.get_route_stats(key)
+            route_stats.requests += 1
+            route_stats.status_codes[status_code] = route_stats.status_codes.get(status_code, 0) + 1
+            route_stats.bytes_sent += bytes_sent
+            route_stats.latency.add(latency_ms)
+
+    @classmethod
+    def record_error(
+            cls,
+            key: Tuple[str, str, str, str],
+            latency_ms: float,
+            bytes_sent: int
+    ):
+        with cls.__lock:
+            route_stats = cls.get_route_stats(key)
+            route_stats.requests += 1
+            route_stats.transport_errors += 1
+            route_stats.bytes_sent += bytes_sent
+            route_stats.latency.add(latency_ms)
+
+    @classmethod
+    def record_bytes_received(cls, key: Tuple[str, str, str, str], bytes_received: int):
+        with cls.__lock:
+            cls.get_route_stats(key).bytes_received += bytes_received
+
+    @classmethod
+    def reset(cls):
+        with cls.__lock:
+            cls.__stats = {}
+
+    @classmethod
+    def get_summary(cls) -> List[dict]:
+        """
+        Gets stats of all routes, slowest by total time first
+        :return:
+        """
+        with cls.__lock:
+            items = [(key, route_stats.to_dict(), route_stats.latency.total_ms) for key, route_stats in cls.__stats.items()]
+
+        items.sort(key=lambda item: item[2], reverse=True)
+
+        return [
+            {
+                "host": host,
+                "method": method,
+                "route": route,
+                "proxy": proxy_label,
+                "total_ms": round(total_ms, 2),
+                **route_data
+            }
+            for (host, method, route, proxy_label), route_data, total_ms in items
+        ]
+
+    @classmethod
+    def get_hosts_summary(cls) -> Dict[str, dict]:
+        """
+        Gets stats aggregated by host
+        :return:
+        """
+        hosts = {}
+        for route_data in cls.get_summary():
+            host_data = hosts.setdefault(route_data["host"], {
+                "requests": 0, "transport_errors": 0, "failed_responses": 0, "total_ms": 0.0, "bytes_received": 0
+            })
+            host_data["requests"] += route_data["requests"]
+            host_data["transport_errors"] += route_data["transport_errors"]
+            host_data["failed_responses"] += sum(
+                count for code, count in route_data["status_codes"].items() if int(code) >= 400
+            )
+            host_data["total_ms"] = round(host_data["total_ms"] + route_data["total_ms"], 2)
+            host_data["bytes_received"] += route_data["bytes_received"]
+
+        return hosts
+
+    @classmethod
+    def dump_summary(cls, file_path: str):
+        data = {
+            "hosts": cls.get_hosts_summary(),
+            "routes": cls.get_summary(),
+        }
+        with open(file_path, "w") as file:
+            json.dump(data, file, indent=4)
+
+
+class MeteredByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, stream, key: Tuple[str, str, str, str]):
+        self.stream = stream
+        self.key = key
+        self.bytes_received = 0
+        self.is_recorded = False
+
+    def record(self):
+        if not self.is_recorded:
+            self.is_recorded = True
+            RpcMetrics.record_bytes_received(self.key, self.bytes_received)
+
+    def __iter__(self):
+        for chunk in self.stream:
+            self.bytes_received += len(chunk)
+            yield chunk
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            self.bytes_received += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.record()
+        self.stream.close()
+
+    async def aclose(self):
+        self.record()
+        await self.stream.aclose()
+
+
+class MetricsTransportBase:
+    def __init__(self, proxy_url: Union[str, None] = None):
+        self.proxy_label = get_proxy_label(proxy_url)
+
+    @staticmethod
+    def get_request_size(request: httpx.Request) -> int:
+        content_length = request.headers.get("content-length")
+        return int(content_length) if content_length else 0
+
+    def build_metered_response(self, response: httpx.Response, key: Tuple[str, str, str, str]) -> httpx.Response:
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers.raw,
+            stream=MeteredByteStream(response.stream, key),
+            extensions=response.extensions
+        )
+
+
+class MetricsTransport(MetricsTransportBase, httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, proxy_url: Union[str, None] = None):
+        super().__init__(proxy_url=proxy_url)
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = RpcMetrics.get_key(request, self.proxy_label)
+        bytes_sent = self.get_request_size(request)
+        started_at = time.perf_counter()
+
+        try:
+            response = self.transport.handle_request(request)
+
+        except httpx.TransportError:
+            RpcMetrics.record_error(key, (time.perf_counter() - started_at) * 1000, bytes_sent)
+            raise
+
+        RpcMetrics.record_response(key, response.status_code, (time.perf_counter() - started_at) * 1000, bytes_sent)
+
+        return self.build_metered_response(response, key)
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncMetricsTransport(MetricsTransportBase, httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, proxy_url: Union[str, None] = None):
+        super().__init__(proxy_url=proxy_url)
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = RpcMetrics.get_key(request, self.proxy_label)
+        bytes_sent = self.get_request_size(request)
+        started_at = time.perf_counter()
+
+        try:
+            response = await self.transport.handle_async_request(request)
+
+        except httpx.TransportError:
+            RpcMetrics.record_error(key, (time.perf_counter() - started_at) * 1000, bytes_sent)
+            raise
+
+        RpcMetrics.record_response(key, response.status_code, (time.perf_counter() - started_at) * 1000, bytes_sent)
+
+        return self.build_metered_response(response, key)
+
+    async def aclose(self):
+        await self.transport.aclose()
@@ -0,0 +1,236 @@
+import time
+import heapq
+import asyncio
+import itertools
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Tuple, Union
+
+import httpx
+from aptos_sdk.client import ApiError
+
+from .client import CustomRestClient
+from .rpc_pool import normalize_url
+from .rpc_pool import get_proxy_url
+from .rpc_pool import PREFERRED_NODE_EXTENSION
+from .json_codec import get_response_json
+
+
+class PendingReceipt:
+    def __init__(self, deadline: float, node_url: Union[str, None]):
+        self.future = Future()
+        # Running future can't be cancelled by a waiter, e.g. by cancelled asyncio task
+        self.future.set_running_or_notify_cancel()
+        self.deadline = deadline
+        self.node_url = node_url
+
+
+class ReceiptTracker:
+    """
+    Waits for committed transactions of all module instances using the same rpc and proxy.
+    Pending hashes are polled round-robin by worker threads, one /transactions/wait_by_hash
+    long-poll per turn, so every hash is polled while others wait for commit.
+    Hash is polled on the node its transaction was submitted to, other pool nodes are tried if it fails.
+    Waiters of the same hash share its result. Nodes without wait_by_hash are polled by_hash.
+    """
+    default_max_workers = 32
+    max_workers = default_max_workers
+    poll_interval_sec = 1
+
+    __trackers: Dict[Tuple[str, Union[str, None]], "ReceiptTracker"] = {}
+    __lock = threading.Lock()
+
+    def __init__(self, base_url: str, proxies: Union[dict, str, None] = None):
+        self.base_url = normalize_url(base_url)
+        self.client = CustomRestClient(base_url=self.base_url, proxies=proxies)
+
+        self.pending: Dict[str, PendingReceipt] = {}
+        # Heap of (poll at, order, hash), order keeps hashes of the same time in fifo order
+        self.queue: List[Tuple[float, int, str]] = []
+        self.order = itertools.count()
+        self.workers = 0
+
+        self.lock = threading.Lock()
+        self.condition = threading.Condition(self.lock)
+        self.is_wait_by_hash_supported = True
+
+    @classmethod
+    def configure(cls, concurrency: int):
+        """
+        Sizes worker threads by amount of tasks in flight, each of them may wait for a receipt
+        :param concurrency:
+        :return:
+        """
+        cls.max_workers = max(cls.default_max_workers, concurrency)
+
+    @classmethod
+    def get_tracker(cls, base_url: str, proxies: Union[dict, str, None] = None) -> "ReceiptTracker":
+        key = (normalize_url(base_url), get_proxy_url(proxies))
+
+        with cls.__lock:
+            tracker = cls.__trackers.get(key)
+            if tracker is None:
+                tracker = ReceiptTracker(base_url=base_url, proxies=proxies)
+                cls.__trackers[key] = tracker
+
+            return tracker
+
+    def track(self, txn_hash: str, timeout: float, node_url: str = None) -> Future:
+        """
+        Starts tracking of transaction or joins tracking in progress
+        :param txn_hash:
+        :param timeout:
+        :param node_url: node transaction was submitted to
+        :return: future of committed transaction data, None if it's not committed until timeout
+        """
+        deadline = time.monotonic() + timeout
+
+        with self.condition:
+            pending = self.pending.get(txn_hash)
+            if pending is not None:
+                pending.deadline = max(pending.deadline, deadline)
+                return pending.future
+
+            pending = PendingReceipt(deadline=deadline, node_url=node_url)
+            self.pending[txn_hash] = pending
+            self.schedule(txn_hash, time.monotonic())
+
+            if self.workers < min(self.max_workers, len(self.pending)):
+                self.workers += 1
+                threading.Thread(target=self.work, name="receipts", daemon=True).start()
+
+        return pending.future
+
+    def wait(self, txn_hash: str, timeout: float, node_url: str = None) -> Union[Dict[str, Any], None]:
+        """
+        Waits for committed transaction
+        :param txn_hash:
+        :param timeout:
+        :param node_url: node transaction was submitted to
+        :return: committed transaction data, None on timeout
+        """
+        future = self.track(txn_hash, timeout, node_url)
+        try:
+            return future.result(timeout=timeout)
+
+        except FutureTimeoutError:
+            return None
+
+    async def wait_async(self, txn_hash: str, timeout: float, node_url: str = None) -> Union[Dict[str, Any], None]:
+        future = self.track(txn_hash, timeout, node_url)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            return None
+
+    def schedule(self, txn_hash: str, poll_at: float):
+        # Called under lock
+        heapq.heappush(self.queue, (poll_at, next(self.order), txn_hash))
+        self.condition.notify()
+
+    def get_next_hash(self) -> Union[str, None]:
+        """
+        Waits for the next hash due to poll
+        :return: None if nothing is pending and worker has to stop
+        """
+        with self.condition:
+            while True:
+                if not self.queue:
+                    self.workers -= 1
+                    return None
+
+                poll_at, _, txn_hash = self.queue[0]
+                delay = poll_at - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(self.queue)
+                    return txn_hash
+
+                self.condition.wait(delay)
+
+    def work(self):
+        while True:
+            txn_hash = self.get_next_hash()
+            if txn_hash is None:
+                return
+
+            pending = self.pending[txn_hash]
+            try:
+                txn_data, poll_at = self.poll(txn_hash, pending.node_url)
+
+            except Exception as e:
+                self.resolve(txn_hash, pending, exception=e)
+                continue
+
+            if txn_data is not None or time.monotonic() >= pending.deadline:
+                self.resolve(txn_hash, pending, txn_data=txn_data)
+                continue
+
+            with self.condition:
+                self.schedule(txn_hash, poll_at)
+
+    def resolve(
+            self,
+            txn_hash: str,
+            pending: PendingReceipt,
+            txn_data: Union[Dict[str, Any], None] = None,
+            exception: Exception = None
+    ):
+        with self.condition:
+            if self.pending.get(txn_hash) is pending:
+                del self.pending[txn_hash]
+
+        if exception is not None:
+            pending.future.set_exception(exception)
+        else:
+            pending.future.set_result(txn_data)
+
+    @staticmethod
+    def is_transaction_not_found(response: httpx.Response) -> bool:
+        """
+        Tells not found transaction from not found route of node without wait_by_hash
+        :param response: 404 response
+        :return:
+        """
+        try:
+            return get_response_json(response).get("error_code") == "transaction_not_found"
+
+        except ValueError:
+            return False
+
+    def poll(self, txn_hash: str, node_url: str = None) -> Tuple[Union[Dict[str, Any], None], float]:
+        """
+        Gets transaction if it's committed, waits for commit up to node long-poll timeout
+        :param txn_hash:
+        :param node_url: node to ask first
+        :return: transaction data, None if it's pending or not known to node yet, and time of the next poll
+        """
+        extensions = {PREFERRED_NODE_EXTENSION: node_url} if node_url else None
+
+        if self.is_wait_by_hash_supported:
+            response = self.client.client.get(
+                f"{self.base_url}/transactions/wait_by_hash/{txn_hash}",
+                extensions=extensions
+            )
+
+            if response.status_code == 404 and not self.is_transaction_not_found(response):
+                self.is_wait_by_hash_supported = False
+                return None, time.monotonic()
+        else:
+            response = self.client.client.get(
+                f"{self.base_url}/transactions/by_hash/{txn_hash}",
+                extensions=extensions
+            )
+
+        if response.status_code >= 400 and response.status_code != 404:
+            raise ApiError(f"Error getting transaction due RPC error: {response.text}", response.status_code)
+
+        txn_data = get_response_json(response) if response.status_code != 404 else None
+        if txn_data is None or txn_data.get("type") == "pending_transaction":
+            # Long poll returns pending transaction after waiting, other responses come right away
+            if response.status_code == 404 or not self.is_wait_by_hash_supported:
+                return None, time.monotonic() + self.poll_interval_sec
+            return None, time.monotonic()
+
+        return txn_data, time.monotonic()
@@ -0,0 +1,216 @@
+import re
+import time
+import threading
+from typing import Any, Dict, Tuple, Type, Union
+
+import httpx
+from aptos_sdk.client import ApiError
+from aptos_sdk.client import ResourceNotFound
+
+from .rpc_pool import normalize_url
+from .json_codec import get_response_json
+from .bcs_resources import BcsResource
+from .bcs_resources import BCS_CONTENT_TYPE
+
+
+LEDGER_VERSION_HEADER = "x-aptos-ledger-version"
+
+
+def normalize_address(account_address) -> str:
+    # Node responses and AccountAddress use full-length hex, plain strings may be short
+    address = str(account_address).lower()
+    if address.startswith("0x"):
+        address = address[2:]
+
+    return "0x" + address.zfill(64)
+
+
+TYPE_TAG_ADDRESS_PATTERN = re.compile(r"0x([0-9a-fA-F]+)")
+
+
+def normalize_type_tag(type_tag: str) -> str:
+    """
+    Normalizes move type string, e.g. resource type, addresses are short without leading zeros
+    and generics are without spaces, so the same type of node response and of config matches
+    :param type_tag:
+    :return:
+    """
+    type_tag = "".join(str(type_tag).split())
+
+    return TYPE_TAG_ADDRESS_PATTERN.sub(
+        lambda match: "0x" + (match.group(1).lstrip("0").lower() or "0"),
+        type_tag
+    )
+
+
+class CachedResource:
+    def __init__(
+            self,
+            value: Union[dict, None],
+            ledger_version: int,
+            expires_at: Union[float, None]
+    ):
+        # None value means resource doesn't exist
+        self.value = value
+        self.ledger_version = ledger_version
+        self.expires_at = expires_at
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+class ResourceCache:
+    """
+    Process-wide read-through cache of account resources.
+    Entries live for a ttl picked by resource type, static resources are kept for the whole run.
+    Account entries are dropped on transaction submit, once a transaction is committed
+    entries read at older ledger versions are not accepted for the sender anymore,
+    so a lagging node can't put pre-transaction state back.
+    """
+    # (resource type prefix, ttl in seconds, None to keep for the whole run)
+    resource_ttls = (
+        ("0x1::coin::CoinInfo<", None),
+        ("0x1::coin::CoinStore<", 5),
+    )
+    default_ttl = 2
+    not_found_ttl = 5
+
+    def __init__(self):
+        self.__entries: Dict[Tuple[str, str, str], CachedResource] = {}
+        self.__accounts_min_versions: Dict[Tuple[str, str], int] = {}
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_ttl(self, resource_type: str) -> Union[int, None]:
+        for prefix, ttl in self.resource_ttls:
+            if resource_type.startswith(prefix):
+                return ttl
+
+        return self.default_ttl
+
+    @staticmethod
+    def get_key(base_url: str, account_address, resource_type: str) -> Tuple[str, str, str]:
+        return normalize_url(base_url), normalize_address(account_address), normalize_type_tag(resource_type)
+
+    def get(self, base_url: str, account_address, resource_type: str) -> Union[CachedResource, None]:
+        key = self.get_key(base_url, account_address, resource_type)
+
+        with self.lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry.is_expired:
+                del self.__entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            return entry
+
+    def put(
+            self,
+            base_url: str,
+            account_address,
+            resource_type: str,
+            value: Union[dict, None],
+            ledger_version: int
+    ):
+        key = self.get_key(base_url, account_address, resource_type)
+        ttl = self.get_ttl(key[2]) if value is not None else self.not_found_ttl
+        if ttl == 0:
+            return
+
+        with self.lock:
+            min_version = self.__accounts_min_versions.get(key[:2], 0)
+            if ledger_version < min_version:
+                return
+
+            self.__entries[key] = CachedResource(
+                value=value,
+                ledger_version=ledger_version,
+                expires_at=time.monotonic() + ttl if ttl is not None else None
+            )
+
+    def invalidate_account(
+            self,
+            base_url: str,
+            account_address,
+            ledger_version: Union[int, None] = None
+    ):
+        """
+        Drops cached resources of account
+        :param base_url:
+        :param account_address:
+        :param ledger_version: version of committed account transaction, older reads are not cached after
+        :return:
+        """
+        account_key = (normalize_url(base_url), normalize_address(account_address))
+
+        with self.lock:
+            for key in [key for key in self.__entries if key[:2] == account_key]:
+                del self.__entries[key]
+
+            if ledger_version is not None:
+                current = self.__accounts_min_versions.get(account_key, 0)
+                self.__accounts_min_versions[account_key] = max(current, int(ledger_version))
+
+    def clear(self):
+        with self.lock:
+            self.__entries = {}
+            self.__accounts_min_versions = {}
+
+    def get_value_from_response(
+            self,
+            base_url: str,
+            account_address,
+            resource_type: str,
+            response: httpx.Response,
+            not_found_error: Type[Exception] = ResourceNotFound,
+            api_error: Type[Exception] = ApiError,
+            bcs_struct: Type[BcsResource] = None
+    ) -> Dict[str, Any]:
+        """
+        Caches account resource response, same errors as in SDK client are raised
+        :param base_url:
+        :param account_address:
+        :param resource_type:
+        :param response:
+        :param not_found_error: ResourceNotFound class of client SDK module
+        :param api_error: ApiError class of client SDK module
+        :param bcs_struct: struct of BCS response, json is parsed if node didn't answer with BCS
+        :return: resource data
+        """
+        ledger_version = int(response.headers.get(LEDGER_VERSION_HEADER, 0))
+
+        if response.status_code == 404:
+            self.put(base_url, account_address, resource_type, None, ledger_version)
+            raise not_found_error(resource_type, resource_type)
+
+        if response.status_code >= 400:
+            raise api_error(f"{response.text} - {account_address}", response.status_code)
+
+        if bcs_struct is not None and response.headers.get("content-type", "").startswith(BCS_CONTENT_TYPE):
+            value = bcs_struct.from_bytes(response.content).to_resource(resource_type)
+        else:
+            value = get_response_json(response)
+        self.put(base_url, account_address, resource_type, value, ledger_version)
+
+        return value
+
+    @staticmethod
+    def get_value_from_entry(
+            entry: CachedResource,
+            resource_type: str,
+            not_found_error: Type[Exception] = ResourceNotFound
+    ) -> Dict[str, Any]:
+        if entry.value is None:
+            raise not_found_error(resource_type, resource_type)
+
+        return entry.value
+
+
+resource_cache = ResourceCache()
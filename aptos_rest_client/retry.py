@@ -0,0 +1,251 @@
+import time
+import random
+import asyncio
+from enum import Enum
+from email.utils import parsedate_to_datetime
+from typing import Union
+
+import httpx
+
+from .rpc_pool import CircuitOpenError
+
+
+class RpcErrorKind(str, Enum):
+    RATE_LIMITED = "rate_limited"
+    SERVER_ERROR = "server_error"
+    TIMEOUT = "timeout"
+    CONNECTION = "connection"
+    NETWORK = "network"
+    NOT_FOUND = "not_found"
+    CLIENT_ERROR = "client_error"
+    CIRCUIT_OPEN = "circuit_open"
+
+
+def classify_response(response: httpx.Response) -> Union[RpcErrorKind, None]:
+    """
+    Gets error kind of response
+    :param response:
+    :return: None for successful response
+    """
+    if response.status_code == 429:
+        return RpcErrorKind.RATE_LIMITED
+
+    if response.status_code >= 500:
+        return RpcErrorKind.SERVER_ERROR
+
+    if response.status_code == 404:
+        return RpcErrorKind.NOT_FOUND
+
+    if response.status_code >= 400:
+        return RpcErrorKind.CLIENT_ERROR
+
+    return None
+
+
+def classify_exception(error: Exception) -> Union[RpcErrorKind, None]:
+    if isinstance(error, CircuitOpenError):
+        return RpcErrorKind.CIRCUIT_OPEN
+
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return RpcErrorKind.CONNECTION
+
+    if isinstance(error, httpx.TimeoutException):
+        return RpcErrorKind.TIMEOUT
+
+    if isinstance(error, httpx.TransportError):
+        return RpcErrorKind.NETWORK
+
+    return None
+
+
+def get_retry_after(response: httpx.Response) -> Union[float, None]:
+    """
+    Gets Retry-After header value in seconds, both delay and http date forms are supported
+    :param response:
+    :return:
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Retries failed reads with jittered exponential backoff.
+    Submissions are retried only when the node didn't take them: on rate limit, connection errors
+    and open circuit.
+    """
+
+    retryable_kinds = (
+        RpcErrorKind.RATE_LIMITED,
+        RpcErrorKind.SERVER_ERROR,
+        RpcErrorKind.TIMEOUT,
+        RpcErrorKind.CONNECTION,
+        RpcErrorKind.NETWORK,
+        RpcErrorKind.CIRCUIT_OPEN,
+    )
+    submission_retryable_kinds = (
+        RpcErrorKind.RATE_LIMITED,
+        RpcErrorKind.CONNECTION,
+        RpcErrorKind.CIRCUIT_OPEN,
+    )
+
+    def __init__(
+            self,
+            max_retries: int = 3,
+            base_delay_sec: float = 0.5,
+            max_delay_sec: float = 10,
+            max_retry_after_sec: float = 30
+    ):
+        self.max_retries = max_retries
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.max_retry_after_sec = max_retry_after_sec
+
+    def is_retryable(self, kind: Union[RpcErrorKind, None], is_submission: bool) -> bool:
+        if kind is None:
+            return False
+
+        if is_submission:
+            return kind in self.submission_retryable_kinds
+
+        return kind in self.retryable_kinds
+
+    def get_delay(self, attempt: int, retry_after: Union[float, None] = None) -> Union[float, None]:
+        """
+        Gets delay before next attempt, full jitter is used so waiting clients don't retry at once
+        :param attempt: index of failed attempt, starting from 0
+        :param retry_after: delay requested by node
+        :return: None if requested delay is too long to wait
+        """
+        delay = random.uniform(0, min(self.max_delay_sec, self.base_delay_sec * 2 ** attempt))
+
+        if retry_after is not None:
+            if retry_after > self.max_retry_after_sec:
+                return None
+            delay = max(delay, retry_after)
+
+        return delay
+
+
+default_retry_policy = RetryPolicy()
+
+
+class RetryTransportBase:
+    submission_paths = ("/transactions", "/transactions/batch")
+
+    def __init__(self, policy: RetryPolicy = None):
+        self.policy = policy or default_retry_policy
+
+    def is_submission(self, request: httpx.Request) -> bool:
+        return request.method == "POST" and request.url.path.endswith(self.submission_paths)
+
+    def get_response_delay(self, response: httpx.Response, attempt: int, is_submission: bool) -> Union[float, None]:
+        """
+        Gets delay before retry of response
+        :param response:
+        :param attempt:
+        :param is_submission:
+        :return: None if response is returned to client
+        """
+        if attempt >= self.policy.max_retries:
+            return None
+
+        if not self.policy.is_retryable(classify_response(response), is_submission):
+            return None
+
+        return self.policy.get_delay(attempt, retry_after=get_retry_after(response))
+
+    def get_error_delay(self, error: Exception, attempt: int, is_submission: bool) -> Union[float, None]:
+        """
+        Gets delay before retry of transport error
+        :param error:
+        :param attempt:
+        :param is_submission:
+        :return: None if error is raised to client
+        """
+        if attempt >= self.policy.max_retries:
+            return None
+
+        if not self.policy.is_retryable(classify_exception(error), is_submission):
+            return None
+
+        retry_after = error.retry_after if isinstance(error, CircuitOpenError) else None
+
+        return self.policy.get_delay(attempt, retry_after=retry_after)
+
+
+class RetryTransport(RetryTransportBase, httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy = None):
+        super().__init__(policy=policy)
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        is_submission = self.is_submission(request)
+
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+
+            except httpx.TransportError as e:
+                delay = self.get_error_delay(e, attempt, is_submission)
+                if delay is None:
+                    raise
+
+            else:
+                delay = self.get_response_delay(response, attempt, is_submission)
+                if delay is None:
+                    return response
+
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncRetryTransport(RetryTransportBase, httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy = None):
+        super().__init__(policy=policy)
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        is_submission = self.is_submission(request)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+
+            except httpx.TransportError as e:
+                delay = self.get_error_delay(e, attempt, is_submission)
+                if delay is None:
+                    raise
+
+            else:
+                delay = self.get_response_delay(response, attempt, is_submission)
+                if delay is None:
+                    return response
+
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self):
+        await self.transport.aclose()
@@ -0,0 +1,381 @@
+import time
+import threading
+from typing import Dict, List, Union
+
+import httpx
+
+
+# Request extension with url of the node to send request to first, e.g. the node transaction was submitted to
+PREFERRED_NODE_EXTENSION = "preferred_rpc_node"
+
+def normalize_url(url: str) -> str:
+    return url.strip().rstrip("/")
+
+
+def get_proxy_url(proxies: Union[dict, str, None]) -> Union[str, None]:
+    """
+    Gets single proxy url from httpx proxies mapping
+    :param proxies:
+    :return:
+    """
+    if not proxies:
+        return None
+
+    if isinstance(proxies, str):
+        return proxies
+
+    return proxies.get("https://") or proxies.get("http://") or next(iter(proxies.values()))
+
+
+class CircuitOpenError(httpx.TransportError):
+    """
+    Raised without sending request when circuits of all pool nodes are open
+    """
+
+    def __init__(self, message: str, retry_after: float, request: httpx.Request = None):
+        super().__init__(message, request=request)
+        self.retry_after = retry_after
+
+
+class RpcNode:
+    def __init__(self, url: str):
+        self.url = normalize_url(url)
+
+        self.ewma_latency: Union[float, None] = None
+        self.failures = 0
+        self.unhealthy_until = 0.0
+
+    @property
+    def is_healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def is_circuit_open(self, failures_threshold: int) -> bool:
+        """
+        Node with too many failures in a row gets no requests until cooldown ends,
+        then one request is let through as a probe
+        :param failures_threshold:
+        :return:
+        """
+        return self.failures >= failures_threshold and not self.is_healthy
+
+    def __repr__(self):
+        return f"RpcNode({self.url}, latency={self.ewma_latency}, failures={self.failures})"
+
+
+class RpcPool:
+    """
+    Pool of RPC nodes serving the same network. Nodes are ranked by EWMA latency,
+    failed nodes are put on a growing cooldown until they answer again.
+    Circuit of a node opens after several failures in a row, node is skipped during its cooldown.
+    """
+    ewma_alpha = 0.3
+    base_cooldown_sec = 5
+    max_cooldown_sec = 60
+    circuit_failures_threshold = 3
+
+    __pools: Dict[str, "RpcPool"] = {}
+    __pools_lock = threading.Lock()
+
+    def __init__(self, urls: List[str]):
+        self.nodes = [RpcNode(url) for url in urls]
+        self.lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        return [node.url for node in self.nodes]
+
+    @classmethod
+    def configure(cls, base_url: str, urls: List[str]):
+        """
+        Sets nodes used for requests to base url, stats of known nodes are kept
+        :param base_url: rpc url modules are created with
+        :param urls: all rpc urls of the pool
+        :return:
+        """
+        base_url = normalize_url(base_url)
+        urls = [normalize_url(url) for url in urls if url]
+        if base_url not in urls:
+            urls.insert(0, base_url)
+
+        with cls.__pools_lock:
+            pool = cls.__pools.get(base_url)
+            if pool is not None and pool.urls == urls:
+                return
+
+            new_pool = RpcPool(urls)
+            if pool is not None:
+                known_nodes = {node.url: node for node in pool.nodes}
+                new_pool.nodes = [known_nodes.get(node.url, node) for node in new_pool.nodes]
+
+            cls.__pools[base_url] = new_pool
+
+    @classmethod
+    def get_pool(cls, base_url: str) -> "RpcPool":
+        base_url = normalize_url(base_url)
+
+        with cls.__pools_lock:
+            pool = cls.__pools.get(base_url)
+            if pool is None:
+                pool = RpcPool([base_url])
+                cls.__pools[base_url] = pool
+
+            return pool
+
+    def get_ranked_nodes(self) -> List[RpcNode]:
+        """
+        Gets nodes from best to worst, healthy nodes go first by latency,
+        nodes without stats are tried before slow ones
+        :return:
+        """
+        with self.lock:
+            healthy = [node for node in self.nodes if node.is_healthy]
+            unhealthy = [node for node in self.nodes if not node.is_healthy]
+
+            healthy.sort(key=lambda node: node.ewma_latency or 0.0)
+            unhealthy.sort(key=lambda node: node.unhealthy_until)
+
+            return healthy + unhealthy
+
+    def report_success(self, node: RpcNode, latency: Union[float, None]):
+        with self.lock:
+            if latency is not None and node.ewma_latency is None:
+                node.ewma_latency = latency
+            elif latency is not None:
+                node.ewma_latency = self.ewma_alpha * latency + (1 - self.ewma_alpha) * node.ewma_latency
+
+            node.failures = 0
+            node.unhealthy_until = 0.0
+
+    def get_available_nodes(self) -> List[RpcNode]:
+        """
+        Gets ranked nodes with closed circuit
+        :return:
+        """
+        return [
+            node for node in self.get_ranked_nodes()
+            if not node.is_circuit_open(self.circuit_failures_threshold)
+        ]
+
+    def get_circuit_retry_after(self) -> float:
+        """
+        Gets time left until the first node circuit lets a probe request through
+        :return:
+        """
+        with self.lock:
+            unhealthy_until = min(node.unhealthy_until for node in self.nodes)
+
+        return max(unhealthy_until - time.monotonic(), 0.0)
+
+    def report_failure(self, node: RpcNode):
+        with self.lock:
+            node.failures += 1
+            cooldown = min(
+                self.base_cooldown_sec * 2 ** (node.failures - 1),
+                self.max_cooldown_sec
+            )
+            node.unhealthy_until = time.monotonic() + cooldown
+
+
+class RoutingTransportBase:
+    """
+    Routes requests sent to base url to the best node of the pool.
+    Client sticks to the node of its last successful response, so simulation,
+    submission and receipt of a wallet transaction are served by one node while it's healthy.
+    Requests to other hosts are passed as is.
+    """
+    submission_paths = ("/transactions", "/transactions/batch")
+    # Node holds these requests until timeout, their latency doesn't rank the node
+    long_poll_paths = ("/transactions/wait_by_hash/",)
+
+    def __init__(
+            self,
+            base_url: str,
+            pool: RpcPool
+    ):
+        self.base_url = normalize_url(base_url)
+        self.pool = pool
+        self.sticky_node: Union[RpcNode, None] = None
+
+    @property
+    def sticky_node_url(self) -> str:
+        sticky_node = self.sticky_node
+        return sticky_node.url if sticky_node is not None else self.base_url
+
+    def stick_to(self, node_url: str):
+        """
+        Sticks client to node, e.g. to the node its transaction was submitted to by another client
+        :param node_url:
+        :return:
+        """
+        node_url = normalize_url(node_url)
+        for node in self.pool.nodes:
+            if node.url == node_url:
+                self.sticky_node = node
+                return
+
+    def is_routed(self, request: httpx.Request) -> bool:
+        return str(request.url).startswith(self.base_url)
+
+    def is_submission(self, request: httpx.Request) -> bool:
+        return request.method == "POST" and request.url.path.endswith(self.submission_paths)
+
+    def get_latency(self, request: httpx.Request, started_at: float) -> Union[float, None]:
+        if any(path in request.url.path for path in self.long_poll_paths):
+            return None
+
+        return time.monotonic() - started_at
+
+    @staticmethod
+    def is_failed_response(response: httpx.Response) -> bool:
+        return response.status_code == 429 or response.status_code >= 500
+
+    def get_nodes_to_try(self, request: httpx.Request) -> List[RpcNode]:
+        nodes = self.pool.get_available_nodes()
+        if not nodes:
+            raise CircuitOpenError(
+                f"Circuits of all nodes are open for {self.base_url}",
+                retry_after=self.pool.get_circuit_retry_after(),
+                request=request
+            )
+
+        first_node = self.sticky_node
+        preferred_url = request.extensions.get(PREFERRED_NODE_EXTENSION)
+        if preferred_url:
+            first_node = next((node for node in nodes if node.url == normalize_url(preferred_url)), first_node)
+
+        if first_node is not None and first_node.is_healthy and first_node in nodes:
+            nodes.remove(first_node)
+            nodes.insert(0, first_node)
+
+        return nodes
+
+    def build_node_request(self, request: httpx.Request, node: RpcNode) -> httpx.Request:
+        if node.url == self.base_url:
+            return request
+
+        url = node.url + str(request.url)[len(self.base_url):]
+        headers = [(key, value) for key, value in request.headers.raw if key.lower() != b"host"]
+
+        return httpx.Request(
+            method=request.method,
+            url=url,
+            headers=headers,
+            content=request.content,
+            extensions=request.extensions
+        )
+
+
+class RoutingTransport(RoutingTransportBase, httpx.BaseTransport):
+    def __init__(
+            self,
+            base_url: str,
+            pool: RpcPool,
+            transport: httpx.BaseTransport
+    ):
+        super().__init__(base_url=base_url, pool=pool)
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.is_routed(request):
+            return self.transport.handle_request(request)
+
+        request.read()
+        is_submission = self.is_submission(request)
+        nodes = self.get_nodes_to_try(request)
+
+        last_error = None
+        for node_index, node in enumerate(nodes):
+            is_last_node = node_index == len(nodes) - 1
+            started_at = time.monotonic()
+
+            try:
+                response = self.transport.handle_request(self.build_node_request(request, node))
+
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Request didn't reach the node, safe to resend anywhere
+                self.pool.report_failure(node)
+                last_error = e
+                continue
+
+            except httpx.TransportError as e:
+                self.pool.report_failure(node)
+                if is_submission:
+                    raise
+                last_error = e
+                continue
+
+            if self.is_failed_response(response):
+                self.pool.report_failure(node)
+                if not is_submission and not is_last_node:
+                    response.close()
+                    continue
+
+            else:
+                self.pool.report_success(node, self.get_latency(request, started_at))
+                self.sticky_node = node
+
+            return response
+
+        raise last_error
+
+    def close(self):
+        # Inner transport may be shared with other clients, its owner closes it
+        pass
+
+
+class AsyncRoutingTransport(RoutingTransportBase, httpx.AsyncBaseTransport):
+    def __init__(
+            self,
+            base_url: str,
+            pool: RpcPool,
+            transport: httpx.AsyncBaseTransport
+    ):
+        super().__init__(base_url=base_url, pool=pool)
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.is_routed(request):
+            return await self.transport.handle_async_request(request)
+
+        await request.aread()
+        is_submission = self.is_submission(request)
+        nodes = self.get_nodes_to_try(request)
+
+        last_error = None
+        for node_index, node in enumerate(nodes):
+            is_last_node = node_index == len(nodes) - 1
+            started_at = time.monotonic()
+
+            try:
+                response = await self.transport.handle_async_request(self.build_node_request(request, node))
+
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Request didn't reach the node, safe to resend anywhere
+                self.pool.report_failure(node)
+                last_error = e
+                continue
+
+            except httpx.TransportError as e:
+                self.pool.report_failure(node)
+                if is_submission:
+                    raise
+                last_error = e
+                continue
+
+            if self.is_failed_response(response):
+                self.pool.report_failure(node)
+                if not is_submission and not is_last_node:
+                    await response.aclose()
+                    continue
+
+            else:
+                self.pool.report_success(node, self.get_latency(request, started_at))
+                self.sticky_node = node
+
+            return response
+
+        raise last_error
+
+    async def aclose(self):
+        # Inner transport may be shared with other clients, its owner closes it
+        pass
@@ -0,0 +1,128 @@
+import threading
+from typing import Dict, Tuple, Union
+
+from .rpc_pool import normalize_url
+from .resource_cache import normalize_address
+
+
+SEQUENCE_NUMBER_ERRORS = ("SEQUENCE_NUMBER_TOO_OLD", "SEQUENCE_NUMBER_TOO_NEW")
+
+
+def is_sequence_number_error(message) -> bool:
+    """
+    Checks if node rejected transaction by its sequence number, vm status and api error text are accepted
+    :param message:
+    :return:
+    """
+    message = str(message).upper()
+    return any(error in message for error in SEQUENCE_NUMBER_ERRORS)
+
+
+class AccountSequence:
+    def __init__(self):
+        # None until fetched from node or after resync
+        self.next_sequence_number: Union[int, None] = None
+        # Node transactions of account were last submitted to, numbers are fetched from it
+        self.node_url: Union[str, None] = None
+        self.lock = threading.Lock()
+
+
+class SequenceNumbers:
+    """
+    Process-wide local sequence numbers of accounts.
+    Sequence number is fetched from node once and then allocated locally,
+    so transactions of the same account can be submitted back-to-back without waiting for commit.
+    Node rejection by sequence number drops local state and it is fetched again.
+    Numbers are counted per rpc pool and account, every node of the pool gets transactions
+    of the same counter. Number is fetched from the node account last submitted to,
+    other nodes of the pool may lag behind it and return a stale one.
+    """
+    __accounts: Dict[Tuple[str, str], AccountSequence] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def get_account(cls, base_url: str, account_address) -> AccountSequence:
+        key = (normalize_url(base_url), normalize_address(account_address))
+
+        with cls.__lock:
+            account = cls.__accounts.get(key)
+            if account is None:
+                account = AccountSequence()
+                cls.__accounts[key] = account
+
+            return account
+
+    @classmethod
+    def get_next(cls, base_url: str, account_address, allocate: bool = False) -> Union[int, None]:
+        """
+        Gets next sequence number of account
+        :param base_url:
+        :param account_address:
+        :param allocate: True to take the number for a transaction to be submitted
+        :return: None if number has to be fetched from node
+        """
+        account = cls.get_account(base_url, account_address)
+
+        with account.lock:
+            sequence_number = account.next_sequence_number
+            if sequence_number is not None and allocate:
+                account.next_sequence_number += 1
+
+            return sequence_number
+
+    @classmethod
+    def set_fetched(cls, base_url: str, account_address, sequence_number: int):
+        """
+        Sets sequence number fetched from node, numbers allocated meanwhile are kept
+        :param base_url:
+        :param account_address:
+        :param sequence_number:
+        :return:
+        """
+        account = cls.get_account(base_url, account_address)
+
+        with account.lock:
+            if account.next_sequence_number is None:
+                account.next_sequence_number = int(sequence_number)
+
+    @classmethod
+    def release(cls, base_url: str, account_address, sequence_number: int):
+        """
+        Returns allocated number of transaction that didn't reach node
+        :param base_url:
+        :param account_address:
+        :param sequence_number:
+        :return:
+        """
+        account = cls.get_account(base_url, account_address)
+
+        with account.lock:
+            if account.next_sequence_number == sequence_number + 1:
+                account.next_sequence_number = sequence_number
+            else:
+                # Later numbers are allocated already, gap would hold them in mempool
+                account.next_sequence_number = None
+
+    @classmethod
+    def resync(cls, base_url: str, account_address):
+        account = cls.get_account(base_url, account_address)
+
+        with account.lock:
+            account.next_sequence_number = None
+
+    @classmethod
+    def get_node_url(cls, base_url: str, account_address) -> Union[str, None]:
+        """
+        Gets node transactions of account were last submitted to
+        :param base_url:
+        :param account_address:
+        :return: None if account didn't submit transactions yet
+        """
+        return cls.get_account(base_url, account_address).node_url
+
+    @classmethod
+    def set_node_url(cls, base_url: str, account_address, node_url: str):
+        account = cls.get_account(base_url, account_address)
+
+        with account.lock:
+            account.node_url = node_url
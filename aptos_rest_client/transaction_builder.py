@@ -0,0 +1,82 @@
+import time
+from typing import Union
+
+from aptos_sdk.account import Account
+from aptos_sdk.authenticator import Authenticator
+from aptos_sdk.authenticator import Ed25519Authenticator
+from aptos_sdk.transactions import EntryFunction
+from aptos_sdk.transactions import RawTransaction
+from aptos_sdk.transactions import SignedTransaction
+from aptos_sdk.transactions import TransactionPayload
+
+
+class TransactionBuilder:
+    """
+    One transaction of account from simulation to submission.
+    Gas settings belong to the transaction, raw transaction is built once
+    and rebuilt only when gas limit or sequence number is changed.
+    """
+    default_expiration_sec = 600
+
+    def __init__(
+            self,
+            account: Account,
+            payload: EntryFunction,
+            gas_limit: int,
+            gas_price: int,
+            sequence_number: int,
+            chain_id: int,
+            expiration_sec: int = None
+    ):
+        self.account = account
+        self.payload = TransactionPayload(payload)
+        self.gas_limit = int(gas_limit)
+        self.gas_price = int(gas_price)
+        self.sequence_number = sequence_number
+        self.chain_id = chain_id
+        self.expiration_timestamp_secs = int(time.time()) + (expiration_sec or self.default_expiration_sec)
+
+        self.simulation_result = None
+        self.__raw_transaction: Union[RawTransaction, None] = None
+
+    @property
+    def raw_transaction(self) -> RawTransaction:
+        if self.__raw_transaction is None:
+            self.__raw_transaction = self.get_raw_transaction()
+
+        return self.__raw_transaction
+
+    def get_raw_transaction(self, sequence_number: int = None) -> RawTransaction:
+        """
+        Builds raw transaction
+        :param sequence_number: allocated number if not set, other one is used to simulate at on-chain state
+        :return:
+        """
+        return RawTransaction(
+            sender=self.account.address(),
+            sequence_number=self.sequence_number if sequence_number is None else sequence_number,
+            payload=self.payload,
+            max_gas_amount=self.gas_limit,
+            gas_unit_price=self.gas_price,
+            expiration_timestamps_secs=self.expiration_timestamp_secs,
+            chain_id=self.chain_id
+        )
+
+    def set_gas_limit(self, gas_limit: int):
+        if int(gas_limit) != self.gas_limit:
+            self.gas_limit = int(gas_limit)
+            self.__raw_transaction = None
+
+    def set_sequence_number(self, sequence_number: int):
+        if sequence_number != self.sequence_number:
+            self.sequence_number = sequence_number
+            self.__raw_transaction = None
+
+    def sign(self) -> SignedTransaction:
+        raw_transaction = self.raw_transaction
+        signature = self.account.sign(raw_transaction.keyed())
+
+        return SignedTransaction(
+            raw_transaction,
+            Authenticator(Ed25519Authenticator(self.account.public_key(), signature))
+        )
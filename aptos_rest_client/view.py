@@ -0,0 +1,192 @@
+import json
+import time
+import threading
+from typing import Any, Dict, List, Tuple, Type, Union
+
+import httpx
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.client import ApiError
+
+from .rpc_pool import normalize_url
+from .resource_cache import normalize_address
+from .json_codec import get_response_json
+
+
+class ViewArgument:
+    """
+    View function argument of explicit move type.
+    Node reads u64 and wider integers from json strings, u8 - u32 from json numbers
+    and vector<u8> from hex string.
+    """
+    string_int_types = ("u64", "u128", "u256")
+    number_int_types = ("u8", "u16", "u32")
+
+    def __init__(self, value: Any, move_type: str):
+        self.value = value
+        self.move_type = move_type
+
+    def encode(self) -> Any:
+        if self.move_type == "address":
+            return normalize_address(self.value)
+
+        if self.move_type in self.string_int_types:
+            return str(int(self.value))
+
+        if self.move_type in self.number_int_types:
+            return int(self.value)
+
+        if self.move_type == "bool":
+            return bool(self.value)
+
+        if self.move_type == "vector<u8>" and isinstance(self.value, (bytes, bytearray)):
+            return f"0x{bytes(self.value).hex()}"
+
+        return self.value
+
+
+def encode_view_argument(argument: Any) -> Any:
+    """
+    Encodes argument, plain int is taken for u64 and AccountAddress for address
+    :param argument: ViewArgument or python value
+    :return:
+    """
+    if isinstance(argument, ViewArgument):
+        return argument.encode()
+
+    if isinstance(argument, AccountAddress):
+        return normalize_address(argument)
+
+    if isinstance(argument, bool):
+        return argument
+
+    if isinstance(argument, int):
+        return str(argument)
+
+    if isinstance(argument, (bytes, bytearray)):
+        return f"0x{bytes(argument).hex()}"
+
+    if isinstance(argument, (list, tuple)):
+        return [encode_view_argument(item) for item in argument]
+
+    return argument
+
+
+class ViewCall:
+    def __init__(
+            self,
+            function: str,
+            type_arguments: List[Any] = None,
+            arguments: List[Any] = None
+    ):
+        self.function = function
+        self.type_arguments = [str(type_argument) for type_argument in type_arguments or []]
+        self.arguments = [encode_view_argument(argument) for argument in arguments or []]
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "function": self.function,
+            "type_arguments": self.type_arguments,
+            "arguments": self.arguments,
+        }
+
+    def get_key(self) -> Tuple[str, ...]:
+        return "view", self.function, json.dumps(self.type_arguments), json.dumps(self.arguments)
+
+
+def is_table_item_not_found(error: Exception) -> bool:
+    """
+    Checks if node answered that table has no item by key, other errors are not a missing value
+    :param error: api error of sync or async client
+    :return:
+    """
+    return getattr(error, "status_code", None) == 404 and "table_item_not_found" in str(error)
+
+
+def get_table_item_key(handle: str, key_type: str, value_type: str, key: Any) -> Tuple[str, ...]:
+    return "table_item", normalize_address(handle), key_type, value_type, json.dumps(key, sort_keys=True)
+
+
+class CachedView:
+    def __init__(self, value: Any, expires_at: float):
+        self.value = value
+        self.expires_at = expires_at
+
+    @property
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+class ViewCache:
+    """
+    Process-wide cache of view function results and table items by (function, arguments).
+    Entries with address of account in arguments are dropped with its cached resources.
+    """
+    default_ttl = 5
+
+    def __init__(self):
+        self.__entries: Dict[Tuple[str, Tuple[str, ...]], CachedView] = {}
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, base_url: str, key: Tuple[str, ...]) -> Union[CachedView, None]:
+        cache_key = (normalize_url(base_url), key)
+
+        with self.lock:
+            entry = self.__entries.get(cache_key)
+            if entry is not None and entry.is_expired:
+                del self.__entries[cache_key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            return entry
+
+    def put(self, base_url: str, key: Tuple[str, ...], value: Any, ttl: Union[float, None] = None):
+        """
+        Puts result to cache
+        :param base_url:
+        :param key:
+        :param value:
+        :param ttl: default ttl if not set, 0 to not cache
+        :return:
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self.lock:
+            self.__entries[(normalize_url(base_url), key)] = CachedView(
+                value=value,
+                expires_at=time.monotonic() + ttl
+            )
+
+    def invalidate_account(self, base_url: str, account_address):
+        base_url = normalize_url(base_url)
+        address = normalize_address(account_address)
+
+        with self.lock:
+            for cache_key in list(self.__entries.keys()):
+                if cache_key[0] == base_url and any(address in part for part in cache_key[1][1:]):
+                    del self.__entries[cache_key]
+
+    def clear(self):
+        with self.lock:
+            self.__entries = {}
+
+    @staticmethod
+    def get_value_from_response(
+            response: httpx.Response,
+            api_error: Type[Exception] = ApiError
+    ) -> Any:
+        if response.status_code >= 400:
+            raise api_error(response.text, response.status_code)
+
+        return get_response_json(response)
+
+
+view_cache = ViewCache()
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Type, Union
+
+import httpx
+from aptos_sdk.client import ApiError
+
+from .resource_cache import resource_cache
+from .resource_cache import normalize_address
+from .resource_cache import normalize_type_tag
+from .resource_cache import LEDGER_VERSION_HEADER
+from .json_codec import get_response_json
+
+
+CURSOR_HEADER = "x-aptos-cursor"
+RESOURCES_PAGE_LIMIT = 1000
+
+COIN_STORE_PREFIX = "0x1::coin::CoinStore<"
+
+
+class WalletSnapshot:
+    """
+    All account resources read at one ledger version.
+    Every CoinStore of the account is in the snapshot, so a coin without CoinStore is not registered.
+    """
+
+    def __init__(
+            self,
+            account_address,
+            resources: List[Dict[str, Any]],
+            ledger_version: int
+    ):
+        self.account_address = normalize_address(account_address)
+        self.ledger_version = ledger_version
+        # Keyed by normalized type, type strings of callers may differ in address or spacing format
+        self.resources: Dict[str, dict] = {normalize_type_tag(resource["type"]): resource for resource in resources}
+
+    @property
+    def coin_balances(self) -> Dict[str, int]:
+        """
+        Gets balances of all registered coins
+        :return: {coin contract address: balance wei}
+        """
+        return {
+            resource_type[len(COIN_STORE_PREFIX):-1]: int(resource["data"]["coin"]["value"])
+            for resource_type, resource in self.resources.items()
+            if resource_type.startswith(COIN_STORE_PREFIX)
+        }
+
+    def get_resource(self, resource_type: str) -> Union[dict, None]:
+        return self.resources.get(normalize_type_tag(resource_type))
+
+    def is_coin_registered(self, token_contract: str) -> bool:
+        return self.get_resource(f"{COIN_STORE_PREFIX}{token_contract}>") is not None
+
+    def get_coin_balance(self, token_contract: str) -> int:
+        """
+        Gets coin balance, 0 if coin is not registered
+        :param token_contract:
+        :return:
+        """
+        resource = self.get_resource(f"{COIN_STORE_PREFIX}{token_contract}>")
+        if resource is None:
+            return 0
+
+        return int(resource["data"]["coin"]["value"])
+
+    def seed_resource_cache(self, base_url: str):
+        """
+        Puts snapshot resources to resource cache, so following account_resource calls are not sent
+        :param base_url:
+        :return:
+        """
+        for resource_type, resource in self.resources.items():
+            resource_cache.put(base_url, self.account_address, resource_type, resource, self.ledger_version)
+
+
+def get_resources_page_url(
+        base_url: str,
+        account_address,
+        cursor: Union[str, None] = None,
+        ledger_version: Union[int, None] = None
+) -> str:
+    url = f"{base_url}/accounts/{account_address}/resources?limit={RESOURCES_PAGE_LIMIT}"
+    if cursor:
+        url += f"&start={cursor}"
+    if ledger_version:
+        url += f"&ledger_version={ledger_version}"
+
+    return url
+
+
+def get_resources_page(
+        account_address,
+        response: httpx.Response,
+        api_error: Type[Exception] = ApiError
+) -> List[Dict[str, Any]]:
+    # Account is created on first received coin, not existing account has no resources
+    if response.status_code == 404:
+        return []
+    if response.status_code >= 400:
+        raise api_error(f"{response.text} - {account_address}", response.status_code)
+
+    return get_response_json(response)
+
+
+def get_response_ledger_version(response: httpx.Response) -> int:
+    return int(response.headers.get(LEDGER_VERSION_HEADER, 0))
@@ -0,0 +1,81 @@
+# Quotes per second of per-quote functions and batch engine, run as python -m benchmarks.batch_quote
+import time
+import random
+from decimal import Decimal
+
+from modules import batch_quote
+from modules.batch_quote import ReserveSnapshot
+from modules.liquid_swap import math as liquid_swap_math
+from modules.liquid_swap import stable_math
+from modules.pancake.math import get_amount_in
+from modules.thala.math import FixedPoint64, get_pair_amount_in
+
+
+if __name__ == '__main__':
+    rnd = random.Random(0)
+    snapshot = ReserveSnapshot(
+        reserve_in=rnd.randint(10 ** 11, 10 ** 13),
+        reserve_out=rnd.randint(10 ** 11, 10 ** 13),
+        fee=5,
+        scale_in=10 ** 6,
+        scale_out=10 ** 8
+    )
+    amounts = [rnd.randint(10 ** 4, 10 ** 9) for _ in range(5000)]
+    ratios = [rnd.randint(1, 2 ** 64 // 1000) for _ in range(5000)]
+
+    benchmarks = [
+        (
+            "liquid swap uncorrelated out",
+            lambda: [
+                liquid_swap_math.get_coins_out_with_fees(
+                    Decimal(amount), Decimal(snapshot.reserve_in), Decimal(snapshot.reserve_out), Decimal(snapshot.fee)
+                ) for amount in amounts
+            ],
+            lambda: batch_quote.get_coins_out_with_fees_batch(amounts, snapshot)
+        ),
+        (
+            "liquid swap stable out",
+            lambda: [
+                stable_math.get_coins_out_with_fees_stable(
+                    amount, snapshot.reserve_in, snapshot.reserve_out, snapshot.scale_in, snapshot.scale_out, snapshot.fee
+                ) for amount in amounts
+            ],
+            lambda: batch_quote.get_coins_out_with_fees_stable_batch(amounts, snapshot)
+        ),
+        (
+            "liquid swap stable in",
+            lambda: [
+                stable_math.get_coins_in_with_fees_stable(
+                    amount, snapshot.reserve_out, snapshot.reserve_in, snapshot.scale_out, snapshot.scale_in, snapshot.fee
+                ) for amount in amounts
+            ],
+            lambda: batch_quote.get_coins_in_with_fees_stable_batch(amounts, snapshot)
+        ),
+        (
+            "pancake in",
+            lambda: [get_amount_in(amount, snapshot.reserve_in, snapshot.reserve_out) for amount in amounts],
+            lambda: batch_quote.get_amount_in_batch(amounts, snapshot)
+        ),
+        (
+            "thala pair in",
+            lambda: [
+                get_pair_amount_in(FixedPoint64(ratio), snapshot.reserve_in, snapshot.reserve_out)
+                for ratio in ratios
+            ],
+            lambda: batch_quote.get_pair_amount_in_batch(ratios, snapshot)
+        ),
+    ]
+
+    for name, single, batch in benchmarks:
+        started_at = time.perf_counter()
+        single()
+        single_sec = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        batch()
+        batch_sec = time.perf_counter() - started_at
+
+        print(
+            f"{name}: single {round(len(amounts) / single_sec)} quotes/sec, "
+            f"batch {round(len(amounts) / batch_sec)} quotes/sec"
+        )
@@ -0,0 +1,45 @@
+# Quotes per second of Decimal and integer LiquidSwap stable curve, run as python -m benchmarks.stable_math
+import time
+import random
+from decimal import Decimal
+
+from modules.liquid_swap import math as decimal_math
+from modules.liquid_swap import stable_math
+
+
+def get_random_quotes(count: int) -> list:
+    """
+    Random stable pool quotes of coin_in, reserve_in, reserve_out, scale_in, scale_out and fee
+    :param count:
+    :return:
+    """
+    rnd = random.Random(0)
+    quotes = []
+    for _ in range(count):
+        decimals_in, decimals_out = rnd.choice([(6, 6), (6, 8), (8, 6), (8, 8)])
+        quotes.append((
+            rnd.randint(10 ** 3, 10 ** 10),
+            rnd.randint(10 ** 10, 10 ** 13),
+            rnd.randint(10 ** 10, 10 ** 13),
+            10 ** decimals_in,
+            10 ** decimals_out,
+            rnd.choice([1, 4, 5, 30])
+        ))
+
+    return quotes
+
+
+if __name__ == '__main__':
+    quotes = get_random_quotes(2000)
+
+    started_at = time.perf_counter()
+    for quote in quotes:
+        decimal_math.get_coins_out_with_fees_stable(*[Decimal(value) for value in quote])
+    decimal_sec = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for quote in quotes:
+        stable_math.get_coins_out_with_fees_stable(*quote)
+    int_sec = time.perf_counter() - started_at
+
+    print(f"Decimal: {round(len(quotes) / decimal_sec)} quotes/sec, integer: {round(len(quotes) / int_sec)} quotes/sec")
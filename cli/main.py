@@ -0,0 +1,213 @@
+import sys
+import json
+import time
+import signal
+import argparse
+from datetime import datetime
+from typing import List, Union, TextIO
+
+from loguru import logger
+from pydantic.error_wrappers import ValidationError
+
+from src import enums
+from src.file_manager import FileManager
+from src.logger import configure_logger
+from src.schemas.tasks.base.base import TaskBase
+from src.schemas.wallet_data import WalletData
+from src.storage import Storage
+from src.tasks_executor import tasks_executor
+from src.tasks_executor.actions import read_actions_config
+from src.tasks_executor.actions import get_tasks_from_actions
+from src.templates.templates import Templates
+
+
+EXIT_CODE_SUCCESS = 0
+EXIT_CODE_TASKS_FAILED = 1
+EXIT_CODE_BAD_INPUT = 2
+EXIT_CODE_STOPPED = 130
+
+
+class CliEventWriter:
+    """
+    Writes executor events to stdout and optional json lines file
+    """
+
+    def __init__(self, json_output: Union[TextIO, None] = None):
+        self.json_output = json_output
+
+        self.wallets_completed = 0
+        self.tasks_completed = 0
+        self.tasks_failed = 0
+
+    def write_json_event(self, event: str, wallet: WalletData, task: Union[TaskBase, None] = None):
+        if self.json_output is None:
+            return
+
+        data = {
+            "event": event,
+            "date_time": datetime.now().isoformat(timespec="seconds"),
+            "wallet_name": wallet.name,
+            "wallet_address": wallet.address,
+        }
+        if task is not None:
+            data.update({
+                "task_id": str(task.task_id),
+                "module_name": task.module_name.value,
+                "module_type": task.module_type.value,
+                "task_status": task.task_status.value,
+            })
+
+        self.json_output.write(json.dumps(data) + "\n")
+        self.json_output.flush()
+
+    def on_wallet_started(self, wallet: WalletData):
+        self.write_json_event("wallet_started", wallet)
+
+    def on_task_started(self, task: TaskBase, wallet: WalletData):
+        self.write_json_event("task_started", wallet, task)
+
+    def on_task_completed(self, task: TaskBase, wallet: WalletData):
+        self.tasks_completed += 1
+        if task.task_status != enums.TaskStatus.SUCCESS:
+            self.tasks_failed += 1
+
+        logger.info(f"[{self.tasks_completed}] {wallet.name} - {task.module_name.value} "
+                    f"{task.module_type.value}: {task.task_status.value}")
+        self.write_json_event("task_completed", wallet, task)
+
+    def on_wallet_completed(self, wallet: WalletData):
+        self.wallets_completed += 1
+        self.write_json_event("wallet_completed", wallet)
+
+
+def get_wallets_from_csv(file_path: str) -> Union[List[WalletData], None]:
+    wallets_data = FileManager.read_data_from_csv_file(file_path)
+    if not wallets_data:
+        logger.error(f"No wallets found in \"{file_path}\"")
+        return None
+
+    try:
+        return [WalletData(**wallet_item) for wallet_item in wallets_data]
+
+    except ValidationError as e:
+        for error in e.errors():
+            logger.error(f"Wallets validation error: {error['msg']}")
+        return None
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run actions config for wallets without GUI"
+    )
+    parser.add_argument("--wallets", required=True, help="Path to wallets csv file")
+    parser.add_argument("--actions", required=True, help="Path to actions config pkl file saved from GUI")
+
+    parser.add_argument("--test-mode", action="store_true", default=None,
+                        help="Force test mode, run settings value is used if not set")
+    parser.add_argument("--shuffle-wallets", action="store_true", default=None,
+                        help="Shuffle wallets, run settings value is used if not set")
+    parser.add_argument("--shuffle-tasks", action="store_true", help="Shuffle tasks")
+
+    parser.add_argument("--concurrency", type=int, help="Max tasks in flight per worker")
+    parser.add_argument("--workers", type=int, help="Amount of worker processes")
+    parser.add_argument("--order", choices=[order.value for order in enums.ExecutionOrder],
+                        help="Execution order")
+    parser.add_argument("--resume", action="store_true", help="Skip pairs completed in the previous run")
+
+    parser.add_argument("--json", dest="json_output", metavar="PATH",
+                        help="Write events as json lines to file, '-' for stdout")
+
+    return parser
+
+
+def run_cli(argv: List[str] = None) -> int:
+    args = get_args_parser().parse_args(argv)
+
+    configure_logger()
+    Templates().create_not_found_temp_files()
+
+    if Storage().app_config is None:
+        logger.error("App config is not valid, check app_config.json file")
+        return EXIT_CODE_BAD_INPUT
+
+    wallets = get_wallets_from_csv(args.wallets)
+    if not wallets:
+        return EXIT_CODE_BAD_INPUT
+
+    actions_config = read_actions_config(args.actions)
+    if actions_config is None:
+        return EXIT_CODE_BAD_INPUT
+
+    run_settings_config = actions_config["run_settings_config"]
+    if args.test_mode is not None:
+        run_settings_config["test_mode"] = args.test_mode
+    if args.shuffle_wallets is not None:
+        run_settings_config["shuffle_wallets"] = args.shuffle_wallets
+
+    tasks = get_tasks_from_actions(
+        actions=actions_config["actions"],
+        run_settings_config=run_settings_config
+    )
+
+    if run_settings_config["test_mode"]:
+        wallets = wallets[:Storage().app_config.wallets_amount_to_execute_in_test_mode]
+
+    json_output = None
+    if args.json_output == "-":
+        json_output = sys.stdout
+    elif args.json_output:
+        json_output = open(args.json_output, "a")
+
+    event_writer = CliEventWriter(json_output=json_output)
+    event_manager = tasks_executor.event_manager
+    event_manager.on_wallet_started(event_writer.on_wallet_started)
+    event_manager.on_task_started(event_writer.on_task_started)
+    event_manager.on_task_completed(event_writer.on_task_completed)
+    event_manager.on_wallet_completed(event_writer.on_wallet_completed)
+
+    is_stopped = False
+
+    def stop_handler(signum, frame):
+        nonlocal is_stopped
+        is_stopped = True
+        logger.critical("Tasks processing stopped")
+        tasks_executor.stop()
+
+    signal.signal(signal.SIGINT, stop_handler)
+    signal.signal(signal.SIGTERM, stop_handler)
+
+    logger.info(f"Starting {len(tasks)} tasks for {len(wallets)} wallets")
+
+    tasks_executor.process(
+        wallets=wallets,
+        tasks=tasks,
+        shuffle_wallets=bool(run_settings_config["shuffle_wallets"]),
+        shuffle_tasks=args.shuffle_tasks,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        resume=args.resume,
+        execution_order=enums.ExecutionOrder(args.order) if args.order else None,
+    )
+
+    while tasks_executor.is_running():
+        time.sleep(1)
+
+    event_manager.stop()
+    if event_manager.listening_thread is not None:
+        event_manager.listening_thread.join()
+    event_manager.flush()
+    tasks_executor.stop()
+
+    if json_output is not None and json_output is not sys.stdout:
+        json_output.close()
+
+    logger.info(f"Wallets completed: {event_writer.wallets_completed}, "
+                f"tasks completed: {event_writer.tasks_completed}, failed: {event_writer.tasks_failed}")
+
+    if is_stopped:
+        return EXIT_CODE_STOPPED
+
+    if event_writer.tasks_failed:
+        return EXIT_CODE_TASKS_FAILED
+
+    return EXIT_CODE_SUCCESS
@@ -110,6 +110,11 @@ class AppConfigFrame(customtkinter.CTkFrame):
     def save_button_event(self):
         try:
             app_config = AppConfigSchema(
+                **self.app_config.dict(exclude={
+                    "preserve_logs",
+                    "rpc_url",
+                    "wallets_amount_to_execute_in_test_mode"
+                }),
                 preserve_logs=self.preserve_logs_checkbox.get(),
                 rpc_url=self.aptos_rpc_url_entry.get(),
                 wallets_amount_to_execute_in_test_mode=self.wallets_amount_to_execute_in_test_mode_spinbox.get(),
@@ -84,6 +84,7 @@ class AddLiquidityTab:
                 slippage=self.liquidity_frame.slippage_entry.get(),
                 gas_limit=self.txn_settings_frame.gas_limit_entry.get(),
                 gas_price=self.txn_settings_frame.gas_price_entry.get(),
+                gas_price_policy=self.txn_settings_frame.gas_price_policy_combo.get(),
                 forced_gas_limit=self.txn_settings_frame.forced_gas_limit_check_box.get(),
                 reverse_action=self.liquidity_frame.reverse_action_checkbox.get(),
             )
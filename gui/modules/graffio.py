@@ -52,6 +52,7 @@ class GraffioTab:
             config_data = GraffioDrawTask(
                 gas_limit=self.txn_settings_frame.gas_limit_entry.get(),
                 gas_price=self.txn_settings_frame.gas_price_entry.get(),
+                gas_price_policy=self.txn_settings_frame.gas_price_policy_combo.get(),
                 forced_gas_limit=self.txn_settings_frame.forced_gas_limit_check_box.get()
             )
 
@@ -67,6 +67,7 @@ class NftCollectTab:
             config_data = NftCollectTask(
                 gas_limit=self.txn_settings_frame.gas_limit_entry.get(),
                 gas_price=self.txn_settings_frame.gas_price_entry.get(),
+                gas_price_policy=self.txn_settings_frame.gas_price_policy_combo.get(),
                 forced_gas_limit=self.txn_settings_frame.forced_gas_limit_check_box.get(),
                 min_delay_nft_transfer_sec=self.collect_frame.min_delay_entry.get(),
                 max_delay_nft_transfer_sec=self.collect_frame.max_delay_entry.get(),
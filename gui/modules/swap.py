@@ -82,6 +82,7 @@ class SwapTab:
                 compare_with_cg_price=self.swap_frame.compare_with_cg_price_checkbox.get(),
                 gas_limit=self.txn_settings_frame.gas_limit_entry.get(),
                 gas_price=self.txn_settings_frame.gas_price_entry.get(),
+                gas_price_policy=self.txn_settings_frame.gas_price_policy_combo.get(),
                 forced_gas_limit=self.txn_settings_frame.forced_gas_limit_check_box.get()
             )
 
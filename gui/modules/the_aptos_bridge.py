@@ -54,6 +54,7 @@ class TheAptosBridgeTab:
                 send_percent_balance=self.bridge_frame.send_percent_balance_checkbox.get(),
                 gas_limit=self.txn_settings_frame.gas_limit_entry.get(),
                 gas_price=self.txn_settings_frame.gas_price_entry.get(),
+                gas_price_policy=self.txn_settings_frame.gas_price_policy_combo.get(),
                 forced_gas_limit=self.txn_settings_frame.forced_gas_limit_check_box.get()
             )
 
@@ -1,6 +1,8 @@
 import customtkinter
 from tkinter import Variable
 
+from src import enums
+
 
 class TxnSettingFrame(customtkinter.CTkFrame):
     def __init__(
@@ -80,3 +82,27 @@ class TxnSettingFrame(customtkinter.CTkFrame):
             pady=(0, 10),
             sticky="w"
         )
+
+        self.gas_price_policy_label = customtkinter.CTkLabel(
+            self.frame,
+            text="Gas Price Policy:"
+        )
+        self.gas_price_policy_label.grid(
+            row=5,
+            column=0,
+            padx=20,
+            pady=(0, 0),
+            sticky='w'
+        )
+        self.gas_price_policy_combo = customtkinter.CTkComboBox(
+            self.frame,
+            values=[policy.value for policy in enums.GasPricePolicy],
+            width=130
+        )
+        self.gas_price_policy_combo.grid(
+            row=6,
+            column=0,
+            padx=20,
+            pady=(0, 10),
+            sticky="w"
+        )
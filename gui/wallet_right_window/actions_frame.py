@@ -9,6 +9,7 @@ from loguru import logger
 from src.schemas.tasks.base.base import TaskBase
 from src.schemas.wallet_data import WalletData
 from src.tasks_executor import tasks_executor
+from src.tasks_executor.actions import get_tasks_from_actions
 from src.storage import ActionStorage
 from src.storage import Storage
 from src.file_manager import FileManager
@@ -113,25 +114,10 @@ class ActionsFrame(customtkinter.CTkFrame):
 
     @property
     def tasks(self):
-        tasks = []
-        for action in self.actions:
-            repeats = action["repeats"]
-            task: TaskBase = action["task_config"]
-
-            task.test_mode = bool(self.run_settings_frame.test_mode_checkbox.get())
-            task.min_delay_sec = int(self.run_settings_frame.min_delay_entry_spinbox.entry.get())
-            task.max_delay_sec = self.run_settings_frame.max_delay_entry_spinbox.entry.get()
-            task.wait_for_receipt = bool(self.run_settings_frame.wait_for_receipt_checkbox.get())
-
-            txn_wait_timeout_sec = self.run_settings_frame.txn_wait_timeout_seconds_spinbox.entry.get()
-            task.txn_wait_timeout_sec = int(txn_wait_timeout_sec) if txn_wait_timeout_sec else 120
-
-            task = TaskBase(**task.dict())
-
-            for _ in range(repeats):
-                tasks.append(task)
-
-        return tasks
+        return get_tasks_from_actions(
+            actions=self.actions,
+            run_settings_config=self.run_settings_frame.build_config()
+        )
 
     def get_action_item_by_id(self, action_id: UUID) -> Union[WalletActionFrame, None]:
         if not self.action_items:
@@ -312,6 +298,7 @@ class ActionsFrame(customtkinter.CTkFrame):
             tasks=self.tasks,
             shuffle_wallets=bool(self.run_settings_frame.shuffle_wallets_checkbox.get()),
             shuffle_tasks=bool(self.run_settings_frame.shuffle_task_checkbox.get()),
+            resume=bool(self.run_settings_frame.resume_checkbox.get()),
         )
 
     def on_stop_button_click(self):
@@ -631,6 +618,25 @@ class RunSettingsFrame(customtkinter.CTkFrame):
             sticky="ew"
         )
 
+        self.resume_checkbox = customtkinter.CTkCheckBox(
+            self,
+            text="Resume run",
+            text_color="#F47174",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            checkbox_width=18,
+            checkbox_height=18,
+            command=self.resume_checkbox_event,
+            onvalue=True,
+            offvalue=False
+        )
+        self.resume_checkbox.grid(
+            row=1,
+            column=0,
+            padx=20,
+            pady=(0, 10),
+            sticky="ew"
+        )
+
         self.shuffle_task_checkbox = customtkinter.CTkCheckBox(
             self,
             text="Shuffle tasks",
@@ -893,4 +899,14 @@ class RunSettingsFrame(customtkinter.CTkFrame):
         else:
             self.shuffle_task_checkbox.configure(
                 text_color="#F47174"
-            )
\ No newline at end of file
+            )
+
+    def resume_checkbox_event(self):
+        if self.resume_checkbox.get():
+            self.resume_checkbox.configure(
+                text_color="#6fc276"
+            )
+        else:
+            self.resume_checkbox.configure(
+                text_color="#F47174"
+            )
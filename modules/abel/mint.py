@@ -45,6 +45,7 @@ class AbleFinanceMint(ModuleBase):
 
         self.coin_x = self.tokens.get_by_name(self.task.coin_x)
 
+        self.get_wallet_snapshot(wallet_address=self.account.address())
         self.initial_balance_x_wei = self.get_wallet_token_balance(
             wallet_address=self.account.address(),
             token_address=self.coin_x.contract_address
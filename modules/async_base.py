@@ -0,0 +1,493 @@
+import asyncio
+from typing import TYPE_CHECKING, Union
+
+from aptos_sdk.account import Account
+from aptos_sdk.account import AccountAddress
+from aptos_sdk.transactions import RawTransaction
+from aptos_sdk.transactions import EntryFunction
+from aptos_sdk.async_client import ApiError
+from aptos_sdk.async_client import ResourceNotFound
+from loguru import logger
+
+from contracts.base import TokenBase
+from aptos_rest_client import AsyncCustomRestClient
+from aptos_rest_client import WalletSnapshot
+from aptos_rest_client.retry import default_retry_policy
+from aptos_rest_client.receipts import ReceiptTracker
+from aptos_rest_client.transaction_builder import TransactionBuilder
+from modules.base import ModuleCore
+from src.gecko_pricer import AsyncGeckoPricer
+from src.storage import SharedTaskStorage
+from src import enums
+from src.schemas.action_models import ModuleExecutionResult
+from src.schemas.action_models import TransactionSimulationResult
+from src.schemas.action_models import TransactionReceipt
+
+
+if TYPE_CHECKING:
+    from src.schemas.tasks.base.base import TaskBase
+
+
+class AsyncModuleBase(ModuleCore):
+    """
+    Asyncio counterpart of ModuleBase, every network call is awaited on the aptos_sdk async client,
+    payload, gas and result logic is shared with ModuleBase by ModuleCore.
+    Data that ModuleBase fetches in __init__ is fetched in prepare(), which the executor awaits
+    before try_send_txn().
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            task: 'TaskBase',
+            account: Account,
+            proxies: dict = None
+    ):
+        super().__init__(
+            base_url=base_url,
+            task=task,
+            account=account,
+            proxies=proxies
+        )
+        self.client = AsyncCustomRestClient(base_url=base_url, proxies=proxies)
+        self.gecko_pricer = AsyncGeckoPricer(client=self.client)
+
+    async def prepare(self):
+        """
+        Fetches initial module data, override in subclasses.
+        :return:
+        """
+        pass
+
+    async def close(self):
+        """
+        Closes module http client
+        :return:
+        """
+        await self.client.close()
+
+    async def get_wallet_snapshot(self, wallet_address: AccountAddress) -> Union[WalletSnapshot, None]:
+        """
+        Gets all wallet resources in one request, snapshot is kept until module submits a transaction
+        :param wallet_address:
+        :return:
+        """
+        wallet_snapshot = self.get_loaded_wallet_snapshot(wallet_address=wallet_address)
+        if wallet_snapshot is not None:
+            return wallet_snapshot
+
+        try:
+            self.wallet_snapshot = await self.client.get_wallet_snapshot(wallet_address)
+            return self.wallet_snapshot
+
+        except Exception as e:
+            logger.error(f"Error getting wallet resources: {e}")
+            return None
+
+    async def get_wallet_aptos_balance(self, wallet_address: AccountAddress) -> int:
+        """
+        Gets wallet aptos balance
+        :param wallet_address:
+        :return:
+        """
+        return await self.get_wallet_token_balance(
+            wallet_address=wallet_address,
+            token_address="0x1::aptos_coin::AptosCoin"
+        )
+
+    async def get_wallet_token_balance(
+            self,
+            wallet_address: AccountAddress,
+            token_address: str,
+    ) -> int:
+        """
+        Gets wallet token balance
+        :param wallet_address:
+        :param token_address:
+        :return:
+        """
+        wallet_snapshot = self.get_loaded_wallet_snapshot(wallet_address=wallet_address)
+        if wallet_snapshot is not None:
+            return wallet_snapshot.get_coin_balance(token_address)
+
+        try:
+            balance = await self.client.account_resource(
+                wallet_address,
+                f"0x1::coin::CoinStore<{token_address}>",
+            )
+            return int(balance["data"]["coin"]["value"])
+
+        except ResourceNotFound:
+            # Not registered coin, RPC errors are raised to not be taken for empty balance
+            return 0
+
+    async def get_token_info(self, token_obj: TokenBase) -> Union[dict, None]:
+        """
+        Gets token info, shared by wallets of the current task window
+        :param token_obj:
+        :return:
+        """
+        if token_obj.symbol == "aptos":
+            return None
+
+        return await SharedTaskStorage().get_or_fetch_async(
+            key=("token_info", token_obj.contract_address),
+            fetch=lambda: self.fetch_token_info(token_obj=token_obj)
+        )
+
+    async def fetch_token_info(self, token_obj: TokenBase) -> Union[dict, None]:
+        """
+        Fetches token info from chain
+        :param token_obj:
+        :return:
+        """
+        coin_address = self.get_address_from_hex(token_obj.address)
+
+        try:
+            token_info = await self.client.account_resource(
+                coin_address,
+                f"0x1::coin::CoinInfo<{token_obj.contract_address}>",
+            )
+            return token_info["data"]
+
+        except Exception as e:
+            logger.error(f"Error getting token info: {e}")
+            return None
+
+    async def get_token_decimals(self, token_obj: TokenBase) -> Union[int, None]:
+        """
+        Gets token decimals
+        :param token_obj:
+        :return:
+        """
+        if token_obj.symbol == "aptos":
+            return 8
+
+        token_info = await self.get_token_info(token_obj=token_obj)
+        if not token_info:
+            return None
+
+        return token_info["decimals"]
+
+    async def is_token_registered_for_address(
+            self,
+            wallet_address: AccountAddress,
+            token_contract: str
+    ):
+        """
+        Checks if token is registered for address
+        :param wallet_address:
+        :param token_contract:
+        :return:
+        """
+        wallet_snapshot = self.get_loaded_wallet_snapshot(wallet_address=wallet_address)
+        if wallet_snapshot is not None:
+            return wallet_snapshot.is_coin_registered(token_contract)
+
+        try:
+            await self.client.account_resource(
+                wallet_address,
+                f'0x1::coin::CoinStore<{token_contract}>'
+            )
+            return True
+
+        except ResourceNotFound:
+            return False
+
+    async def register_coin_for_wallet(
+            self,
+            sender_account: Account,
+            token_obj: TokenBase,
+    ) -> ModuleExecutionResult:
+        """
+        Sends coin register transaction
+        :param sender_account:
+        :param token_obj:
+        :return:
+        """
+        return await self.simulate_and_send_transfer_type_transaction(
+            account=sender_account,
+            txn_payload=self.get_register_coin_payload(token_obj),
+            txn_info_message=f"Coin register {token_obj.symbol.upper()} for wallet"
+        )
+
+    async def estimate_transaction(
+            self,
+            raw_transaction: RawTransaction,
+            sender_account: Account
+    ) -> TransactionSimulationResult:
+        """
+        Estimates transaction gas usage
+        :param raw_transaction:
+        :param sender_account:
+        :return:
+        """
+        txn_data = await self.client.simulate_transaction(
+            transaction=raw_transaction,
+            sender=sender_account
+        )
+
+        return self.get_simulation_result(txn_data)
+
+    async def wait_for_receipt(
+            self,
+            txn_hash: str,
+            timeout: int = 60
+    ) -> TransactionReceipt:
+        """
+        Waits for transaction receipt, transaction is tracked by receipt tracker shared by all modules
+        :param txn_hash:
+        :param timeout:
+        :return:
+        """
+        tracker = ReceiptTracker.get_tracker(self.base_url, self.proxies)
+        txn_data = await tracker.wait_async(txn_hash, timeout=timeout, node_url=self.client.node_url)
+
+        return self.get_receipt_from_transaction(txn_data)
+
+    async def get_token_reserve(
+            self,
+            resource_address: AccountAddress,
+            payload: str
+    ) -> Union[dict, None]:
+        """
+        Gets token reserve, shared by wallets of the current task window
+        :param resource_address:
+        :param payload:
+        :return:
+        """
+        return await SharedTaskStorage().get_or_fetch_async(
+            key=("token_reserve", str(resource_address), payload),
+            fetch=lambda: self.fetch_token_reserve(resource_address=resource_address, payload=payload)
+        )
+
+    async def fetch_token_reserve(
+            self,
+            resource_address: AccountAddress,
+            payload: str
+    ) -> Union[dict, None]:
+        """
+        Fetches token reserve from chain
+        :param resource_address:
+        :param payload:
+        :return:
+        """
+        try:
+            data = await self.client.account_resource(
+                resource_address,
+                payload
+            )
+            return data
+
+        except Exception:
+            return None
+
+    async def build_transaction(
+            self,
+            account: Account,
+            payload: EntryFunction,
+            gas_limit: int,
+            gas_price: int
+    ) -> TransactionBuilder:
+        """
+        Builds transaction with allocated sequence number of account
+        :param account:
+        :param payload:
+        :param gas_limit:
+        :param gas_price:
+        :return:
+        """
+        return TransactionBuilder(
+            account=account,
+            payload=payload,
+            gas_limit=gas_limit,
+            gas_price=gas_price,
+            sequence_number=await self.client.get_next_sequence_number(account.address(), allocate=True),
+            chain_id=await self.client.chain_id()
+        )
+
+    async def simulate_transaction(self, transaction: TransactionBuilder) -> TransactionSimulationResult:
+        """
+        Simulates transaction, sets simulation result to it
+        :param transaction:
+        :return:
+        """
+        address = transaction.account.address()
+        simulation_result = await self.estimate_transaction(
+            raw_transaction=transaction.raw_transaction,
+            sender_account=transaction.account
+        )
+
+        if self.is_simulation_sequence_number_error(simulation_result):
+            if self.is_sequence_number_too_old(simulation_result):
+                self.client.resync_sequence_number(address)
+                transaction.set_sequence_number(await self.client.get_next_sequence_number(address, allocate=True))
+                raw_transaction = transaction.raw_transaction
+            else:
+                raw_transaction = transaction.get_raw_transaction(
+                    sequence_number=await self.client.fetch_sequence_number(address)
+                )
+
+            simulation_result = await self.estimate_transaction(
+                raw_transaction=raw_transaction,
+                sender_account=transaction.account
+            )
+
+        transaction.simulation_result = simulation_result
+
+        return simulation_result
+
+    async def prebuild_payload_and_estimate_transaction(
+            self,
+            txn_payload: EntryFunction,
+            account: Account,
+            gas_limit: int,
+            gas_price: int
+    ) -> TransactionBuilder:
+        """
+        Prebuilds payload and estimates transaction
+        :param txn_payload:
+        :param account:
+        :param gas_limit:
+        :param gas_price:
+        :return: transaction with simulation result, it's signed and submitted as is after gas adjustment
+        """
+        transaction = await self.build_transaction(
+            account=account,
+            payload=txn_payload,
+            gas_limit=gas_limit,
+            gas_price=gas_price
+        )
+        await self.simulate_transaction(transaction)
+
+        return transaction
+
+    async def send_txn(self):
+        """
+        Abstract method for sending a transaction.
+        :return:
+        """
+        raise NotImplementedError
+
+    async def try_send_txn(
+            self,
+            retries: int = 1,
+    ) -> ModuleExecutionResult:
+        """
+        Tries to send a transaction.
+        :param retries:
+        :return:
+        """
+        result: ModuleExecutionResult = self.module_execution_result
+        retries = self.get_retries(retries)
+
+        for i in range(retries):
+            logger.info(f"Attempt {i + 1}/{retries}")
+
+            result = await self.send_txn()
+
+            if self.is_final_attempt_result(result):
+                return result
+
+            if result.execution_status == enums.ModuleExecutionStatus.RETRY:
+                continue
+
+            await asyncio.sleep(default_retry_policy.get_delay(attempt=i))
+        else:
+            logger.error(f"Failed to send txn after {retries} attempts")
+            return result
+
+    async def submit_transaction(self, transaction: TransactionBuilder) -> Union[str, None]:
+        """
+        Signs and submits transaction.
+        Transaction rejected by sequence number is signed again with number fetched from node.
+        :param transaction:
+        :return: transaction hash, None if submission failed
+        """
+        address = transaction.account.address()
+
+        for attempt in range(2):
+            signed_transaction = transaction.sign()
+
+            # Wallet state changes after submit, next balance reads go to node
+            self.wallet_snapshot = None
+            try:
+                return await self.client.submit_bcs_transaction(signed_transaction)
+
+            except ApiError as e:
+                if not self.is_submission_retried(transaction, e):
+                    return None
+
+            transaction.set_sequence_number(await self.client.get_next_sequence_number(address, allocate=True))
+
+        return None
+
+    async def get_gas_price(self) -> int:
+        """
+        Gets gas unit price by task gas price policy, task gas price is used if estimate is not available
+        :return:
+        """
+        if self.is_gas_price_fixed():
+            return self.get_task_gas_price()
+
+        try:
+            return self.get_gas_price_from_estimate(await self.client.gas_price_estimate())
+
+        except Exception as e:
+            return self.get_task_gas_price(error=e)
+
+    async def simulate_and_send_transfer_type_transaction(
+            self,
+            account: Account,
+            txn_payload: EntryFunction,
+            txn_info_message: str
+    ) -> ModuleExecutionResult:
+        """
+        Simulates and sends transfer type transaction
+        :param account:
+        :param txn_payload:
+        :param txn_info_message:
+        :return:
+        """
+        if txn_info_message:
+            logger.warning(f"Action: {txn_info_message}")
+
+        gas_price = await self.get_gas_price()
+        trusted_gas_used = self.get_trusted_gas_used(txn_payload)
+
+        if trusted_gas_used is None:
+            transaction = await self.prebuild_payload_and_estimate_transaction(
+                account=account,
+                txn_payload=txn_payload,
+                gas_limit=int(self.task.gas_limit),
+                gas_price=gas_price
+            )
+            failed_result = self.apply_simulation_result(transaction, txn_payload)
+            if failed_result is not None:
+                return failed_result
+        else:
+            transaction = await self.build_transaction(
+                account=account,
+                payload=txn_payload,
+                gas_limit=self.get_gas_limit_from_simulation(trusted_gas_used),
+                gas_price=gas_price
+            )
+
+        unsent_result = self.get_unsent_result(transaction)
+        if unsent_result is not None:
+            return unsent_result
+
+        tx_hash = await self.submit_transaction(transaction)
+        if tx_hash is None:
+            return self.get_submission_failed_result()
+
+        if self.task.wait_for_receipt is not True:
+            return self.get_sent_result(tx_hash)
+
+        self.log_receipt_wait(tx_hash)
+        txn_receipt = await self.wait_for_receipt(
+            txn_hash=tx_hash,
+            timeout=self.task.txn_wait_timeout_sec
+        )
+
+        return self.get_receipt_result(account, txn_payload, tx_hash, txn_receipt)
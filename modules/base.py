@@ -7,18 +7,24 @@ from aptos_sdk.account import AccountAddress
 from aptos_sdk.type_tag import TypeTag
 from aptos_sdk.type_tag import StructTag
 from aptos_sdk.transactions import RawTransaction
-from aptos_sdk.transactions import TransactionPayload
 from aptos_sdk.transactions import EntryFunction
-from aptos_sdk.async_client import ClientConfig
 from aptos_sdk.client import ResourceNotFound
 from aptos_sdk.client import ApiError
-from httpx import ReadTimeout
 from loguru import logger
 
 from contracts.base import TokenBase
 from aptos_rest_client import CustomRestClient
+from aptos_rest_client import WalletSnapshot
+from aptos_rest_client.retry import default_retry_policy
+from aptos_rest_client.receipts import ReceiptTracker
+from aptos_rest_client.sequence_numbers import is_sequence_number_error
+from aptos_rest_client.transaction_builder import TransactionBuilder
+from aptos_rest_client.resource_cache import normalize_address
+from aptos_rest_client.gas_price import GasPriceEstimate
+from src.gas_stats import GasStats
 from src.gecko_pricer import GeckoPricer
 from src.storage import Storage
+from src.storage import SharedTaskStorage
 from contracts.tokens.main import Tokens
 from src import enums
 from src.schemas.action_models import ModuleExecutionResult
@@ -34,7 +40,12 @@ if TYPE_CHECKING:
     from src.schemas.tasks.base.base import TaskBase
 
 
-class ModuleBase:
+class ModuleCore:
+    """
+    Module state and logic without network calls: payloads, gas, simulation and receipt results.
+    Shared by ModuleBase and AsyncModuleBase, which set client and gecko pricer and make the calls.
+    """
+
     def __init__(
             self,
             base_url: str,
@@ -45,14 +56,12 @@ class ModuleBase:
 
         self.base_url = base_url
         self.task = task
-        self.client = CustomRestClient(base_url=base_url, proxies=proxies)
-        self.gecko_pricer = GeckoPricer(client=self.client)
         self.storage = Storage()
         self.tokens = Tokens()
         self.proxies = proxies
 
-        self.task = task
         self.module_execution_result = ModuleExecutionResult()
+        self.wallet_snapshot: Union[WalletSnapshot, None] = None
 
     def get_random_amount_out_of_token(
             self,
@@ -97,21 +106,330 @@ class ModuleBase:
         account = Account.load_key(private_key)
         return account.auth_key()
 
-    def get_wallet_aptos_balance(self, wallet_address: AccountAddress) -> int:
+    def get_loaded_wallet_snapshot(self, wallet_address: AccountAddress) -> Union[WalletSnapshot, None]:
         """
-        Gets wallet aptos balance
+        Gets wallet snapshot if it's already fetched for address
         :param wallet_address:
         :return:
         """
-        try:
-            resource = self.client.account_resource(
-                wallet_address,
-                "0x1::coin::CoinStore<0x1::aptos_coin::AptosCoin>"
+        if self.wallet_snapshot is None:
+            return None
+
+        if self.wallet_snapshot.account_address != normalize_address(wallet_address):
+            return None
+
+        return self.wallet_snapshot
+
+    def get_register_coin_payload(self, token_obj: TokenBase) -> EntryFunction:
+        return EntryFunction.natural(
+            f"0x1::managed_coin",
+            "register",
+            [TypeTag(StructTag.from_str(token_obj.contract_address))],
+            []
+        )
+
+    @staticmethod
+    def get_simulation_result(txn_data: list) -> TransactionSimulationResult:
+        """
+        Builds simulation result from node simulation response
+        :param txn_data:
+        :return:
+        """
+        vm_status = txn_data[0]["vm_status"]
+
+        if txn_data[0]["success"] is True:
+            result = TransactionSimulationResult(
+                result=enums.TransactionStatus.SUCCESS,
+                vm_status=vm_status,
+                gas_used=int(txn_data[0]["gas_used"])
+            )
+        else:
+            result = TransactionSimulationResult(
+                result=enums.TransactionStatus.FAILED,
+                vm_status=vm_status,
+                gas_used=0
             )
-            return resource["data"]["coin"]["value"]
 
-        except Exception as ex:
-            return 0
+        return result
+
+    @staticmethod
+    def is_simulation_sequence_number_error(simulation_result: TransactionSimulationResult) -> bool:
+        return (simulation_result.result == enums.TransactionStatus.FAILED
+                and is_sequence_number_error(simulation_result.vm_status))
+
+    @staticmethod
+    def is_sequence_number_too_old(simulation_result: TransactionSimulationResult) -> bool:
+        # Account was used elsewhere, local sequence number is fetched again,
+        # otherwise local number is ahead of pending transactions of account, they are not in simulated state
+        return "TOO_OLD" in str(simulation_result.vm_status).upper()
+
+    def get_receipt_from_transaction(self, txn_data: Union[dict, None]) -> TransactionReceipt:
+        """
+        Builds receipt from committed transaction
+        :param txn_data: None if transaction is not committed until timeout
+        :return:
+        """
+        if txn_data is None:
+            return TransactionReceipt(
+                status=enums.TransactionStatus.TIME_OUT,
+                vm_status=None
+            )
+
+        # Committed state is newer than cached reads, cache doesn't take older reads after this version
+        self.client.invalidate_account_resources(
+            txn_data.get("sender"),
+            ledger_version=int(txn_data["version"]) if txn_data.get("version") else None
+        )
+
+        if txn_data.get("success") is True:
+            status = enums.TransactionStatus.SUCCESS
+        else:
+            status = enums.TransactionStatus.FAILED
+
+        return TransactionReceipt(
+            status=status,
+            vm_status=txn_data.get("vm_status"),
+            gas_used=txn_data.get("gas_used")
+        )
+
+    def record_receipt_gas(self, txn_payload: EntryFunction, txn_receipt: TransactionReceipt):
+        """
+        Records committed gas used to gas stats, out of gas transaction drops stats of its function
+        :param txn_payload:
+        :param txn_receipt:
+        :return:
+        """
+        if txn_receipt.status == enums.TransactionStatus.SUCCESS and txn_receipt.gas_used is not None:
+            GasStats.record(txn_payload, enums.GasSampleKind.ACTUAL, txn_receipt.gas_used)
+
+        elif (txn_receipt.status == enums.TransactionStatus.FAILED
+              and "OUT_OF_GAS" in str(txn_receipt.vm_status).upper().replace(" ", "_")):
+            GasStats.record(txn_payload, enums.GasSampleKind.OUT_OF_GAS)
+
+    def get_retries(self, retries) -> int:
+        if not isinstance(retries, int):
+            logger.error(f"Retries must be an integer, got {retries}, setting to 1")
+            return 1
+
+        return retries
+
+    def is_final_attempt_result(self, result: ModuleExecutionResult) -> bool:
+        """
+        Checks if send attempt result is returned without retries
+        :param result:
+        :return:
+        """
+        if self.task.test_mode is True:
+            return True
+
+        return (result.execution_status == enums.ModuleExecutionStatus.SUCCESS or
+                result.execution_status == enums.ModuleExecutionStatus.SENT)
+
+    def is_submission_retried(self, transaction: TransactionBuilder, error: ApiError) -> bool:
+        """
+        Checks if rejected transaction is signed again with number fetched from node
+        :param transaction:
+        :param error:
+        :return:
+        """
+        logger.error(f"ApiError: {error}")
+        if is_sequence_number_error(error):
+            return True
+
+        # Number didn't reach node, it's taken by next transaction of account
+        self.client.release_sequence_number(transaction.account.address(), transaction.sequence_number)
+        return False
+
+    def is_gas_price_fixed(self) -> bool:
+        return self.task.gas_price_policy == enums.GasPricePolicy.FIXED
+
+    def get_gas_price_from_estimate(self, estimate: GasPriceEstimate) -> int:
+        return estimate.get_price(self.task.gas_price_policy.value)
+
+    def get_task_gas_price(self, error: Exception = None) -> int:
+        """
+        Gets task gas price, used by fixed policy and if estimate is not available
+        :param error: error of estimate request
+        :return:
+        """
+        if error is not None:
+            logger.warning(f"Error while getting gas price estimate, task gas price is used: {error}")
+
+        return int(self.task.gas_price)
+
+    def get_gas_limit_from_simulation(self, gas_used: int) -> int:
+        if self.task.forced_gas_limit is True:
+            return int(self.task.gas_limit)
+
+        if int(gas_used) <= 200:
+            return int(int(gas_used) * 2)
+
+        return int(int(gas_used) * 1.15)
+
+    def get_trusted_gas_used(self, txn_payload: EntryFunction) -> Union[int, None]:
+        """
+        Gets gas used by stats of well characterized function, transaction is not simulated then
+        :param txn_payload:
+        :return: None if transaction is simulated, test mode checks transaction by simulation
+        """
+        if self.task.test_mode is True:
+            return None
+
+        trusted_gas_used = GasStats.get_trusted_gas_used(txn_payload)
+        if trusted_gas_used is not None:
+            logger.info(f"Transaction simulation skipped. Gas used by stats: {trusted_gas_used}")
+
+        return trusted_gas_used
+
+    def set_execution_result(
+            self,
+            status: enums.ModuleExecutionStatus,
+            info: str,
+            txn_hash: str = None
+    ) -> ModuleExecutionResult:
+        self.module_execution_result.execution_status = status.value
+        self.module_execution_result.execution_info = info
+        if txn_hash is not None:
+            self.module_execution_result.hash = txn_hash
+
+        return self.module_execution_result
+
+    def apply_simulation_result(
+            self,
+            transaction: TransactionBuilder,
+            txn_payload: EntryFunction
+    ) -> Union[ModuleExecutionResult, None]:
+        """
+        Sets gas limit of simulated transaction
+        :param transaction:
+        :param txn_payload:
+        :return: failed result if simulation failed, None otherwise
+        """
+        simulation_status = transaction.simulation_result
+
+        if simulation_status.result == enums.TransactionStatus.FAILED:
+            self.client.release_sequence_number(transaction.account.address(), transaction.sequence_number)
+            err_msg = f"Transaction simulation failed. Status: {simulation_status.vm_status}"
+            logger.error(err_msg)
+            return self.set_execution_result(enums.ModuleExecutionStatus.FAILED, err_msg)
+
+        logger.success(f"Transaction simulation success. Gas used: {simulation_status.gas_used}")
+        GasStats.record(txn_payload, enums.GasSampleKind.SIMULATED, simulation_status.gas_used)
+
+        transaction.set_gas_limit(self.get_gas_limit_from_simulation(simulation_status.gas_used))
+        return None
+
+    def get_unsent_result(self, transaction: TransactionBuilder) -> Union[ModuleExecutionResult, None]:
+        """
+        Gets result of transaction that is not submitted in test mode
+        :param transaction:
+        :return: None if transaction is submitted
+        """
+        if self.task.test_mode is not True:
+            return None
+
+        self.client.release_sequence_number(transaction.account.address(), transaction.sequence_number)
+        logger.info(f"Test mode enabled. Skipping transaction")
+        return self.module_execution_result
+
+    def get_submission_failed_result(self) -> ModuleExecutionResult:
+        err_msg = f"Transaction submission failed"
+        logger.error(err_msg)
+        return self.set_execution_result(enums.ModuleExecutionStatus.FAILED, err_msg)
+
+    def get_sent_result(self, tx_hash: str) -> ModuleExecutionResult:
+        msg = f"Transaction sent. Txn Hash: {tx_hash}"
+        logger.success(msg)
+        return self.set_execution_result(enums.ModuleExecutionStatus.SENT, msg, tx_hash)
+
+    def log_receipt_wait(self, tx_hash: str):
+        logger.info(
+            f"Txn sent. Waiting for receipt (Timeout in {self.task.txn_wait_timeout_sec}s)."
+            f" Txn Hash: {tx_hash}"
+        )
+
+    def get_receipt_result(
+            self,
+            account: Account,
+            txn_payload: EntryFunction,
+            tx_hash: str,
+            txn_receipt: TransactionReceipt
+    ) -> ModuleExecutionResult:
+        """
+        Gets module result of committed transaction
+        :param account:
+        :param txn_payload:
+        :param tx_hash:
+        :param txn_receipt:
+        :return:
+        """
+        self.record_receipt_gas(txn_payload, txn_receipt)
+
+        if txn_receipt.status == enums.TransactionStatus.SUCCESS:
+            msg = f"Transaction success, vm status: {txn_receipt.vm_status}. Txn Hash: {tx_hash}"
+            logger.success(msg)
+            return self.set_execution_result(enums.ModuleExecutionStatus.SUCCESS, msg, tx_hash)
+
+        elif txn_receipt.status == enums.TransactionStatus.FAILED:
+            msg = f"Transaction failed, vm status: {txn_receipt.vm_status}. Txn Hash: {tx_hash}"
+            logger.error(msg)
+            return self.set_execution_result(enums.ModuleExecutionStatus.FAILED, msg, tx_hash)
+
+        elif txn_receipt.status == enums.TransactionStatus.TIME_OUT:
+            # Expired transaction leaves a gap before numbers allocated after it
+            self.client.resync_sequence_number(account.address())
+            msg = f"Transaction timeout, vm status: {txn_receipt.vm_status}. Txn Hash: {tx_hash}"
+            logger.error(msg)
+            return self.set_execution_result(enums.ModuleExecutionStatus.TIME_OUT, msg, tx_hash)
+
+        return self.module_execution_result
+
+
+class ModuleBase(ModuleCore):
+    def __init__(
+            self,
+            base_url: str,
+            task: 'TaskBase',
+            account: Account,
+            proxies: dict = None
+    ):
+        super().__init__(
+            base_url=base_url,
+            task=task,
+            account=account,
+            proxies=proxies
+        )
+        self.client = CustomRestClient(base_url=base_url, proxies=proxies)
+        self.gecko_pricer = GeckoPricer(client=self.client)
+
+    def get_wallet_snapshot(self, wallet_address: AccountAddress) -> Union[WalletSnapshot, None]:
+        """
+        Gets all wallet resources in one request, snapshot is kept until module submits a transaction
+        :param wallet_address:
+        :return:
+        """
+        wallet_snapshot = self.get_loaded_wallet_snapshot(wallet_address=wallet_address)
+        if wallet_snapshot is not None:
+            return wallet_snapshot
+
+        try:
+            self.wallet_snapshot = self.client.get_wallet_snapshot(wallet_address)
+            return self.wallet_snapshot
+
+        except Exception as e:
+            logger.error(f"Error getting wallet resources: {e}")
+            return None
+
+    def get_wallet_aptos_balance(self, wallet_address: AccountAddress) -> int:
+        """
+        Gets wallet aptos balance
+        :param wallet_address:
+        :return:
+        """
+        return self.get_wallet_token_balance(
+            wallet_address=wallet_address,
+            token_address="0x1::aptos_coin::AptosCoin"
+        )
 
     def get_wallet_token_balance(
             self,
@@ -124,6 +442,10 @@ class ModuleBase:
         :param token_address:
         :return:
         """
+        wallet_snapshot = self.get_loaded_wallet_snapshot(wallet_address=wallet_address)
+        if wallet_snapshot is not None:
+            return wallet_snapshot.get_coin_balance(token_address)
+
         try:
             balance = self.client.account_resource(
                 wallet_address,
@@ -131,19 +453,30 @@ class ModuleBase:
             )
             return int(balance["data"]["coin"]["value"])
 
-        except Exception as ex:
+        except ResourceNotFound:
+            # Not registered coin, RPC errors are raised to not be taken for empty balance
             return 0
 
-
     def get_token_info(self, token_obj: TokenBase) -> Union[dict, None]:
         """
-        Gets token info
+        Gets token info, shared by wallets of the current task window
         :param token_obj:
         :return:
         """
         if token_obj.symbol == "aptos":
             return None
 
+        return SharedTaskStorage().get_or_fetch(
+            key=("token_info", token_obj.contract_address),
+            fetch=lambda: self.fetch_token_info(token_obj=token_obj)
+        )
+
+    def fetch_token_info(self, token_obj: TokenBase) -> Union[dict, None]:
+        """
+        Fetches token info from chain
+        :param token_obj:
+        :return:
+        """
         coin_address = self.get_address_from_hex(token_obj.address)
 
         try:
@@ -183,14 +516,18 @@ class ModuleBase:
         :param token_contract:
         :return:
         """
+        wallet_snapshot = self.get_loaded_wallet_snapshot(wallet_address=wallet_address)
+        if wallet_snapshot is not None:
+            return wallet_snapshot.is_coin_registered(token_contract)
+
         try:
-            is_registered = self.client.account_resource(
+            self.client.account_resource(
                 wallet_address,
                 f'0x1::coin::CoinStore<{token_contract}>'
             )
             return True
 
-        except Exception as ex:
+        except ResourceNotFound:
             return False
 
     def register_coin_for_wallet(
@@ -204,22 +541,12 @@ class ModuleBase:
         :param token_obj:
         :return:
         """
-        payload = EntryFunction.natural(
-            f"0x1::managed_coin",
-            "register",
-            [TypeTag(StructTag.from_str(token_obj.contract_address))],
-            []
-        )
-        txn_info_message = f"Coin register {token_obj.symbol.upper()} for wallet"
-
-        txn_status = self.simulate_and_send_transfer_type_transaction(
+        return self.simulate_and_send_transfer_type_transaction(
             account=sender_account,
-            txn_payload=payload,
-            txn_info_message=txn_info_message
+            txn_payload=self.get_register_coin_payload(token_obj),
+            txn_info_message=f"Coin register {token_obj.symbol.upper()} for wallet"
         )
 
-        return txn_status
-
     def estimate_transaction(
             self,
             raw_transaction: RawTransaction,
@@ -235,38 +562,8 @@ class ModuleBase:
             transaction=raw_transaction,
             sender=sender_account
         )
-        vm_status = txn_data[0]["vm_status"]
 
-        if txn_data[0]["success"] is True:
-            result = TransactionSimulationResult(
-                result=enums.TransactionStatus.SUCCESS,
-                vm_status=vm_status,
-                gas_used=int(txn_data[0]["gas_used"])
-            )
-        else:
-            result = TransactionSimulationResult(
-                result=enums.TransactionStatus.FAILED,
-                vm_status=vm_status,
-                gas_used=0
-            )
-
-        return result
-
-    def txn_pending_status(self, txn_hash: str) -> bool:
-        """
-        Checks if transaction is pending
-        :param txn_hash:
-        :return:
-        """
-        response = self.client.client.get(f"{self.base_url}/transactions/by_hash/{txn_hash}")
-
-        if response.status_code == 404:
-            return True
-
-        elif response.status_code >= 400:
-            raise Exception(f"Error getting transaction due RPC error: {response.json()}")
-
-        return response.json()["type"] == "pending_transaction"
+        return self.get_simulation_result(txn_data)
 
     def wait_for_receipt(
             self,
@@ -274,41 +571,15 @@ class ModuleBase:
             timeout: int = 60
     ) -> TransactionReceipt:
         """
-        Waits for transaction receipt
+        Waits for transaction receipt, transaction is tracked by receipt tracker shared by all modules
         :param txn_hash:
         :param timeout:
         :return:
         """
-        start_time = time.time()
-        while self.txn_pending_status(txn_hash=txn_hash):
-            if time.time() - start_time > timeout:
-
-                return TransactionReceipt(
-                    status=enums.TransactionStatus.TIME_OUT,
-                    vm_status=None
-                )
-
-            time.sleep(1)
-
-        response = self.client.client.get(f"{self.base_url}/transactions/by_hash/{txn_hash}")
-        vm_status = response.json().get("vm_status")
-        if vm_status is None:
-            time.sleep(5)
-            response = self.client.client.get(f"{self.base_url}/transactions/by_hash/{txn_hash}")
-            vm_status = response.json().get("vm_status")
-
-        if response.json().get("success") is True:
-            receipt = TransactionReceipt(
-                status=enums.TransactionStatus.SUCCESS,
-                vm_status=vm_status
-            )
-        else:
-            receipt = TransactionReceipt(
-                status=enums.TransactionStatus.FAILED,
-                vm_status=vm_status
-            )
+        tracker = ReceiptTracker.get_tracker(self.base_url, self.proxies)
+        txn_data = tracker.wait(txn_hash, timeout=timeout, node_url=self.client.node_url)
 
-        return receipt
+        return self.get_receipt_from_transaction(txn_data)
 
     def get_token_reserve(
             self,
@@ -316,7 +587,23 @@ class ModuleBase:
             payload: str
     ) -> Union[dict, None]:
         """
-        Gets token reserve
+        Gets token reserve, shared by wallets of the current task window
+        :param resource_address:
+        :param payload:
+        :return:
+        """
+        return SharedTaskStorage().get_or_fetch(
+            key=("token_reserve", str(resource_address), payload),
+            fetch=lambda: self.fetch_token_reserve(resource_address=resource_address, payload=payload)
+        )
+
+    def fetch_token_reserve(
+            self,
+            resource_address: AccountAddress,
+            payload: str
+    ) -> Union[dict, None]:
+        """
+        Fetches token reserve from chain
         :param resource_address:
         :param payload:
         :return:
@@ -328,34 +615,63 @@ class ModuleBase:
             )
             return data
 
-        except Exception as e:
+        except Exception:
             return None
 
-    def build_raw_transaction(
+    def build_transaction(
             self,
             account: Account,
             payload: EntryFunction,
             gas_limit: int,
             gas_price: int
-    ) -> RawTransaction:
+    ) -> TransactionBuilder:
         """
-        Builds raw transaction
+        Builds transaction with allocated sequence number of account
         :param account:
         :param payload:
         :param gas_limit:
         :param gas_price:
         :return:
         """
-        raw_transaction = RawTransaction(
-            sender=account.address(),
-            sequence_number=self.client.account_sequence_number(account.address()),
-            payload=TransactionPayload(payload),
-            max_gas_amount=gas_limit,
-            gas_unit_price=gas_price,
-            expiration_timestamps_secs=int(time.time()) + 600,
-            chain_id=1
+        return TransactionBuilder(
+            account=account,
+            payload=payload,
+            gas_limit=gas_limit,
+            gas_price=gas_price,
+            sequence_number=self.client.get_next_sequence_number(account.address(), allocate=True),
+            chain_id=self.client.chain_id
         )
-        return raw_transaction
+
+    def simulate_transaction(self, transaction: TransactionBuilder) -> TransactionSimulationResult:
+        """
+        Simulates transaction, sets simulation result to it
+        :param transaction:
+        :return:
+        """
+        address = transaction.account.address()
+        simulation_result = self.estimate_transaction(
+            raw_transaction=transaction.raw_transaction,
+            sender_account=transaction.account
+        )
+
+        if self.is_simulation_sequence_number_error(simulation_result):
+            if self.is_sequence_number_too_old(simulation_result):
+                self.client.resync_sequence_number(address)
+                transaction.set_sequence_number(self.client.get_next_sequence_number(address, allocate=True))
+                raw_transaction = transaction.raw_transaction
+            else:
+                raw_transaction = transaction.get_raw_transaction(
+                    sequence_number=self.client.fetch_sequence_number(address)
+                )
+
+            simulation_result = self.estimate_transaction(
+                raw_transaction=raw_transaction,
+                sender_account=transaction.account
+            )
+
+        transaction.simulation_result = simulation_result
+
+        return simulation_result
 
     def prebuild_payload_and_estimate_transaction(
             self,
@@ -363,29 +679,24 @@ class ModuleBase:
             account: Account,
             gas_limit: int,
             gas_price: int
-    ) -> TransactionSimulationResult:
+    ) -> TransactionBuilder:
         """
         Prebuilds payload and estimates transaction
         :param txn_payload:
         :param account:
         :param gas_limit:
         :param gas_price:
-        :return:
+        :return: transaction with simulation result, it's signed and submitted as is after gas adjustment
         """
-        raw_transaction = self.build_raw_transaction(
+        transaction = self.build_transaction(
             account=account,
             payload=txn_payload,
             gas_limit=gas_limit,
             gas_price=gas_price
         )
-        ClientConfig.max_gas_amount = int(gas_limit)
+        self.simulate_transaction(transaction)
 
-        simulation_result = self.estimate_transaction(
-            raw_transaction=raw_transaction,
-            sender_account=account
-        )
-
-        return simulation_result
+        return transaction
 
     def send_txn(self):
         """
@@ -404,38 +715,62 @@ class ModuleBase:
         :return:
         """
         result: ModuleExecutionResult = self.module_execution_result
-
-        if not isinstance(retries, int):
-            logger.error(f"Retries must be an integer, got {retries}, setting to 1")
-            retries = 1
+        retries = self.get_retries(retries)
 
         for i in range(retries):
             logger.info(f"Attempt {i + 1}/{retries}")
 
             result = self.send_txn()
 
-            if self.task.test_mode is True:
+            if self.is_final_attempt_result(result):
                 return result
 
             if result.execution_status == enums.ModuleExecutionStatus.RETRY:
                 continue
 
-            if (result.execution_status == enums.ModuleExecutionStatus.SUCCESS or
-                    result.execution_status == enums.ModuleExecutionStatus.SENT):
-                return result
-
-            time.sleep(1)
+            time.sleep(default_retry_policy.get_delay(attempt=i))
         else:
             logger.error(f"Failed to send txn after {retries} attempts")
             return result
 
-    def submit_bcs_transaction(self, signed_transaction):
+    def submit_transaction(self, transaction: TransactionBuilder) -> Union[str, None]:
+        """
+        Signs and submits transaction.
+        Transaction rejected by sequence number is signed again with number fetched from node.
+        :param transaction:
+        :return: transaction hash, None if submission failed
+        """
+        address = transaction.account.address()
+
+        for attempt in range(2):
+            signed_transaction = transaction.sign()
+
+            # Wallet state changes after submit, next balance reads go to node
+            self.wallet_snapshot = None
+            try:
+                return self.client.submit_bcs_transaction(signed_transaction)
+
+            except ApiError as e:
+                if not self.is_submission_retried(transaction, e):
+                    return None
+
+            transaction.set_sequence_number(self.client.get_next_sequence_number(address, allocate=True))
+
+        return None
+
+    def get_gas_price(self) -> int:
+        """
+        Gets gas unit price by task gas price policy, task gas price is used if estimate is not available
+        :return:
+        """
+        if self.is_gas_price_fixed():
+            return self.get_task_gas_price()
+
         try:
-            tx_hash = self.client.submit_bcs_transaction(signed_transaction)
-            return tx_hash
-        except ApiError as e:
-            logger.error(f"ApiError: {e}")
-            return None
+            return self.get_gas_price_from_estimate(self.client.gas_price_estimate())
+
+        except Exception as e:
+            return self.get_task_gas_price(error=e)
 
     def simulate_and_send_transfer_type_transaction(
             self,
@@ -453,88 +788,45 @@ class ModuleBase:
         if txn_info_message:
             logger.warning(f"Action: {txn_info_message}")
 
-        simulation_status = self.prebuild_payload_and_estimate_transaction(
-            account=account,
-            txn_payload=txn_payload,
-            gas_limit=int(self.task.gas_limit),
-            gas_price=int(self.task.gas_price)
-        )
+        gas_price = self.get_gas_price()
+        trusted_gas_used = self.get_trusted_gas_used(txn_payload)
 
-        if simulation_status.result == enums.TransactionStatus.FAILED:
-            err_msg = f"Transaction simulation failed. Status: {simulation_status.vm_status}"
-            logger.error(err_msg)
-            self.module_execution_result.execution_status = enums.ModuleExecutionStatus.FAILED.value
-            self.module_execution_result.execution_info = err_msg
-            return self.module_execution_result
-
-        logger.success(f"Transaction simulation success. Gas used: {simulation_status.gas_used}")
-
-        if self.task.forced_gas_limit is True:
-            gas_limit = int(self.task.gas_limit)
-        else:
-            if int(simulation_status.gas_used) <= 200:
-                gas_limit = int(int(simulation_status.gas_used) * 2)
-            else:
-                gas_limit = int(int(simulation_status.gas_used) * 1.15)
-
-        self.client.client_config.max_gas_amount = gas_limit
-
-        if self.task.test_mode is True:
-            logger.info(f"Test mode enabled. Skipping transaction")
-            return self.module_execution_result
-
-        signed_transaction = self.client.create_bcs_signed_transaction(
-            sender=account,
-            payload=TransactionPayload(txn_payload)
-        )
-        tx_hash = self.submit_bcs_transaction(signed_transaction=signed_transaction)
-        if tx_hash is None:
-            err_msg = f"Transaction submission failed"
-            logger.error(err_msg)
-            self.module_execution_result.execution_status = enums.ModuleExecutionStatus.FAILED.value
-            self.module_execution_result.execution_info = err_msg
-            return self.module_execution_result
-
-        if self.task.wait_for_receipt is True:
-            logger.info(
-                f"Txn sent. Waiting for receipt (Timeout in {self.task.txn_wait_timeout_sec}s)."
-                f" Txn Hash: {tx_hash}"
+        if trusted_gas_used is None:
+            transaction = self.prebuild_payload_and_estimate_transaction(
+                account=account,
+                txn_payload=txn_payload,
+                gas_limit=int(self.task.gas_limit),
+                gas_price=gas_price
             )
-            txn_receipt = self.wait_for_receipt(
-                txn_hash=tx_hash,
-                timeout=self.task.txn_wait_timeout_sec
+            failed_result = self.apply_simulation_result(transaction, txn_payload)
+            if failed_result is not None:
+                return failed_result
+        else:
+            transaction = self.build_transaction(
+                account=account,
+                payload=txn_payload,
+                gas_limit=self.get_gas_limit_from_simulation(trusted_gas_used),
+                gas_price=gas_price
             )
 
-            if txn_receipt.status == enums.TransactionStatus.SUCCESS:
-                msg = f"Transaction success, vm status: {txn_receipt.vm_status}. Txn Hash: {tx_hash}"
-                logger.success(msg)
-                self.module_execution_result.execution_status = enums.ModuleExecutionStatus.SUCCESS.value
-                self.module_execution_result.execution_info = msg
-                self.module_execution_result.hash = tx_hash
-                return self.module_execution_result
+        unsent_result = self.get_unsent_result(transaction)
+        if unsent_result is not None:
+            return unsent_result
 
-            elif txn_receipt.status == enums.TransactionStatus.FAILED:
-                msg = f"Transaction failed, vm status: {txn_receipt.vm_status}. Txn Hash: {tx_hash}"
-                logger.error(msg)
-                self.module_execution_result.execution_status = enums.ModuleExecutionStatus.FAILED.value
-                self.module_execution_result.execution_info = msg
-                self.module_execution_result.hash = tx_hash
+        tx_hash = self.submit_transaction(transaction)
+        if tx_hash is None:
+            return self.get_submission_failed_result()
 
-            elif txn_receipt.status == enums.TransactionStatus.TIME_OUT:
-                msg = f"Transaction timeout, vm status: {txn_receipt.vm_status}. Txn Hash: {tx_hash}"
-                logger.error(msg)
-                self.module_execution_result.execution_status = enums.ModuleExecutionStatus.TIME_OUT.value
-                self.module_execution_result.execution_info = msg
-                self.module_execution_result.hash = tx_hash
+        if self.task.wait_for_receipt is not True:
+            return self.get_sent_result(tx_hash)
 
-        else:
-            msg = f"Transaction sent. Txn Hash: {tx_hash}"
-            logger.success(msg)
-            self.module_execution_result.execution_status = enums.ModuleExecutionStatus.SENT.value
-            self.module_execution_result.execution_info = msg
-            self.module_execution_result.hash = tx_hash
+        self.log_receipt_wait(tx_hash)
+        txn_receipt = self.wait_for_receipt(
+            txn_hash=tx_hash,
+            timeout=self.task.txn_wait_timeout_sec
+        )
 
-        return self.module_execution_result
+        return self.get_receipt_result(account, txn_payload, tx_hash, txn_receipt)
 
 
 class SwapModuleBase(ModuleBase):
@@ -560,6 +852,7 @@ class SwapModuleBase(ModuleBase):
             self.coin_x = self.tokens.get_by_name(self.task.coin_x)
             self.coin_y = self.tokens.get_by_name(self.task.coin_y)
 
+            self.get_wallet_snapshot(wallet_address=self.account.address())
             self.initial_balance_x_wei = self.get_wallet_token_balance(
                 wallet_address=self.account.address(),
                 token_address=self.coin_x.contract_address
@@ -642,7 +935,6 @@ class SwapModuleBase(ModuleBase):
         :return:
         """
 
-        self.task: 'SwapTaskBase'
         module_name = self.task.module_name.title()
 
         out_decimals = txn_payload_data.amount_x_decimals
@@ -717,6 +1009,7 @@ class LiquidityModuleBase(ModuleBase):
             self.coin_x = self.tokens.get_by_name(self.task.coin_x)
             self.coin_y = self.tokens.get_by_name(self.task.coin_y)
 
+            self.get_wallet_snapshot(wallet_address=self.account.address())
             self.initial_balance_x_wei = self.get_wallet_token_balance(
                 wallet_address=self.account.address(),
                 token_address=self.coin_x.contract_address
@@ -739,6 +1032,7 @@ class LiquidityModuleBase(ModuleBase):
             return False
 
     def fetch_local_tokens_data(self):
+        self.get_wallet_snapshot(wallet_address=self.account.address())
         self.initial_balance_x_wei = self.get_wallet_token_balance(
             wallet_address=self.account.address(),
             token_address=self.coin_x.contract_address
@@ -0,0 +1,264 @@
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from modules.liquid_swap.stable_math import FEE_SCALE
+from modules.liquid_swap.stable_math import ONE_E_8
+from modules.liquid_swap.stable_math import get_y
+from modules.liquid_swap.stable_math import lp_value
+
+
+INT64_MAX = np.iinfo(np.int64).max
+UINT64_MAX = np.iinfo(np.uint64).max
+LOW_32_MASK = np.uint64(0xFFFFFFFF)
+
+# Float64 estimate of a quotient below 2 ** 50 is off by one at most,
+# remainder of a divisor below 2 ** 61 then fits int64
+MAX_MUL_DIV_QUOTIENT = 2 ** 50
+MAX_MUL_DIV_DIVISOR = 2 ** 61
+
+Amounts = Union[np.ndarray, Sequence[int]]
+
+
+class ReserveSnapshot:
+    """
+    Pool reserves read once and shared by all quotes of a batch.
+    Stable curve values that depend only on reserves are computed on first stable quote.
+    """
+
+    def __init__(
+            self,
+            reserve_in: int,
+            reserve_out: int,
+            fee: int = 0,
+            scale_in: int = 1,
+            scale_out: int = 1
+    ):
+        self.reserve_in = int(reserve_in)
+        self.reserve_out = int(reserve_out)
+        self.fee = int(fee)
+        self.scale_in = int(scale_in)
+        self.scale_out = int(scale_out)
+
+        self.__stable_curve: Union[Tuple[int, int, int], None] = None
+
+    @property
+    def stable_curve(self) -> Tuple[int, int, int]:
+        """
+        Stable curve value and reserves scaled to 1e8
+        :return: (xy, reserve in scaled, reserve out scaled)
+        """
+        if self.__stable_curve is None:
+            self.__stable_curve = (
+                lp_value(self.reserve_in, self.scale_in, self.reserve_out, self.scale_out),
+                self.reserve_in * ONE_E_8 // self.scale_in,
+                self.reserve_out * ONE_E_8 // self.scale_out
+            )
+
+        return self.__stable_curve
+
+
+def is_int64_safe(*max_values: int) -> bool:
+    """
+    Checks if largest operands of formula fit int64
+    :param max_values:
+    :return:
+    """
+    return all(0 <= int(value) <= INT64_MAX for value in max_values)
+
+
+def get_amounts_array(amounts: Amounts, int64: bool) -> np.ndarray:
+    """
+    Builds amounts array, object array of python ints is exact for any value
+    :param amounts:
+    :param int64: int64 array if formula is checked to fit
+    :return:
+    """
+    if int64:
+        return np.asarray(amounts, dtype=np.int64)
+
+    return np.array([int(amount) for amount in amounts], dtype=object)
+
+
+def get_amounts_range(amounts: Amounts) -> Tuple[int, int]:
+    if len(amounts) == 0:
+        return 0, 0
+
+    if isinstance(amounts, np.ndarray) and amounts.dtype != object:
+        return int(amounts.min()), int(amounts.max())
+
+    # Python ints above int64 would be turned to float64 by numpy
+    return min(int(amount) for amount in amounts), max(int(amount) for amount in amounts)
+
+
+def mul_div(a: np.ndarray, b: int, c: np.ndarray) -> Union[np.ndarray, None]:
+    """
+    floor(a * b / c) of int64 lanes whose product a * b exceeds int64.
+    Quotient is estimated in float64 and corrected by the exact remainder: a * b - q * c is small,
+    so it is exact when both products wrap modulo 2 ** 64 in uint64.
+    :param a: non-negative int64 array
+    :param b: non-negative int64 value
+    :param c: positive int64 array
+    :return: None if operands are out of range of the estimate, callers fall back to python ints
+    """
+    if a.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if not is_int64_safe(b) or c.min() <= 0 or c.max() > MAX_MUL_DIV_DIVISOR:
+        return None
+
+    estimate = np.floor(a.astype(np.float64) * float(b) / c.astype(np.float64))
+    if estimate.max() > MAX_MUL_DIV_QUOTIENT:
+        return None
+
+    quotient = estimate.astype(np.int64)
+    with np.errstate(over="ignore"):
+        remainder = (
+                a.view(np.uint64) * np.uint64(b) - quotient.view(np.uint64) * c.view(np.uint64)
+        ).view(np.int64)
+
+        # Estimate is off by one at most, second step is kept for rounding of both products
+        for _ in range(2):
+            is_below = remainder < 0
+            quotient -= is_below
+            remainder += c * is_below
+
+            is_above = remainder >= c
+            quotient += is_above
+            remainder -= c * is_above
+
+    if remainder.min() < 0 or (remainder >= c).any():
+        return None
+
+    return quotient
+
+
+def mul_shr_64(a: np.ndarray, b: int) -> np.ndarray:
+    """
+    (a * b) >> 64 of uint64 lanes, 128 bit product is taken from 32 bit halves
+    :param a: uint64 array
+    :param b: uint64 value
+    :return:
+    """
+    a_low, a_high = a & LOW_32_MASK, a >> np.uint64(32)
+    b_low, b_high = np.uint64(b & 0xFFFFFFFF), np.uint64(b >> 32)
+
+    low_low = a_low * b_low
+    high_low = a_high * b_low
+    low_high = a_low * b_high
+    high_high = a_high * b_high
+
+    # Sum of 32 bit parts and a product of 32 bit halves fits uint64
+    cross = (low_low >> np.uint64(32)) + (high_low & LOW_32_MASK) + low_high
+
+    return high_high + (high_low >> np.uint64(32)) + (cross >> np.uint64(32))
+
+
+def get_coins_out_with_fees_batch(amounts_in: Amounts, snapshot: ReserveSnapshot) -> np.ndarray:
+    """
+    LiquidSwap uncorrelated pool amounts out, batch version of liquid_swap.math.get_coins_out_with_fees
+    :param amounts_in:
+    :param snapshot: fee of FEE_SCALE
+    :return:
+    """
+    fee_multiplier = FEE_SCALE - (snapshot.fee + 1)
+    min_amount, max_amount = get_amounts_range(amounts_in)
+    reserve_in_scaled = snapshot.reserve_in * FEE_SCALE
+
+    if is_int64_safe(min_amount, reserve_in_scaled + max_amount * fee_multiplier):
+        coin_in_after_fees = get_amounts_array(amounts_in, int64=True) * fee_multiplier
+        amounts_out = mul_div(coin_in_after_fees, snapshot.reserve_out, reserve_in_scaled + coin_in_after_fees)
+        if amounts_out is not None:
+            return amounts_out
+
+    coin_in_after_fees = get_amounts_array(amounts_in, int64=False) * fee_multiplier
+
+    return coin_in_after_fees * snapshot.reserve_out // (reserve_in_scaled + coin_in_after_fees)
+
+
+def get_amount_in_batch(amounts_out: Amounts, snapshot: ReserveSnapshot) -> np.ndarray:
+    """
+    PancakeSwap amounts, batch version of pancake.math.get_amount_in
+    :param amounts_out:
+    :param snapshot: reserve in is reserve x, reserve out is reserve y
+    :return:
+    """
+    min_amount, max_amount = get_amounts_range(amounts_out)
+    reserve_in_scaled = snapshot.reserve_in * 10000
+
+    if is_int64_safe(min_amount, reserve_in_scaled + max_amount * 9975):
+        amount_in_with_fee = get_amounts_array(amounts_out, int64=True) * 9975
+        amounts_in = mul_div(amount_in_with_fee, snapshot.reserve_out, reserve_in_scaled + amount_in_with_fee)
+        if amounts_in is not None:
+            return amounts_in
+
+    amount_in_with_fee = get_amounts_array(amounts_out, int64=False) * 9975
+
+    return amount_in_with_fee * snapshot.reserve_out // (reserve_in_scaled + amount_in_with_fee)
+
+
+def get_pair_amount_in_batch(lp_ratios: Amounts, snapshot: ReserveSnapshot) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Thala pair amounts, batch version of thala.math.get_pair_amount_in
+    :param lp_ratios: FixedPoint64 values of lp ratios
+    :param snapshot: reserve in is lp balance x, reserve out is lp balance y
+    :return: amounts x and amounts y
+    """
+    min_ratio, max_ratio = get_amounts_range(lp_ratios)
+
+    if 0 <= min_ratio and max_ratio <= UINT64_MAX and is_int64_safe(snapshot.reserve_in, snapshot.reserve_out):
+        # Amounts are not larger than reserves while ratios are below 1.0, so they fit int64
+        ratios = np.asarray(lp_ratios, dtype=np.uint64)
+        amounts_x = mul_shr_64(ratios, snapshot.reserve_in).astype(np.int64)
+        amounts_y = mul_shr_64(ratios, snapshot.reserve_out).astype(np.int64)
+    else:
+        ratios = get_amounts_array(lp_ratios, int64=False)
+        amounts_x = (ratios * snapshot.reserve_in) >> 64
+        amounts_y = (ratios * snapshot.reserve_out) >> 64
+
+    if (amounts_x > snapshot.reserve_in).any() or (amounts_y > snapshot.reserve_out).any():
+        raise ValueError("Extraction amount exceeds available asset value")
+
+    return amounts_x, amounts_y
+
+
+def get_coins_out_with_fees_stable_batch(amounts_in: Amounts, snapshot: ReserveSnapshot) -> np.ndarray:
+    """
+    LiquidSwap stable pool amounts out, batch version of liquid_swap.stable_math.get_coins_out_with_fees_stable.
+    Curve values take ~170 bits and don't fit fixed width lanes, amounts are quoted one by one with python ints,
+    only curve values of the snapshot are shared.
+    :param amounts_in:
+    :param snapshot: fee of FEE_SCALE
+    :return: object array
+    """
+    xy, reserve_in_scaled, reserve_out_scaled = snapshot.stable_curve
+
+    amounts_out = []
+    for amount_in in amounts_in:
+        coin_in_val_after_fees = -(-int(amount_in) * (FEE_SCALE - snapshot.fee) // FEE_SCALE)
+        total_reserve = coin_in_val_after_fees * ONE_E_8 // snapshot.scale_in + reserve_in_scaled
+
+        y = reserve_out_scaled - get_y(total_reserve, xy, reserve_out_scaled)
+        amounts_out.append(y * snapshot.scale_out // ONE_E_8)
+
+    return np.array(amounts_out, dtype=object)
+
+
+def get_coins_in_with_fees_stable_batch(amounts_out: Amounts, snapshot: ReserveSnapshot) -> np.ndarray:
+    """
+    LiquidSwap stable pool amounts in, batch version of liquid_swap.stable_math.get_coins_in_with_fees_stable
+    :param amounts_out:
+    :param snapshot: reserve in is reserve of coin paid, fee of FEE_SCALE
+    :return: object array
+    """
+    xy, reserve_in_scaled, reserve_out_scaled = snapshot.stable_curve
+
+    amounts_in = []
+    for amount_out in amounts_out:
+        total_reserve = reserve_out_scaled - int(amount_out) * ONE_E_8 // snapshot.scale_out
+
+        x = get_y(total_reserve, xy, reserve_in_scaled) - reserve_in_scaled
+        amount_in = x * snapshot.scale_in // ONE_E_8 + 1
+        amounts_in.append(amount_in * FEE_SCALE // (FEE_SCALE - snapshot.fee) + 1)
+
+    return np.array(amounts_in, dtype=object)
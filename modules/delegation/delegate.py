@@ -39,6 +39,7 @@ class Delegate(ModuleBase):
         self.coin_x = Tokens().get_by_name("Aptos")
 
     def build_transaction_payload(self) -> Union[TransactionPayloadData, None]:
+        self.get_wallet_snapshot(wallet_address=self.account.address())
         wallet_token_balance_wei = self.get_wallet_token_balance(
             wallet_address=self.account.address(),
             token_address=self.coin_x.contract_address
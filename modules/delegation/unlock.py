@@ -2,8 +2,11 @@ from typing import Union, TYPE_CHECKING
 
 from aptos_sdk.transactions import EntryFunction, TransactionArgument, Serializer
 from aptos_sdk.account import Account, AccountAddress
+from aptos_sdk.client import ApiError
 from loguru import logger
 
+from aptos_rest_client import ViewCall
+from aptos_rest_client import ViewArgument
 from modules.base import ModuleBase
 from contracts.tokens.main import Tokens
 from src import enums
@@ -43,23 +46,22 @@ class Unlock(ModuleBase):
             wallet_address: AccountAddress,
             validator_address: AccountAddress
     ) -> Union[int, None]:
-        url = f"{self.base_url}/view"
-        payload = {
-            "function": "0x1::delegation_pool::get_stake",
-            "type_arguments": [],
-            "arguments": [
-                str(validator_address),
-                str(wallet_address)
-            ],
-        }
-        response = self.client.client.post(url=url, json=payload)
-        if response.status_code != 200:
-            logger.error(f"Error getting current staked balance: {response.text}")
-            return None
+        call = ViewCall(
+            function="0x1::delegation_pool::get_stake",
+            arguments=[
+                ViewArgument(validator_address, "address"),
+                ViewArgument(wallet_address, "address")
+            ]
+        )
+        try:
+            # Active stake is unlocked, so it's read from node to not take a stale amount
+            result = self.client.view(call, ttl=0)
 
-        response_json = response.json()
+        except ApiError as e:
+            logger.error(f"Error getting current staked balance: {e}")
+            return None
 
-        return int(response_json[0])
+        return int(result[0])
 
     def build_transaction_payload(self) -> Union[TransactionPayloadData, None]:
         validator_address = AccountAddress.from_hex(self.task.validator_address)
@@ -81,7 +81,8 @@ class LiquidityBase(LiquidityModuleBase):
     ):
         token_info = self.client.account_resource(
             AccountAddress.from_hex("0x05a97986a9d031c4567e15b797be516910cfcb4156312482efc6a19c0a30c948"),
-            f"0x1::coin::CoinInfo<{lp_token_address}>"
+            f"0x1::coin::CoinInfo<{lp_token_address}>",
+            cache=False
         )
         lp_supply = token_info.get("data").get("supply").get("vec")[0].get("integer").get("vec")[0].get("value")
 
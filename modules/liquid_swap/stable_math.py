@@ -0,0 +1,185 @@
+# LiquidSwap stable curve (x^3 * y + x * y^3 = k) as liquidswap::stable_curve and router compute it,
+# Move u256 operations are python int operations with floor division, no shared Decimal context is used
+ONE_E_8 = 10 ** 8
+FEE_SCALE = 10000
+
+
+def lp_value(
+        x_coin: int,
+        x_scale: int,
+        y_coin: int,
+        y_scale: int
+) -> int:
+    """
+    Calculate the liquidity pool value
+    :param x_coin:
+    :param x_scale:
+    :param y_coin:
+    :param y_scale:
+    :return:
+    """
+    x = x_coin * ONE_E_8 // x_scale
+    y = y_coin * ONE_E_8 // y_scale
+    a = x * y
+    b = x * x + y * y
+
+    return a * b
+
+
+def d(
+        x0: int,
+        y: int
+) -> int:
+    """
+    Calculate the derivative of curve by y
+    :param x0:
+    :param y:
+    :return:
+    """
+    return 3 * x0 * (y * y) + x0 * (x0 * x0)
+
+
+def f(
+        x0: int,
+        y: int
+) -> int:
+    """
+    Calculate the curve value
+    :param x0:
+    :param y:
+    :return:
+    """
+    return x0 * (y * (y * y)) + x0 * (x0 * x0) * y
+
+
+def get_y(
+        x0: int,
+        xy: int,
+        y: int
+) -> int:
+    """
+    Calculate the y value by Newton's method
+    :param x0:
+    :param xy:
+    :param y: initial value
+    :return:
+    """
+    for _ in range(255):
+        k = f(x0, y)
+
+        if k < xy:
+            dy = (xy - k) // d(x0, y) + 1
+            y += dy
+        else:
+            dy = (k - xy) // d(x0, y)
+            y -= dy
+
+        if dy <= 1:
+            return y
+
+    return y
+
+
+def coin_out(
+        coin_in: int,
+        scale_in: int,
+        scale_out: int,
+        reserve_in: int,
+        reserve_out: int
+) -> int:
+    """
+    Calculate the amount of coin out
+    :param coin_in:
+    :param scale_in:
+    :param scale_out:
+    :param reserve_in:
+    :param reserve_out:
+    :return:
+    """
+    xy = lp_value(reserve_in, scale_in, reserve_out, scale_out)
+
+    reserve_in_scaled = reserve_in * ONE_E_8 // scale_in
+    reserve_out_scaled = reserve_out * ONE_E_8 // scale_out
+    amount_in = coin_in * ONE_E_8 // scale_in
+
+    total_reserve = amount_in + reserve_in_scaled
+    y = reserve_out_scaled - get_y(total_reserve, xy, reserve_out_scaled)
+
+    return y * scale_out // ONE_E_8
+
+
+def coin_in(
+        coin_out: int,
+        scale_out: int,
+        scale_in: int,
+        reserve_out: int,
+        reserve_in: int
+) -> int:
+    """
+    Calculate the amount of coin in
+    :param coin_out:
+    :param scale_out:
+    :param scale_in:
+    :param reserve_out:
+    :param reserve_in:
+    :return:
+    """
+    xy = lp_value(reserve_in, scale_in, reserve_out, scale_out)
+
+    reserve_in_scaled = reserve_in * ONE_E_8 // scale_in
+    reserve_out_scaled = reserve_out * ONE_E_8 // scale_out
+    amount_out = coin_out * ONE_E_8 // scale_out
+
+    total_reserve = reserve_out_scaled - amount_out
+    x = get_y(total_reserve, xy, reserve_in_scaled) - reserve_in_scaled
+
+    return x * scale_in // ONE_E_8
+
+
+def get_coins_out_with_fees_stable(
+        coin_in: int,
+        reserve_in: int,
+        reserve_out: int,
+        scale_in: int,
+        scale_out: int,
+        fee: int
+) -> int:
+    """
+    Calculate the amount of coin out of stable pool, fee is taken from coin in and rounded up as router does
+    :param coin_in:
+    :param reserve_in:
+    :param reserve_out:
+    :param scale_in:
+    :param scale_out:
+    :param fee: pool fee of FEE_SCALE
+    :return:
+    """
+    coin_in_val_scaled = coin_in * (FEE_SCALE - fee)
+    coin_in_val_after_fees = coin_in_val_scaled // FEE_SCALE
+    if coin_in_val_scaled % FEE_SCALE != 0:
+        coin_in_val_after_fees += 1
+
+    return coin_out(coin_in_val_after_fees, scale_in, scale_out, reserve_in, reserve_out)
+
+
+def get_coins_in_with_fees_stable(
+        coin_out: int,
+        reserve_out: int,
+        reserve_in: int,
+        scale_out: int,
+        scale_in: int,
+        fee: int
+) -> int:
+    """
+    Calculate the amount of coin in to get coin out of stable pool, fee is added as router does
+    :param coin_out:
+    :param reserve_out:
+    :param reserve_in:
+    :param scale_out:
+    :param scale_in:
+    :param fee: pool fee of FEE_SCALE
+    :return:
+    """
+    amount_in = coin_in(coin_out, scale_out, scale_in, reserve_out, reserve_in) + 1
+
+    return amount_in * FEE_SCALE // (FEE_SCALE - fee) + 1
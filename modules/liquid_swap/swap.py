@@ -15,7 +15,7 @@ from utils.delay import get_delay
 from src.schemas.action_models import TransactionPayloadData
 from src.schemas.action_models import ModuleExecutionResult
 from src import enums
-from modules.liquid_swap.math import get_coins_out_with_fees_stable
+from modules.liquid_swap.stable_math import get_coins_out_with_fees_stable
 from modules.liquid_swap.math import get_coins_out_with_fees
 from modules.liquid_swap.math import d
 
@@ -113,17 +113,15 @@ class LiquidSwapSwap(SwapModuleBase):
 
         pool_fee = int(self.resource_data["data"]["fee"])
 
-        amount_in = get_coins_out_with_fees_stable(
-            coin_in=d(amount_out),
-            reserve_in=d(reserve_x),
-            reserve_out=d(reserve_y),
-            scale_in=d(pow(10, coin_x_decimals)),
-            scale_out=d(pow(10, coin_y_decimals)),
-            fee=d(pool_fee)
+        return get_coins_out_with_fees_stable(
+            coin_in=int(amount_out),
+            reserve_in=reserve_x,
+            reserve_out=reserve_y,
+            scale_in=10 ** int(coin_x_decimals),
+            scale_out=10 ** int(coin_y_decimals),
+            fee=pool_fee
         )
 
-        return int(amount_in)
-
     def get_amount_in_uncorrelated_pool(
             self,
             amount_out: int,
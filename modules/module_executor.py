@@ -1,5 +1,6 @@
-import time
+import asyncio
 from datetime import datetime
+from typing import Union
 
 from aptos_sdk.account import Account
 from loguru import logger
@@ -13,11 +14,12 @@ from src.storage import Storage
 from src.storage import ActionStorage
 from src.action_logger import ActionLogger
 from src.proxy_manager import ProxyManager
+from aptos_rest_client.http_pool import HttpPool
+from modules.async_base import AsyncModuleBase
 
 from utils.repr.module import print_module_config
 
 from src import enums
-import config as cfg
 
 
 class ModuleExecutor:
@@ -39,31 +41,67 @@ class ModuleExecutor:
         self.app_config = self.storage.app_config
 
         self.wallet_data = wallet
+        self.execution_result: Union[ModuleExecutionResult, None] = None
+
+    @property
+    def is_async_module(self) -> bool:
+        module = self.task.module
+        return isinstance(module, type) and issubclass(module, AsyncModuleBase)
 
     def start(self) -> bool:
         print_module_config(task=self.task)
-        time.sleep(cfg.DEFAULT_DELAY_SEC)
 
         if not self.app_config.rpc_url:
             logger.error("Please, set RPC URL in tools window or app_config.json file")
             return False
 
+        if self.is_async_module:
+            return asyncio.run(self.execute_module_in_new_loop(
+                wallet_data=self.wallet_data, base_url=self.app_config.rpc_url
+            ))
+
         execute_status = self.execute_module(
             wallet_data=self.wallet_data, base_url=self.app_config.rpc_url
         )
 
         return execute_status
 
+    async def start_async(self) -> bool:
+        """
+        Same as start, but awaits async modules on the running loop,
+        sync modules are moved to the loop executor.
+        """
+        print_module_config(task=self.task)
+
+        if not self.app_config.rpc_url:
+            logger.error("Please, set RPC URL in tools window or app_config.json file")
+            return False
+
+        if not self.is_async_module:
+            return await asyncio.to_thread(
+                self.execute_module,
+                wallet_data=self.wallet_data,
+                base_url=self.app_config.rpc_url
+            )
 
+        execute_status = await self.execute_module_async(
+            wallet_data=self.wallet_data, base_url=self.app_config.rpc_url
+        )
 
-    def execute_module(
+        return execute_status
+
+    def prepare_action_log(
             self,
             wallet_data: WalletData,
-            base_url: str
-    ) -> bool:
+            proxy_manager: ProxyManager
+    ) -> Union[WalletActionSchema, None]:
+        """
+        Validates wallet proxy and builds action log data
+        :param wallet_data:
+        :param proxy_manager:
+        :return: action log data, None if proxy is not valid
+        """
         proxy_data = wallet_data.proxy
-        proxy_manager = ProxyManager(proxy_data=proxy_data)
-        proxies = proxy_manager.get_proxy()
 
         action_log_data = WalletActionSchema(
             date_time=datetime.now().strftime("%d-%m-%Y_%H-%M-%S"),
@@ -101,7 +139,7 @@ class ModuleExecutor:
 
                 action_log_data.is_success = False
                 action_log_data.status = err_msg
-                return False
+                return None
 
             else:
                 proxy_set_up_status = True
@@ -113,55 +151,58 @@ class ModuleExecutor:
             if proxy_set_up_status is False:
                 action_logger = ActionLogger()
                 action_logger.log_error(action_data=action_log_data)
-                return False
+                return None
 
         self.action_storage.update_current_action(action_data=action_log_data)
 
-        account = Account.load_key(wallet_data.private_key)
-
-        retries = self.task.retries if self.task.test_mode is False else 1
-
-        execution_status: ModuleExecutionResult
+        return action_log_data
 
-        if self.module_type == enums.ModuleType.TRANSFER:
-            module = self.task.module(
-                account=account,
-                task=self.task,
-                base_url=base_url,
-                proxies=proxies,
-                wallet_data=wallet_data
-            )
-            execution_status = module.try_send_txn(retries=retries)
-
-        elif self.module_name == enums.ModuleName.THE_APTOS_BRIDGE:
-            module = self.task.module(
-                account=account,
-                task=self.task,
-                base_url=base_url,
-                proxies=proxies,
-                wallet_data=wallet_data
-            )
-            execution_status = module.try_send_txn(retries=retries)
-
-        elif self.module_name == enums.ModuleName.NFT_COLLECT:
-            module = self.task.module(
+    def build_module(
+            self,
+            account: Account,
+            wallet_data: WalletData,
+            base_url: str,
+            proxies: Union[dict, None]
+    ):
+        """
+        Creates task module instance
+        :param account:
+        :param wallet_data:
+        :param base_url:
+        :param proxies:
+        :return:
+        """
+        if (
+            self.module_type == enums.ModuleType.TRANSFER
+            or self.module_name == enums.ModuleName.THE_APTOS_BRIDGE
+            or self.module_name == enums.ModuleName.NFT_COLLECT
+        ):
+            return self.task.module(
                 account=account,
                 task=self.task,
                 base_url=base_url,
                 proxies=proxies,
                 wallet_data=wallet_data
             )
-            execution_status = module.try_send_txn(retries=retries)
 
-        else:
-            module = self.task.module(
-                account=account,
-                task=self.task,
-                base_url=base_url,
-                proxies=proxies,
-            )
-            execution_status = module.try_send_txn(retries=retries)
+        return self.task.module(
+            account=account,
+            task=self.task,
+            base_url=base_url,
+            proxies=proxies,
+        )
 
+    def log_execution_result(
+            self,
+            action_log_data: WalletActionSchema,
+            execution_status: ModuleExecutionResult
+    ) -> bool:
+        """
+        Saves execution result to action logs
+        :param action_log_data:
+        :param execution_status:
+        :return: is execution successful
+        """
         if self.task.test_mode is False:
             action_log_data.module_name = self.module_name.value
             action_log_data.module_type = self.module_type.value
@@ -179,3 +220,108 @@ class ModuleExecutor:
             return False
 
         return True
+
+    def get_module_error_result(self, error: Exception) -> ModuleExecutionResult:
+        """
+        Builds failed result of module error, e.g. RPC error while module fetches initial data,
+        so task is completed and logged as failed instead of being left in progress
+        :param error:
+        :return:
+        """
+        err_msg = f"Module error: {error}"
+        logger.error(err_msg)
+        logger.exception(error)
+
+        return ModuleExecutionResult(
+            execution_status=enums.ModuleExecutionStatus.FAILED,
+            execution_info=err_msg
+        )
+
+    def execute_module(
+            self,
+            wallet_data: WalletData,
+            base_url: str
+    ) -> bool:
+        proxy_manager = ProxyManager(proxy_data=wallet_data.proxy)
+        proxies = proxy_manager.get_proxy()
+
+        action_log_data = self.prepare_action_log(wallet_data=wallet_data, proxy_manager=proxy_manager)
+        if action_log_data is None:
+            return False
+
+        account = Account.load_key(wallet_data.private_key)
+
+        retries = self.task.retries if self.task.test_mode is False else 1
+
+        try:
+            module = self.build_module(
+                account=account,
+                wallet_data=wallet_data,
+                base_url=base_url,
+                proxies=proxies
+            )
+            execution_status: ModuleExecutionResult = module.try_send_txn(retries=retries)
+
+        except Exception as e:
+            execution_status = self.get_module_error_result(e)
+
+        self.execution_result = execution_status
+
+        return self.log_execution_result(action_log_data=action_log_data, execution_status=execution_status)
+
+    async def execute_module_in_new_loop(
+            self,
+            wallet_data: WalletData,
+            base_url: str
+    ) -> bool:
+        """
+        Executes async module in a loop created for it, loop connections are closed after
+        """
+        try:
+            return await self.execute_module_async(wallet_data=wallet_data, base_url=base_url)
+        finally:
+            await HttpPool.aclose_loop_transports()
+
+    async def execute_module_async(
+            self,
+            wallet_data: WalletData,
+            base_url: str
+    ) -> bool:
+        proxy_manager = ProxyManager(proxy_data=wallet_data.proxy)
+        proxies = proxy_manager.get_proxy()
+
+        action_log_data = await asyncio.to_thread(
+            self.prepare_action_log,
+            wallet_data=wallet_data,
+            proxy_manager=proxy_manager
+        )
+        if action_log_data is None:
+            return False
+
+        account = Account.load_key(wallet_data.private_key)
+
+        retries = self.task.retries if self.task.test_mode is False else 1
+
+        try:
+            module: AsyncModuleBase = self.build_module(
+                account=account,
+                wallet_data=wallet_data,
+                base_url=base_url,
+                proxies=proxies
+            )
+            try:
+                await module.prepare()
+                execution_status: ModuleExecutionResult = await module.try_send_txn(retries=retries)
+            finally:
+                await module.close()
+
+        except Exception as e:
+            execution_status = self.get_module_error_result(e)
+
+        self.execution_result = execution_status
+
+        return await asyncio.to_thread(
+            self.log_execution_result,
+            action_log_data=action_log_data,
+            execution_status=execution_status
+        )
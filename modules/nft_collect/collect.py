@@ -1,6 +1,5 @@
 import random
 import time
-import json
 from typing import Union, TYPE_CHECKING, List, Callable, Any
 
 from aptos_sdk.transactions import EntryFunction, TransactionArgument, Serializer
@@ -10,6 +9,7 @@ from aptos_sdk.type_tag import StructTag
 from loguru import logger
 
 import config
+from aptos_rest_client.json_codec import get_response_json
 from modules.base import ModuleBase
 from modules.nft_collect import data
 from contracts.tokens.main import Tokens, TokenBase
@@ -67,9 +67,7 @@ class NftCollect(ModuleBase):
                 logger.error(f"Failed while getting collectibles list for wallet")
                 return None
 
-            bytes_data = response.read()
-            string_data = bytes_data.decode('utf-8')
-            data_dict = json.loads(string_data)
+            data_dict = get_response_json(response)
 
             tokens_data: list = data_dict['data']['current_token_ownerships_v2']
 
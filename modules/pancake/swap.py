@@ -9,6 +9,8 @@ from aptos_sdk.type_tag import TypeTag
 from aptos_sdk.type_tag import StructTag
 from loguru import logger
 
+from aptos_rest_client.bcs_resources import BcsResources
+from aptos_rest_client.bcs_resources import PairReserve
 from modules.base import SwapModuleBase
 from utils.delay import get_delay
 from modules.pancake.math import get_amount_in
@@ -21,6 +23,13 @@ if TYPE_CHECKING:
     from src.schemas.tasks import PancakeSwapTask
 
 
+# Pair reserve has fixed layout, it's read as BCS when enabled in app config
+BcsResources.register(
+    "0xc7efb4076dbe143cbcd98cfaaa929ecfc8f299203dfff63b95ccb6bfe19850fa::swap::TokenPairReserve<",
+    PairReserve
+)
+
+
 class PancakeSwap(SwapModuleBase):
     def __init__(
             self,
@@ -42,6 +42,7 @@ class RandomSwap(SwapModuleBase):
             self.coin_x = self.tokens.get_by_name(self.task.coin_x)
             self.coin_y = self.tokens.get_by_name(self.task.coin_y)
 
+            self.get_wallet_snapshot(wallet_address=self.account.address())
             self.initial_balance_x_wei = self.get_wallet_token_balance(
                 wallet_address=self.account.address(),
                 token_address=self.coin_x.contract_address
@@ -9,13 +9,18 @@ from aptos_sdk.transactions import TransactionArgument
 from aptos_sdk.type_tag import TypeTag
 from aptos_sdk.type_tag import StructTag
 from aptos_sdk.client import ResourceNotFound
+from aptos_sdk.client import ApiError
 from httpx import ReadTimeout
 from loguru import logger
 
+from aptos_rest_client import ViewCall
+from aptos_rest_client import ViewArgument
 from modules.base import LiquidityModuleBase
+from aptos_rest_client.json_codec import get_response_json
 from src.schemas.action_models import TransactionPayloadData
 from src.schemas.action_models import ModuleExecutionResult
 from contracts.tokens.main import Tokens
+from src.storage import SharedTaskStorage
 from src import enums
 from utils.delay import get_delay
 from modules.thala.math import Math, get_pair_amount_in
@@ -50,13 +55,19 @@ class ThalaLiquidityBase(LiquidityModuleBase):
         self.task = task
 
     def get_pools_data(self) -> Union[dict, None]:
+        return SharedTaskStorage().get_or_fetch(
+            key=("thala_pools_data",),
+            fetch=self.fetch_pools_data
+        )
+
+    def fetch_pools_data(self) -> Union[dict, None]:
         try:
             request_url = "https://app.thala.fi/api/liquidity-pools"
             response = self.client.client.get(url=request_url)
-            if response.status_code > 304 or not response.json():
+            if response.status_code > 304:
                 return None
 
-            return response.json()
+            return get_response_json(response) or None
 
         except Exception as e:
             logger.error(f"Error while getting pools data: {e}")
@@ -133,10 +144,7 @@ class ThalaLiquidityBase(LiquidityModuleBase):
             logger.error(f"Request timeout")
             return None
 
-        if not response.json():
-            return None
-
-        return response.json()
+        return get_response_json(response) or None
 
 
 class ThalaAddLiquidity(ThalaLiquidityBase):
@@ -163,28 +171,24 @@ class ThalaAddLiquidity(ThalaLiquidityBase):
         if not pool_id:
             pool_id = self.default_lp_stake_pool_id
 
-        response_url = f"{self.base_url}view"
-        payload = {
-            "function": "0x6b3720cd988adeaf721ed9d4730da4324d52364871a68eac62b46d21e4d2fa99"
-                        "::farming::stake_and_reward_amount",
-            "arguments": [
-                str(wallet_address),
-                str(pool_id)
-            ],
-            "type_arguments": [
+        call = ViewCall(
+            function="0x6b3720cd988adeaf721ed9d4730da4324d52364871a68eac62b46d21e4d2fa99"
+                     "::farming::stake_and_reward_amount",
+            type_arguments=[
                 "0x7fd500c11216f0fe3095d0c4b8aa4d64a4e2e04f83758462f2b127255643615::thl_coin::THL"
+            ],
+            arguments=[
+                ViewArgument(wallet_address, "address"),
+                ViewArgument(pool_id, "u64")
             ]
-        }
-        response = self.client.post(
-            url=response_url,
-            json=payload
         )
+        try:
+            return self.client.view(call)
 
-        if response.status_code != 200:
+        except ApiError as e:
+            logger.error(f"Error getting staked lp amount: {e}")
             return None
 
-        return response.json()
-
     def get_amount_out_for_token_pair(self) -> Union[dict, None]:
         pool_data = self.get_pool_for_token_pair()
         if pool_data is None:
@@ -375,7 +379,8 @@ class ThalaRemoveLiquidity(ThalaLiquidityBase):
 
         token_info = self.client.account_resource(
             AccountAddress.from_hex("0x48271d39d0b05bd6efca2278f22277d6fcc375504f9839fd73f74ace240861af"),
-            f"0x1::coin::CoinInfo<{lp_addr}>"
+            f"0x1::coin::CoinInfo<{lp_addr}>",
+            cache=False
         )
         lp_supply = token_info.get("data").get("supply").get("vec")[0].get("integer").get("vec")[0].get("value")
 
@@ -13,6 +13,7 @@ from src import enums
 from src.schemas.action_models import ModuleExecutionResult
 from src.schemas.action_models import TransactionPayloadData
 from src.schemas.wallet_data import WalletData
+from src.storage import SharedTaskStorage
 from modules.the_aptos_bridge.src_lz.executor import Executor
 from modules.the_aptos_bridge.src_lz.endpoint import Endpoint
 
@@ -51,6 +52,23 @@ class AptosBridge(ModuleBase):
             self,
             dst_chain_id: int,
             adapter_params
+    ) -> int:
+        return SharedTaskStorage().get_or_fetch(
+            key=("lz_fee", dst_chain_id, str(adapter_params)),
+            fetch=lambda: self.fetch_lz_fee(dst_chain_id=dst_chain_id, adapter_params=adapter_params)
+        )
+
+    def get_default_adapter_params(self, dst_chain_id: int):
+        executor = Executor(self.client)
+        return SharedTaskStorage().get_or_fetch(
+            key=("lz_adapter_params", dst_chain_id),
+            fetch=lambda: executor.get_default_adapter_params(dst_chain_id=dst_chain_id)
+        )
+
+    def fetch_lz_fee(
+            self,
+            dst_chain_id: int,
+            adapter_params
     ) -> int:
         endpoint = Endpoint(self.client)
 
@@ -71,6 +89,7 @@ class AptosBridge(ModuleBase):
         coin_to_bridge = Tokens().get_by_name(name_query=self.task.coin_x)
         dst_chain = Chains().get_by_name(name_query=self.task.dst_chain_name)
         recipient_address = AccountAddress.from_hex(self.receiver_address)
+        self.get_wallet_snapshot(wallet_address=self.account.address())
         wallet_apt_balance = self.get_wallet_aptos_balance(wallet_address=self.account.address())
 
         if wallet_apt_balance == 0:
@@ -81,8 +100,7 @@ class AptosBridge(ModuleBase):
             logger.error("Coin to bridge or destination chain not found")
             return None
 
-        executor = Executor(self.client)
-        adapter_params = executor.get_default_adapter_params(dst_chain_id=dst_chain.id)
+        adapter_params = self.get_default_adapter_params(dst_chain_id=dst_chain.id)
 
         fee = self.get_lz_fee(
             dst_chain_id=dst_chain.id,
@@ -3,7 +3,9 @@ from typing import TYPE_CHECKING
 from aptos_sdk.transactions import EntryFunction
 from aptos_sdk.type_tag import TypeTag, StructTag
 from aptos_sdk.account import Account
+from aptos_sdk.client import ApiError
 
+from aptos_rest_client.view import is_table_item_not_found
 from modules.base import ModuleBase
 from contracts.tokens.main import Tokens, TokenBase
 from src import enums
@@ -36,19 +38,21 @@ class AptosBridgeClaim(ModuleBase):
             address: str,
             token_handle: str
     ) -> int:
-        url = f"{self.base_url}/tables/{token_handle}/item"
-        payload = {
-            "key_type": "address",
-            "value_type": "u64",
-            "key": address
-        }
-        response = self.client.post(url, json=payload)
-        if response.status_code == 200:
-            unclaimed_amount = response.json()
-        else:
+        try:
+            unclaimed_amount = self.client.get_table_item(
+                handle=token_handle,
+                key_type="address",
+                value_type="u64",
+                key=address
+            )
+        except ApiError as e:
+            if not is_table_item_not_found(e):
+                raise
+
+            # Item doesn't exist for address without bridged tokens
             unclaimed_amount = 0
 
-        return unclaimed_amount
+        return int(unclaimed_amount)
 
     def get_all_unclaimed_tokens_for_address(self) -> list:
         unclaimed_token_objects = []
@@ -9,6 +9,7 @@ from loguru import logger
 
 import config
 from modules.base import ModuleBase
+from modules.async_base import AsyncModuleBase
 from contracts.tokens.main import Tokens, TokenBase
 from src import enums
 from src.schemas.wallet_data import WalletData
@@ -45,6 +46,7 @@ class TokenTransfer(ModuleBase):
         if not self.coin_x:
             raise Exception(f"Coin {self.task.coin_x} not found")
 
+        self.get_wallet_snapshot(wallet_address=self.account.address())
         self.initial_balance_x_wei = self.get_wallet_token_balance(
             wallet_address=self.account.address(),
             token_address=self.coin_x.contract_address
@@ -93,7 +95,11 @@ class TokenTransfer(ModuleBase):
 
         return amount_out_wei
 
-    def build_transaction_payload(self) -> Union[TransactionPayloadData, None]:
+    def get_recipient_address(self) -> Union[AccountAddress, None]:
+        """
+        Gets recipient address from wallet pair address
+        :return: None if it's not set or not valid
+        """
         if not self.recipient_address:
             logger.error("Recipient address is not set, please set it as wallet pair address")
             return None
@@ -102,19 +108,22 @@ class TokenTransfer(ModuleBase):
             logger.error(f"Recipient address is not valid, should be {config.APTOS_KEY_LENGTH} char long")
             return None
 
-        address = self.get_address_from_hex(self.recipient_address)
+        return self.get_address_from_hex(self.recipient_address)
 
-        if self.coin_x.symbol.lower() != "aptos":
-            is_coin_registered = self.is_token_registered_for_address(
-                wallet_address=address,
-                token_contract=self.coin_x.contract_address
+    def is_transfer_coin_registered(self, is_coin_registered: bool) -> bool:
+        if not is_coin_registered:
+            logger.error(
+                f"Coin {self.coin_x.symbol.upper()} is not registered for recipient: {self.recipient_address}"
             )
-            if not is_coin_registered:
-                logger.error(
-                    f"Coin {self.coin_x.symbol.upper()} is not registered for recipient: {self.recipient_address}"
-                )
-                return None
 
+        return is_coin_registered
+
+    def get_transfer_payload_data(self, address: AccountAddress) -> Union[TransactionPayloadData, None]:
+        """
+        Builds transfer payload of amount by task
+        :param address: recipient address
+        :return: None if amount is not available
+        """
         amount_out_wei = self.calculate_amount_out_from_balance(self.coin_x)
         if amount_out_wei is None:
             return None
@@ -144,24 +153,113 @@ class TokenTransfer(ModuleBase):
             amount_y_decimals=0
         )
 
+    def get_payload_error_result(self) -> ModuleExecutionResult:
+        self.module_execution_result.execution_status = enums.ModuleExecutionStatus.ERROR
+        self.module_execution_result.execution_info = "Error while building transaction payload"
+        return self.module_execution_result
+
+    def get_transfer_info_message(self, payload: TransactionPayloadData) -> str:
+        return (f"Transfer - {round(payload.amount_x_decimals, 4)} ({self.coin_x.symbol.upper()}), "
+                f"recipient: {self.recipient_address}.")
+
+    def build_transaction_payload(self) -> Union[TransactionPayloadData, None]:
+        address = self.get_recipient_address()
+        if address is None:
+            return None
+
+        if self.coin_x.symbol.lower() != "aptos":
+            is_coin_registered = self.is_token_registered_for_address(
+                wallet_address=address,
+                token_contract=self.coin_x.contract_address
+            )
+            if not self.is_transfer_coin_registered(is_coin_registered):
+                return None
+
+        return self.get_transfer_payload_data(address)
+
     def send_txn(self) -> ModuleExecutionResult:
         payload = self.build_transaction_payload()
         if payload is None:
-            self.module_execution_result.execution_status = enums.ModuleExecutionStatus.ERROR
-            self.module_execution_result.execution_info = "Error while building transaction payload"
-            return self.module_execution_result
-
-        txn_info_message = (f"Transfer - {round(payload.amount_x_decimals, 4)} ({self.coin_x.symbol.upper()}), "
-                            f"recipient: {self.recipient_address}.")
+            return self.get_payload_error_result()
 
         txn_status = self.simulate_and_send_transfer_type_transaction(
             account=self.account,
             txn_payload=payload.payload,
-            txn_info_message=txn_info_message
+            txn_info_message=self.get_transfer_info_message(payload)
         )
 
         return txn_status
 
 
+class AsyncTokenTransfer(AsyncModuleBase):
+    def __init__(
+            self,
+            account: Account,
+            task: 'TransferTask',
+            base_url: str,
+            wallet_data: WalletData,
+            proxies: dict = None,
+    ):
+        super().__init__(
+            task=task,
+            base_url=base_url,
+            proxies=proxies,
+            account=account
+        )
+
+        self.account = account
+        self.task = task
+
+        self.coin_x = Tokens().get_by_name(self.task.coin_x)
+
+        self.recipient_address = wallet_data.pair_address
 
+        if not self.coin_x:
+            raise Exception(f"Coin {self.task.coin_x} not found")
+
+        self.initial_balance_x_wei = None
+        self.token_x_decimals = None
+
+    # Transfer logic without network calls is shared with the sync module
+    calculate_amount_out_from_balance = TokenTransfer.calculate_amount_out_from_balance
+    get_recipient_address = TokenTransfer.get_recipient_address
+    is_transfer_coin_registered = TokenTransfer.is_transfer_coin_registered
+    get_transfer_payload_data = TokenTransfer.get_transfer_payload_data
+    get_payload_error_result = TokenTransfer.get_payload_error_result
+    get_transfer_info_message = TokenTransfer.get_transfer_info_message
+
+    async def prepare(self):
+        await self.get_wallet_snapshot(wallet_address=self.account.address())
+        self.initial_balance_x_wei = await self.get_wallet_token_balance(
+            wallet_address=self.account.address(),
+            token_address=self.coin_x.contract_address
+        )
+        self.token_x_decimals = await self.get_token_decimals(self.coin_x)
 
+    async def build_transaction_payload(self) -> Union[TransactionPayloadData, None]:
+        address = self.get_recipient_address()
+        if address is None:
+            return None
+
+        if self.coin_x.symbol.lower() != "aptos":
+            is_coin_registered = await self.is_token_registered_for_address(
+                wallet_address=address,
+                token_contract=self.coin_x.contract_address
+            )
+            if not self.is_transfer_coin_registered(is_coin_registered):
+                return None
+
+        return self.get_transfer_payload_data(address)
+
+    async def send_txn(self) -> ModuleExecutionResult:
+        payload = await self.build_transaction_payload()
+        if payload is None:
+            return self.get_payload_error_result()
+
+        txn_status = await self.simulate_and_send_transfer_type_transaction(
+            account=self.account,
+            txn_payload=payload.payload,
+            txn_info_message=self.get_transfer_info_message(payload)
+        )
+
+        return txn_status
@@ -0,0 +1,6 @@
+import sys
+
+from cli.main import run_cli
+
+if __name__ == '__main__':
+    sys.exit(run_cli())
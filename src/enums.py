@@ -70,3 +70,21 @@ class ModuleExecutionStatus(str, Enum):
 
 class MiscTypes(str, Enum):
     RANDOM = "random"
+
+
+class ExecutionOrder(str, Enum):
+    WALLET = "wallet"
+    TASK = "task"
+
+
+class GasSampleKind(str, Enum):
+    SIMULATED = "simulated"
+    ACTUAL = "actual"
+    OUT_OF_GAS = "out_of_gas"
+
+
+class GasPricePolicy(str, Enum):
+    FIXED = "fixed"
+    DEPRIORITIZED = "deprioritized"
+    REGULAR = "regular"
+    PRIORITIZED = "prioritized"
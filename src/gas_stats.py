@@ -0,0 +1,223 @@
+import os
+import json
+import atexit
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Union
+
+from aptos_sdk.transactions import EntryFunction
+from loguru import logger
+
+from src import paths
+from src import enums
+from src.schemas.logs import GasStatsEntrySchema
+
+
+class FunctionGasStats:
+    def __init__(self, max_samples: int):
+        # Recent simulated and committed gas used, both are taken for the model
+        self.samples: Deque[int] = deque(maxlen=max_samples)
+
+    def add(self, gas_used: int):
+        self.samples.append(int(gas_used))
+
+    def reset(self):
+        self.samples.clear()
+
+
+class GasStats:
+    """
+    Persistent gas used of entry functions keyed by module address, function and type arguments.
+    Simulated and committed gas of every transaction is appended to the stats file, one json entry per line,
+    by a background writer, so recording doesn't block the event loop. Stats are loaded from the file
+    on first use, so later runs and workers start with known functions, and the file is compacted
+    to the last samples of every function when it grows too large.
+    In trusted mode gas limit of a well characterized function is taken from stats without simulation.
+    """
+    file_path = paths.GAS_STATS_FILE
+    trusted = False
+
+    max_samples = 50
+    min_trusted_samples = 5
+    # Max to min gas used of recent samples, wider spread depends on state and needs simulation
+    max_trusted_spread = 1.2
+
+    __functions: Dict[str, FunctionGasStats] = {}
+    __is_loaded = False
+    __lock = threading.Lock()
+
+    __entries_queue: "queue.Queue[str]" = queue.Queue()
+    __writer: Union[threading.Thread, None] = None
+
+    @classmethod
+    def configure(cls, trusted: bool):
+        cls.trusted = trusted
+
+    @staticmethod
+    def get_key(payload: EntryFunction) -> str:
+        type_arguments = ", ".join(str(type_argument) for type_argument in payload.ty_args)
+        return f"{payload.module}::{payload.function}<{type_arguments}>"
+
+    @classmethod
+    def __apply(cls, key: str, kind: enums.GasSampleKind, gas_used: int):
+        function_stats = cls.__functions.get(key)
+        if function_stats is None:
+            function_stats = FunctionGasStats(max_samples=cls.max_samples)
+            cls.__functions[key] = function_stats
+
+        if kind == enums.GasSampleKind.OUT_OF_GAS:
+            # Model was wrong, function is simulated again until it's characterized anew
+            function_stats.reset()
+        else:
+            function_stats.add(gas_used)
+
+    @classmethod
+    def __load(cls):
+        if cls.__is_loaded:
+            return
+
+        cls.__is_loaded = True
+        if not os.path.exists(cls.file_path):
+            return
+
+        # Lines of samples still taken for the model, older ones are dropped on compaction
+        kept_lines: Dict[str, Deque[str]] = {}
+        lines_amount = 0
+
+        try:
+            with open(cls.file_path, "r") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    lines_amount += 1
+                    try:
+                        entry = GasStatsEntrySchema(**json.loads(line))
+                    except Exception:
+                        # Last line may be cut if the process was killed while writing
+                        continue
+
+                    cls.__apply(entry.key, entry.kind, entry.gas_used)
+
+                    function_lines = kept_lines.setdefault(entry.key, deque(maxlen=cls.max_samples))
+                    if entry.kind == enums.GasSampleKind.OUT_OF_GAS:
+                        function_lines.clear()
+                    else:
+                        function_lines.append(line)
+
+        except Exception as e:
+            logger.error(f"Error while loading gas stats: {e}")
+            return
+
+        kept_lines_amount = sum(len(function_lines) for function_lines in kept_lines.values())
+        # Entries appended by other workers while the file is rewritten are lost,
+        # so it's compacted only once most of it is outdated
+        if lines_amount > kept_lines_amount * 2:
+            cls.__compact([line for function_lines in kept_lines.values() for line in function_lines])
+
+    @classmethod
+    def __compact(cls, lines: List[str]):
+        temp_file_path = f"{cls.file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file_path, "w") as file:
+                file.writelines(line + "\n" for line in lines)
+
+            os.replace(temp_file_path, cls.file_path)
+
+        except Exception as e:
+            logger.error(f"Error while compacting gas stats: {e}")
+
+    @classmethod
+    def __write_entries(cls):
+        while True:
+            lines = [cls.__entries_queue.get()]
+            # Entries recorded while the previous ones were written go with a single file open
+            while True:
+                try:
+                    lines.append(cls.__entries_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                os.makedirs(os.path.dirname(cls.file_path), exist_ok=True)
+                with open(cls.file_path, "a") as file:
+                    for line in lines:
+                        # Single write of a whole line, workers may append at the same time
+                        file.write(line)
+                        file.flush()
+
+            except Exception as e:
+                logger.error(f"Error while writing gas stats entry: {e}")
+
+            for _ in lines:
+                cls.__entries_queue.task_done()
+
+    @classmethod
+    def __start_writer(cls):
+        if cls.__writer is not None and cls.__writer.is_alive():
+            return
+
+        cls.__writer = threading.Thread(target=cls.__write_entries, name="gas-stats-writer", daemon=True)
+        cls.__writer.start()
+
+    @classmethod
+    def flush(cls):
+        """
+        Waits until recorded entries are written to the stats file
+        :return:
+        """
+        cls.__entries_queue.join()
+
+    @classmethod
+    def record(cls, payload: EntryFunction, kind: enums.GasSampleKind, gas_used: int = 0):
+        """
+        Records gas used by transaction
+        :param payload:
+        :param kind: simulated, committed or out of gas transaction
+        :param gas_used:
+        :return:
+        """
+        entry = GasStatsEntrySchema(
+            key=cls.get_key(payload),
+            kind=kind,
+            gas_used=int(gas_used),
+            date_time=datetime.now().strftime("%d-%m-%Y_%H-%M-%S")
+        )
+
+        with cls.__lock:
+            cls.__load()
+            cls.__apply(entry.key, entry.kind, entry.gas_used)
+
+            cls.__start_writer()
+            cls.__entries_queue.put_nowait(entry.json() + "\n")
+
+    @classmethod
+    def get_trusted_gas_used(cls, payload: EntryFunction) -> Union[int, None]:
+        """
+        Gets gas used of well characterized function in trusted mode
+        :param payload:
+        :return: max recent gas used, None if function has to be simulated
+        """
+        if not cls.trusted:
+            return None
+
+        with cls.__lock:
+            cls.__load()
+            function_stats = cls.__functions.get(cls.get_key(payload))
+            if function_stats is None or len(function_stats.samples) < cls.min_trusted_samples:
+                return None
+
+            min_gas_used = min(function_stats.samples)
+            max_gas_used = max(function_stats.samples)
+
+        if min_gas_used <= 0 or max_gas_used / min_gas_used > cls.max_trusted_spread:
+            return None
+
+        return max_gas_used
+
+
+# Entries left in the queue are written before the interpreter exits
+atexit.register(GasStats.flush)
@@ -3,46 +3,96 @@ from typing import Union
 from loguru import logger
 from aptos_sdk.client import RestClient
 
+from aptos_rest_client.json_codec import get_response_json
+from src.storage import SharedTaskStorage
+
 
 class GeckoPricer:
+    simple_price_url = "https://api.coingecko.com/api/v3/simple/price"
+
     def __init__(self, client: RestClient):
         self.client = client
 
+    @staticmethod
+    def get_simple_price_params(
+            x_token_id: str,
+            y_token_id: str
+    ) -> dict:
+        return {
+            "ids": f"{x_token_id},{y_token_id}",
+            "vs_currencies": "usd"
+        }
+
+    @staticmethod
+    def parse_simple_price_response(
+            response,
+            x_token_id: str,
+            y_token_id: str
+    ) -> Union[dict, None]:
+        if response.status_code != 200:
+            return None
+
+        data = get_response_json(response)
+        x_token_price = data.get(x_token_id.lower()).get("usd")
+        y_token_price = data.get(y_token_id.lower()).get("usd")
+
+        if x_token_price is None or y_token_price is None:
+            return None
+
+        return {
+            x_token_id: x_token_price,
+            y_token_id: y_token_price}
+
     def get_simple_price_of_token_pair(
             self,
             x_token_id: str,
             y_token_id: str
     ) -> Union[dict, None]:
         try:
-            url = f"https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                "ids": f"{x_token_id},{y_token_id}",
-                "vs_currencies": "usd"
-            }
-
             response = self.client.client.get(
-                url=url,
-                params=params,
+                url=self.simple_price_url,
+                params=self.get_simple_price_params(x_token_id, y_token_id),
                 timeout=30
             )
-            if response.status_code != 200:
-                return None
-
-            data = response.json()
-            x_token_price = data.get(x_token_id.lower()).get("usd")
-            y_token_price = data.get(y_token_id.lower()).get("usd")
-
-            if x_token_price is None or y_token_price is None:
-                return None
-
-            return {
-                x_token_id: x_token_price,
-                y_token_id: y_token_price}
+            return self.parse_simple_price_response(response, x_token_id, y_token_id)
 
         except Exception as e:
             logger.error(e)
             return None
 
+    @staticmethod
+    def validate_target_price(
+            gecko_coins_data: Union[dict, None],
+            x_token_id: str,
+            y_token_id: str,
+            x_amount: Union[int, float],
+            y_amount: Union[int, float],
+            max_price_difference_percent: Union[int, float]) -> tuple[bool, Union[dict]]:
+
+        if gecko_coins_data is None:
+            logger.error(f"Error while getting price data from CoinGecko")
+            return False, {'gecko_price': None,
+                           'target_price': None}
+
+        target_price = y_amount / x_amount
+        gecko_price = gecko_coins_data[x_token_id] / gecko_coins_data[y_token_id]
+
+        price_data = {'gecko_price': gecko_price,
+                      'target_price': target_price}
+
+        if gecko_price < target_price:
+            return True, price_data
+
+        if gecko_price > target_price:
+            price_difference = gecko_price - target_price
+            price_difference_percent = (price_difference / target_price) * 100
+            if price_difference_percent <= max_price_difference_percent:
+                return True, price_data
+            else:
+                return False, price_data
+
+        return False, price_data
+
     def is_target_price_valid(
             self,
             x_token_id: str,
@@ -52,33 +102,70 @@ class GeckoPricer:
             max_price_difference_percent: Union[int, float]) -> tuple[bool, Union[dict]]:
 
         try:
-            gecko_coins_data: dict = self.get_simple_price_of_token_pair(
+            gecko_coins_data: dict = SharedTaskStorage().get_or_fetch(
+                key=("gecko_price", x_token_id, y_token_id),
+                fetch=lambda: self.get_simple_price_of_token_pair(
+                    x_token_id=x_token_id,
+                    y_token_id=y_token_id
+                )
+            )
+            return self.validate_target_price(
+                gecko_coins_data=gecko_coins_data,
                 x_token_id=x_token_id,
-                y_token_id=y_token_id
+                y_token_id=y_token_id,
+                x_amount=x_amount,
+                y_amount=y_amount,
+                max_price_difference_percent=max_price_difference_percent
             )
-            if gecko_coins_data is None:
-                logger.error(f"Error while getting price data from CoinGecko")
-                return False, {'gecko_price': None,
-                               'target_price': None}
 
-            target_price = y_amount / x_amount
-            gecko_price = gecko_coins_data[x_token_id] / gecko_coins_data[y_token_id]
+        except Exception as e:
+            logger.error(f"Error while validating target price: {e}")
+            return False, {'gecko_price': None,
+                           'target_price': None}
 
-            price_data = {'gecko_price': gecko_price,
-                          'target_price': target_price}
 
-            if gecko_price < target_price:
-                return True, price_data
+class AsyncGeckoPricer(GeckoPricer):
+    async def get_simple_price_of_token_pair(
+            self,
+            x_token_id: str,
+            y_token_id: str
+    ) -> Union[dict, None]:
+        try:
+            response = await self.client.client.get(
+                url=self.simple_price_url,
+                params=self.get_simple_price_params(x_token_id, y_token_id),
+                timeout=30
+            )
+            return self.parse_simple_price_response(response, x_token_id, y_token_id)
 
-            if gecko_price > target_price:
-                price_difference = gecko_price - target_price
-                price_difference_percent = (price_difference / target_price) * 100
-                if price_difference_percent <= max_price_difference_percent:
-                    return True, price_data
-                else:
-                    return False, price_data
+        except Exception as e:
+            logger.error(e)
+            return None
+
+    async def is_target_price_valid(
+            self,
+            x_token_id: str,
+            y_token_id: str,
+            x_amount: Union[int, float],
+            y_amount: Union[int, float],
+            max_price_difference_percent: Union[int, float]) -> tuple[bool, Union[dict]]:
 
-            return False, price_data
+        try:
+            gecko_coins_data: dict = await SharedTaskStorage().get_or_fetch_async(
+                key=("gecko_price", x_token_id, y_token_id),
+                fetch=lambda: self.get_simple_price_of_token_pair(
+                    x_token_id=x_token_id,
+                    y_token_id=y_token_id
+                )
+            )
+            return self.validate_target_price(
+                gecko_coins_data=gecko_coins_data,
+                x_token_id=x_token_id,
+                y_token_id=y_token_id,
+                x_amount=x_amount,
+                y_amount=y_amount,
+                max_price_difference_percent=max_price_difference_percent
+            )
 
         except Exception as e:
             logger.error(f"Error while validating target price: {e}")
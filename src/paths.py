@@ -13,6 +13,8 @@ APTOS_WALLETS_FILE = os.path.join(MAIN_DIR, "wallets.txt")
 EVM_ADDRESSES_FILE = os.path.join(MAIN_DIR, "evm_addresses.txt")
 PROXY_FILE = os.path.join(MAIN_DIR, "proxy.txt")
 APP_CONFIG_FILE = os.path.join(MAIN_DIR, "app_config.json")
+RUN_JOURNAL_FILE = os.path.join(LOGS_DIR, "run_journal.jsonl")
+GAS_STATS_FILE = os.path.join(LOGS_DIR, "gas_stats.jsonl")
 
 DARK_MODE_LOGO_IMG = os.path.join(GUI_IMAGES_DIR, 'dark_mode_logo.png')
 LIGHT_MODE_LOGO_IMG = os.path.join(GUI_IMAGES_DIR, 'light_mode_logo.png')
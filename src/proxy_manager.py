@@ -1,8 +1,10 @@
-import httpx
 import time
 
 from typing import Union
 
+import httpx
+
+from aptos_rest_client.http_pool import HttpPool
 from src.schemas.proxy_data import ProxyData
 
 from loguru import logger
@@ -34,7 +36,7 @@ class ProxyManager:
         if proxies is None:
             return False
         try:
-            http_client = httpx.Client(proxies=proxies)
+            http_client = HttpPool.get_client(proxies)
             ipify_url = 'https://api.ipify.org?format=json'
             response = http_client.get(url=ipify_url, timeout=30)
 
@@ -50,9 +52,10 @@ class ProxyManager:
         if proxies is None:
             return None
         try:
-            http_client = httpx.Client(proxies=proxies)
-            ipify_url = 'https://api.ipify.org?format=json'
-            response = http_client.get(url=ipify_url, timeout=15)
+            # Fresh connection, pooled keep-alive one may still go through the exit ip before rotation
+            with httpx.Client(proxies=proxies, timeout=15) as http_client:
+                ipify_url = 'https://api.ipify.org?format=json'
+                response = http_client.get(url=ipify_url)
 
             if response.status_code == 200:
                 return response.json()['ip']
@@ -70,9 +73,12 @@ class ProxyManager:
             logger.error(f"Failed to get initial ip")
             return False
 
-        http_client_clear = httpx.Client()
+        http_client_clear = HttpPool.get_client()
         response = http_client_clear.get(url=rotation_link)
         if response.status_code == 200:
+            # Pooled connections keep the old exit ip
+            HttpPool.invalidate_proxy(self.get_proxy())
+
             logger.info(f"Proxy rotation response success (current ip: {initial_ip}), "
                         f"waiting for proxy to rotate (120 sec timeout)")
             is_rotated = self.wait_for_proxy_rotation(initial_ip=initial_ip)
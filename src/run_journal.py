@@ -0,0 +1,139 @@
+import os
+import json
+from datetime import datetime
+from typing import List, Set, Union
+
+from loguru import logger
+
+from src import paths
+from src import enums
+from src.schemas.logs import RunJournalEntrySchema
+from src.schemas.action_models import ModuleExecutionResult
+from src.schemas.tasks.base.base import TaskBase
+from src.schemas.wallet_data import WalletData
+
+
+COMPLETED_STATUSES = (
+    enums.ModuleExecutionStatus.SUCCESS,
+    enums.ModuleExecutionStatus.SENT,
+)
+
+
+class RunJournal:
+    """
+    Append-only journal of executed (wallet, task) pairs, one json entry per line.
+    Pairs are keyed by wallet address, task id and task occurrence number,
+    wallet ids are generated on every wallets load and can't be used to resume.
+    """
+
+    def __init__(self, file_path: str = paths.RUN_JOURNAL_FILE):
+        self.file_path = file_path
+
+    @staticmethod
+    def get_entry_key(
+            wallet_address: str,
+            task_id: str,
+            occurrence: int
+    ) -> str:
+        return f"{wallet_address}:{task_id}:{occurrence}"
+
+    @staticmethod
+    def get_task_occurrences(tasks: List[TaskBase]) -> List[int]:
+        """
+        Get occurrence number of every task, repeated tasks share the same task id
+        :param tasks:
+        :return:
+        """
+        seen = {}
+        occurrences = []
+        for task in tasks:
+            occurrence = seen.get(task.task_id, 0)
+            occurrences.append(occurrence)
+            seen[task.task_id] = occurrence + 1
+
+        return occurrences
+
+    def reset(self):
+        """
+        Start a new journal, previous run entries are dropped
+        :return:
+        """
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            with open(self.file_path, "w"):
+                pass
+
+        except Exception as e:
+            logger.error(f"Error while resetting run journal: {e}")
+
+    def add_entry(
+            self,
+            wallet: WalletData,
+            task: TaskBase,
+            occurrence: int,
+            execution_result: Union[ModuleExecutionResult, None]
+    ):
+        """
+        Append executed pair to the journal
+        :param wallet:
+        :param task:
+        :param occurrence:
+        :param execution_result: module execution result, None if module was not executed
+        :return:
+        """
+        entry = RunJournalEntrySchema(
+            wallet_id=str(wallet.wallet_id),
+            wallet_address=wallet.address,
+            task_id=str(task.task_id),
+            occurrence=occurrence,
+            module_name=task.module_name,
+            module_type=task.module_type,
+            date_time=datetime.now().strftime("%d-%m-%Y_%H-%M-%S"),
+        )
+        if execution_result is not None:
+            entry.execution_status = execution_result.execution_status
+            entry.execution_info = execution_result.execution_info
+            entry.transaction_hash = execution_result.hash
+
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            # Single write of a whole line, workers may append at the same time
+            with open(self.file_path, "a") as file:
+                file.write(entry.json() + "\n")
+
+        except Exception as e:
+            logger.error(f"Error while writing run journal entry: {e}")
+
+    def get_entries(self) -> List[RunJournalEntrySchema]:
+        if not os.path.exists(self.file_path):
+            return []
+
+        entries = []
+        with open(self.file_path, "r") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    entries.append(RunJournalEntrySchema(**json.loads(line)))
+                except Exception:
+                    # Last line may be cut if the process was killed while writing
+                    logger.warning(f"Skipping broken run journal entry: {line[:100]}")
+
+        return entries
+
+    def get_completed_keys(self) -> Set[str]:
+        """
+        Get keys of pairs completed successfully
+        :return:
+        """
+        return {
+            self.get_entry_key(
+                wallet_address=entry.wallet_address,
+                task_id=entry.task_id,
+                occurrence=entry.occurrence
+            )
+            for entry in self.get_entries()
+            if entry.execution_status in COMPLETED_STATUSES
+        }
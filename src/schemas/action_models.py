@@ -24,6 +24,7 @@ class TransactionSimulationResult(BaseModel):
 class TransactionReceipt(BaseModel):
     status: enums.TransactionStatus
     vm_status: Optional[str] = None
+    gas_used: Optional[int] = None
 
 
 class TransactionPayloadData(BaseModel):
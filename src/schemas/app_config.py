@@ -1,5 +1,8 @@
+from typing import List
+
 from pydantic import BaseModel
 from pydantic import validator
+from src import enums
 from src import exceptions
 from utils import validation
 
@@ -7,7 +10,16 @@ from utils import validation
 class AppConfigSchema(BaseModel):
     preserve_logs: bool = True
     rpc_url: str = "https://rpc.ankr.com/http/aptos/v1"
+    rpc_urls: List[str] = []
+    http2: bool = False
+    bcs_reads: bool = False
+    batch_submit: bool = False
+    trust_gas_model: bool = False
     wallets_amount_to_execute_in_test_mode: int = 3
+    wallets_concurrency: int = 1
+    wallets_workers: int = 1
+    execution_order: enums.ExecutionOrder = enums.ExecutionOrder.WALLET
+    task_window_size: int = 10
 
     @validator('rpc_url', pre=True)
     def rpc_url_must_be_valid(cls, value):
@@ -16,9 +28,47 @@ class AppConfigSchema(BaseModel):
 
         return value
 
+    @validator('rpc_urls', pre=True)
+    def rpc_urls_must_be_valid(cls, value):
+        if not value:
+            return []
+
+        if isinstance(value, str):
+            value = value.split(",")
+
+        return [url.strip() for url in value if url and url.strip()]
+
     @validator('wallets_amount_to_execute_in_test_mode', pre=True)
     def wallets_amount_to_execute_in_test_mode_must_be_valid(cls, value):
         value = validation.get_converted_to_int(value, "Wallets amount")
         value = validation.get_positive(value, "Wallets amount", include_zero=False)
 
         return value
+
+    @validator('wallets_concurrency', pre=True)
+    def wallets_concurrency_must_be_valid(cls, value):
+        value = validation.get_converted_to_int(value, "Wallets concurrency")
+        value = validation.get_positive(value, "Wallets concurrency", include_zero=False)
+
+        return value
+
+    @validator('wallets_workers', pre=True)
+    def wallets_workers_must_be_valid(cls, value):
+        value = validation.get_converted_to_int(value, "Wallets workers")
+        value = validation.get_positive(value, "Wallets workers", include_zero=False)
+
+        return value
+
+    @validator('task_window_size', pre=True)
+    def task_window_size_must_be_valid(cls, value):
+        value = validation.get_converted_to_int(value, "Task window size")
+        value = validation.get_positive(value, "Task window size", include_zero=False)
+
+        return value
+
+    def get_rpc_urls(self) -> List[str]:
+        """
+        Gets all rpc urls, main rpc url goes first
+        :return:
+        """
+        return [self.rpc_url] + [url for url in self.rpc_urls if url != self.rpc_url]
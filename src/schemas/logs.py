@@ -14,3 +14,25 @@ class WalletActionSchema(BaseModel):
     is_success: Union[bool, None] = None
     status: str = None
     transaction_hash: str = None
+
+
+class RunJournalEntrySchema(BaseModel):
+    wallet_id: str = None
+    wallet_address: str
+    task_id: str
+    occurrence: int = 0
+
+    module_name: enums.ModuleName = None
+    module_type: enums.ModuleType = None
+
+    execution_status: enums.ModuleExecutionStatus = enums.ModuleExecutionStatus.FAILED
+    execution_info: Union[str, None] = None
+    transaction_hash: Union[str, None] = None
+    date_time: str = None
+
+
+class GasStatsEntrySchema(BaseModel):
+    key: str
+    kind: enums.GasSampleKind
+    gas_used: int = 0
+    date_time: str = None
@@ -23,6 +23,8 @@ class TaskBase(BaseModel):
     forced_gas_limit: bool = False
     gas_limit: int
     gas_price: int
+    # Fixed price is taken from gas_price, other policies take node estimate and fall back to gas_price
+    gas_price_policy: enums.GasPricePolicy = enums.GasPricePolicy.FIXED
 
     # GLOBALS
     wait_for_receipt: bool = False
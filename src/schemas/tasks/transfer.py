@@ -4,7 +4,7 @@ from pydantic import Field
 from src import enums
 from src.schemas import validation_mixins
 from src.schemas.tasks.base.base import TaskBase
-from modules.transfer.token_transfer import TokenTransfer
+from modules.transfer.token_transfer import AsyncTokenTransfer
 
 
 class TransferTask(
@@ -13,7 +13,7 @@ class TransferTask(
 ):
     module_name = enums.ModuleName.TOKEN
     module_type = enums.ModuleType.TRANSFER
-    module = Field(default=TokenTransfer)
+    module = Field(default=AsyncTokenTransfer)
 
     coin_x: str
 
@@ -1,8 +1,17 @@
 import os
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, Tuple
 
 from loguru import logger
 
+from aptos_rest_client.rpc_pool import RpcPool
+from aptos_rest_client.http_pool import HttpPool
+from aptos_rest_client.bcs_resources import BcsResources
+from aptos_rest_client.batch_submit import BatchSubmitter
 from src import paths
+from src.gas_stats import GasStats
 from src.schemas.app_config import AppConfigSchema
 from src.schemas.logs import WalletActionSchema
 from src.file_manager import FileManager
@@ -37,13 +46,24 @@ class Storage:
         def __load_app_config(self) -> AppConfigSchema:
             try:
                 config_file_data = FileManager.read_data_from_json_file(paths.APP_CONFIG_FILE)
-                return AppConfigSchema(**config_file_data)
+                app_config = AppConfigSchema(**config_file_data)
+                self.__configure_http_clients(app_config)
+                return app_config
             except Exception as e:
                 logger.error(f"Error while loading app config: {e}")
                 logger.exception(e)
 
         def update_app_config(self, config: AppConfigSchema):
             self.__app_config = config
+            self.__configure_http_clients(config)
+
+        @staticmethod
+        def __configure_http_clients(config: AppConfigSchema):
+            RpcPool.configure(base_url=config.rpc_url, urls=config.get_rpc_urls())
+            HttpPool.configure(http2=config.http2)
+            BcsResources.configure(enabled=config.bcs_reads)
+            BatchSubmitter.configure(enabled=config.batch_submit)
+            GasStats.configure(trusted=config.trust_gas_model)
 
     def __new__(cls):
         if not Storage.__instance:
@@ -65,7 +85,9 @@ class ActionStorage:
             self.all_actions = []
             self.current_action: WalletActionSchema = WalletActionSchema()
             self.current_logs_dir = None
+            self.current_logs_file_name = "!all_logs.xlsx"
             self.current_active_wallet = None
+            self.lock = threading.RLock()
 
         def set_current_active_wallet(self, wallet_data):
             self.current_active_wallet = wallet_data
@@ -77,10 +99,12 @@ class ActionStorage:
             if Storage().app_config.preserve_logs is False:
                 return
 
-            self.all_actions.append(action_data)
+            with self.lock:
+                self.all_actions.append(action_data)
 
         def get_all_actions(self):
-            return self.all_actions
+            with self.lock:
+                return list(self.all_actions)
 
         def get_current_action(self) -> WalletActionSchema:
             return self.current_action
@@ -102,8 +126,15 @@ class ActionStorage:
         def get_current_logs_dir(self):
             return self.current_logs_dir
 
+        def set_current_logs_file_name(self, file_name: str):
+            self.current_logs_file_name = file_name
+
+        def get_current_logs_file_name(self) -> str:
+            return self.current_logs_file_name
+
         def reset_all_actions(self):
-            self.all_actions = []
+            with self.lock:
+                self.all_actions = []
 
         def reset_current_logs_dir(self):
             self.current_logs_dir = None
@@ -114,3 +145,119 @@ class ActionStorage:
 
             self.set_current_logs_dir(FileManager.create_new_logs_dir())
 
+
+class SharedTaskStorage:
+    """
+    Values shared by all wallets running the same task in task-major order,
+    such as pool reserves, token decimals or fee quotes. Values live until the
+    current task window is closed, outside of a window nothing is stored.
+    Wallets asking for a value being fetched wait for that fetch instead of sending their own,
+    if it fails or returns None they fetch again, so one failed request isn't shared by the window.
+    """
+    __instance = None
+
+    def __new__(cls):
+        if not SharedTaskStorage.__instance:
+            SharedTaskStorage.__instance = SharedTaskStorage.__Singleton()
+        return SharedTaskStorage.__instance
+
+    class __Singleton:
+
+        def __init__(self):
+            self.__values = {}
+            self.is_window_open = False
+            self.lock = threading.RLock()
+
+        def open_window(self):
+            with self.lock:
+                self.__values = {}
+                self.is_window_open = True
+
+        def close_window(self):
+            with self.lock:
+                self.__values = {}
+                self.is_window_open = False
+
+        def join(self, key: Hashable) -> Tuple[Future, bool]:
+            """
+            Joins fetch of the key in progress or registers a new one
+            :param key:
+            :return: future of the value and True if caller has to fetch it
+            """
+            with self.lock:
+                future = self.__values.get(key)
+                if future is not None:
+                    return future, False
+
+                future = Future()
+                # Running future can't be cancelled by a waiter, e.g. by cancelled asyncio task
+                future.set_running_or_notify_cancel()
+                self.__values[key] = future
+
+                return future, True
+
+        def complete(self, key: Hashable, future: Future, value: Any = None, error: BaseException = None):
+            if error is not None or value is None:
+                # Only successful values are kept, next caller fetches again
+                with self.lock:
+                    if self.__values.get(key) is future:
+                        del self.__values[key]
+
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(value)
+
+        def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+            if not self.is_window_open:
+                return fetch()
+
+            while True:
+                future, is_fetching = self.join(key)
+                if is_fetching:
+                    break
+
+                try:
+                    value = future.result()
+                except Exception:
+                    value = None
+
+                # Failed fetch is not shared, waiter fetches on its own
+                if value is not None:
+                    return value
+
+            try:
+                value = fetch()
+            except BaseException as e:
+                self.complete(key, future, error=e)
+                raise
+
+            self.complete(key, future, value=value)
+            return value
+
+        async def get_or_fetch_async(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+            if not self.is_window_open:
+                return await fetch()
+
+            while True:
+                future, is_fetching = self.join(key)
+                if is_fetching:
+                    break
+
+                try:
+                    value = await asyncio.wrap_future(future)
+                except Exception:
+                    value = None
+
+                # Failed fetch is not shared, waiter fetches on its own
+                if value is not None:
+                    return value
+
+            try:
+                value = await fetch()
+            except BaseException as e:
+                self.complete(key, future, error=e)
+                raise
+
+            self.complete(key, future, value=value)
+            return value
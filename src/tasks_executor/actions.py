@@ -0,0 +1,55 @@
+from typing import List, Union
+
+from loguru import logger
+
+from src.file_manager import FileManager
+from src.schemas.tasks.base.base import TaskBase
+
+
+def read_actions_config(file_path: str) -> Union[dict, None]:
+    """
+    Reads actions config saved from the actions frame
+    :param file_path: path to pickle file
+    :return: dict with "actions" and "run_settings_config", None if config is not valid
+    """
+    data = FileManager.read_from_pickle_file(file_path)
+    if not data or not isinstance(data, dict):
+        logger.error(f"Can't read actions config file \"{file_path}\"")
+        return None
+
+    if not data.get("actions") or not data.get("run_settings_config"):
+        logger.error(f"Actions config file \"{file_path}\" has no actions or run settings")
+        return None
+
+    return data
+
+
+def get_tasks_from_actions(
+        actions: List[dict],
+        run_settings_config: dict
+) -> List[TaskBase]:
+    """
+    Builds tasks list from actions, run settings are applied to every task
+    :param actions: list of {"repeats": int, "task_config": TaskBase}
+    :param run_settings_config: run settings config built by the run settings frame
+    :return:
+    """
+    tasks = []
+    for action in actions:
+        repeats = action["repeats"]
+        task: TaskBase = action["task_config"]
+
+        task.test_mode = bool(run_settings_config["test_mode"])
+        task.min_delay_sec = int(run_settings_config["min_delay_sec"])
+        task.max_delay_sec = run_settings_config["max_delay_sec"]
+        task.wait_for_receipt = bool(run_settings_config["wait_for_receipt"])
+
+        txn_wait_timeout_sec = run_settings_config["txn_wait_timeout_sec"]
+        task.txn_wait_timeout_sec = int(txn_wait_timeout_sec) if txn_wait_timeout_sec else 120
+
+        task = TaskBase(**task.dict())
+
+        for _ in range(repeats):
+            tasks.append(task)
+
+    return tasks
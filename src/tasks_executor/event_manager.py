@@ -167,6 +167,22 @@ class TasksExecEventManager:
         """
         self.running.clear()
 
+    def flush(self):
+        """
+        Process every item left in the queues, should be called after
+        the listening thread is stopped and joined
+        """
+        queues_callbacks = (
+            ("wallets_started_queue", self._on_wallet_started),
+            ("tasks_started_queue", self._on_task_started),
+            ("wallets_completed_queue", self._on_wallet_completed),
+            ("tasks_completed_queue", self._on_task_completed),
+        )
+        for queue_name, callback in queues_callbacks:
+            _queue: InternalQueue = getattr(self, queue_name)
+            for queue_item in _queue.get_all():
+                callback(*queue_item)
+
     def __reduce__(self):
         return (
             object.__new__,
@@ -1,74 +1,93 @@
+import os
 import random
 import asyncio
 import multiprocessing as mp
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 
 from loguru import logger
 
-import config
+from aptos_rest_client.http_pool import HttpPool
+from aptos_rest_client.coalescing import RequestCoalescer
+from aptos_rest_client.metrics import RpcMetrics
+from aptos_rest_client.receipts import ReceiptTracker
+from src import paths
 from src import enums
 from modules.module_executor import ModuleExecutor
 from src.schemas.tasks.base.base import TaskBase
 from src.schemas.wallet_data import WalletData
+from src.storage import Storage
 from src.storage import ActionStorage
+from src.storage import SharedTaskStorage
+from src.file_manager import FileManager
 from src.tasks_executor.event_manager import TasksExecEventManager
+from src.tasks_executor.scheduler import PacingScheduler
+from src.run_journal import RunJournal
+from src.gas_stats import GasStats
 from utils.repr.misc import print_wallet_execution
 from src.logger import configure_logger
 
 
 class TasksExecutor:
     def __init__(self):
-        self.processing_process: Optional[mp.Process] = None
+        self.processing_processes: List[mp.Process] = []
         self.event_manager: Optional[TasksExecEventManager] = TasksExecEventManager()
 
+    def __getstate__(self):
+        # Worker processes receive the executor with the target method,
+        # running processes can't be pickled and are not needed there
+        state = self.__dict__.copy()
+        state["processing_processes"] = []
+        return state
+
     async def process_task(
             self,
             task: "TaskBase",
             wallet_index: int,
             wallet: "WalletData",
 
-            is_last_task: bool = False,
-    ):
+            occurrence: int = 0,
+            journal: Optional[RunJournal] = None,
+    ) -> bool:
         """
         Process a task
         Args:
             task: task to process
             wallet_index: index of wallet_
             wallet: wallet for task
-            is_last_task: is current task the last
+            occurrence: occurrence number of repeated task
+            journal: run journal to record result in
+        Returns:
+            is task successful
         """
 
-        if wallet_index == 0 and task.test_mode is False:
-            ActionStorage().reset_all_actions()
-            ActionStorage().create_and_set_new_logs_dir()
-
         task.task_status = enums.TaskStatus.PROCESSING
         self.event_manager.set_task_started(task, wallet)
 
         logger.debug(f"Processing task: {task.task_id} with wallet: {wallet.name}")
         module_executor = ModuleExecutor(task=task, wallet=wallet)
 
-        task_result = module_executor.start()
+        try:
+            task_result = await module_executor.start_async()
+
+        except Exception as e:
+            # Task is completed as failed, so it's not left in progress
+            logger.error(f"Error while processing task {task.task_id}: {e}")
+            logger.exception(e)
+            task_result = False
 
         task.task_status = enums.TaskStatus.SUCCESS if task_result else enums.TaskStatus.FAILED
         self.event_manager.set_task_completed(task, wallet)
 
-        if not task_result or task.test_mode:
-            time_to_sleep = config.DEFAULT_DELAY_SEC
-        else:
-            time_to_sleep = random.randint(
-                task.min_delay_sec,
-                task.max_delay_sec
+        if journal is not None and not task.test_mode:
+            journal.add_entry(
+                wallet=wallet,
+                task=task,
+                occurrence=occurrence,
+                execution_result=module_executor.execution_result
             )
 
-        if not is_last_task:
-            continue_datetime = datetime.now() + timedelta(seconds=time_to_sleep)
-            logger.info(f"Time to sleep for {time_to_sleep} seconds... "
-                        f"Continue at {continue_datetime.strftime('%H:%M:%S')}")
-            await asyncio.sleep(time_to_sleep)
-        else:
-            logger.success(f"All wallets and tasks completed!")
+        return task_result
 
     async def process_wallet(
             self,
@@ -76,7 +95,12 @@ class TasksExecutor:
             wallet_index: int,
             tasks: List["TaskBase"],
 
-            is_last_wallet: bool = False
+            scheduler: PacingScheduler,
+            timeline_index: int,
+            semaphore: asyncio.Semaphore,
+
+            task_occurrences: Optional[List[int]] = None,
+            journal: Optional[RunJournal] = None,
     ):
         """
         Process a wallet
@@ -84,62 +108,335 @@ class TasksExecutor:
             wallet: wallet to process
             wallet_index: index of wallet
             tasks: list of tasks to process
-            is_last_wallet: is current wallet the last
+            scheduler: scheduler with planned wallet timeline
+            timeline_index: index of wallet timeline in scheduler
+            semaphore: semaphore limiting tasks in flight
+            task_occurrences: occurrence numbers of tasks
+            journal: run journal to record results in
         """
-        self.event_manager.set_wallet_started(wallet)
-
-        print_wallet_execution(wallet, wallet_index)
+        if task_occurrences is None:
+            task_occurrences = RunJournal.get_task_occurrences(tasks)
 
-        for task_index, task in enumerate(tasks):
-            await self.process_task(
-                task=task,
-                wallet_index=wallet_index,
+        for task_index in range(len(tasks)):
+            await self.process_wallet_task(
                 wallet=wallet,
+                wallet_index=wallet_index,
+                tasks=tasks,
+                task_index=task_index,
 
-                is_last_task=(task_index == len(tasks) - 1) and is_last_wallet,
+                scheduler=scheduler,
+                timeline_index=timeline_index,
+                semaphore=semaphore,
+
+                task_occurrences=task_occurrences,
+                journal=journal
             )
 
-        self.event_manager.set_wallet_completed(wallet)
+    async def process_wallet_task(
+            self,
+            wallet: "WalletData",
+            wallet_index: int,
+            tasks: List["TaskBase"],
+            task_index: int,
+
+            scheduler: PacingScheduler,
+            timeline_index: int,
+            semaphore: asyncio.Semaphore,
+
+            task_occurrences: List[int],
+            journal: Optional[RunJournal] = None,
+    ):
+        """
+        Process a single task of a wallet once its deadline is reached,
+        errors are logged and don't stop other wallets
+        Args:
+            wallet: wallet to process
+            wallet_index: index of wallet
+            tasks: list of wallet tasks
+            task_index: index of task to process
+            scheduler: scheduler with planned wallet timeline
+            timeline_index: index of wallet timeline in scheduler
+            semaphore: semaphore limiting tasks in flight
+            task_occurrences: occurrence numbers of tasks
+            journal: run journal to record results in
+        """
+        task = tasks[task_index]
+        task_result = False
+
+        try:
+            await scheduler.wait_for_deadline(timeline_index, task_index)
+
+            async with semaphore:
+                if task_index == 0:
+                    self.event_manager.set_wallet_started(wallet)
+                    print_wallet_execution(wallet, wallet_index)
+
+                task_result = await self.process_task(
+                    task=task,
+                    wallet_index=wallet_index,
+                    wallet=wallet,
+
+                    occurrence=task_occurrences[task_index],
+                    journal=journal
+                )
+
+        except Exception as e:
+            logger.error(f"Error while processing wallet {wallet.name}: {e}")
+            logger.exception(e)
+
+        scheduler.set_task_completed(
+            timeline_index=timeline_index,
+            task_index=task_index,
+            task=task,
+            task_result=task_result
+        )
+
+        if task_index == len(tasks) - 1:
+            self.event_manager.set_wallet_completed(wallet)
+
+    async def _process_window_task_major(
+            self,
+            window: List[tuple],
+            scheduler: PacingScheduler,
+            semaphore: asyncio.Semaphore,
+            journal: Optional[RunJournal] = None,
+    ):
+        """
+        Run every task across a window of wallets before moving to the next one,
+        protocol data fetched by the first wallet is shared with the rest of the window
+        Args:
+            window: (timeline index, wallet index, wallet, pending tasks) of window wallets
+            scheduler: scheduler with planned wallet timelines
+            semaphore: semaphore limiting tasks in flight
+            journal: run journal to record results in
+        """
+        shared_storage = SharedTaskStorage()
+        max_tasks_amount = max(len(pending) for _, _, _, pending in window)
+
+        for task_index in range(max_tasks_amount):
+            shared_storage.open_window()
+            try:
+                await asyncio.gather(*[
+                    self.process_wallet_task(
+                        wallet=wallet,
+                        wallet_index=wallet_index,
+                        tasks=[task for task, _ in pending],
+                        task_index=task_index,
+
+                        scheduler=scheduler,
+                        timeline_index=timeline_index,
+                        semaphore=semaphore,
+
+                        task_occurrences=[occurrence for _, occurrence in pending],
+                        journal=journal
+                    )
+                    for timeline_index, wallet_index, wallet, pending in window
+                    if task_index < len(pending)
+                ])
+            finally:
+                shared_storage.close_window()
 
     async def _start_processing_async(
             self,
             wallets: List["WalletData"],
             tasks: List["TaskBase"],
+            concurrency: int = 1,
+
+            wallet_indexes: Optional[List[int]] = None,
+            logs_dir: Optional[str] = None,
+            logs_file_name: Optional[str] = None,
+            resume: bool = False,
+
+            execution_order: enums.ExecutionOrder = enums.ExecutionOrder.WALLET,
+            task_window_size: int = 10,
+            worker_index: Optional[int] = None,
     ):
         """
         Start processing async
+        Args:
+            wallets: wallets to process
+            tasks: tasks to process for every wallet
+            concurrency: max amount of tasks executed at the same time
+            wallet_indexes: indexes of wallets in the whole run, used for output
+            logs_dir: logs dir shared by all workers, a new one is created if not set
+            logs_file_name: xlsx logs file name of the current worker
+            resume: skip pairs completed according to the run journal
+            execution_order: run all tasks of a wallet first or a task across wallets first
+            task_window_size: amount of wallets sharing task data in task-major order
+            worker_index: index of worker process, None if the run has a single worker
         """
         configure_logger()
-        for wallet_index, wallet in enumerate(wallets):
-            await self.process_wallet(
-                wallet=wallet,
-                wallet_index=wallet_index,
-                tasks=tasks,
+        RpcMetrics.reset()
+        RequestCoalescer.reset_stats()
+
+        if wallet_indexes is None:
+            wallet_indexes = list(range(len(wallets)))
+
+        if any(task.test_mode is False for task in tasks):
+            ActionStorage().reset_all_actions()
+
+            if logs_dir:
+                ActionStorage().set_current_logs_dir(logs_dir)
+            else:
+                ActionStorage().create_and_set_new_logs_dir()
+
+            if logs_file_name:
+                ActionStorage().set_current_logs_file_name(logs_file_name)
+
+        concurrency = max(1, min(concurrency, len(wallets) or 1))
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=concurrency)
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        ReceiptTracker.configure(concurrency=concurrency)
+
+        journal = None
+        completed_keys = set()
+        if any(task.test_mode is False for task in tasks):
+            journal = RunJournal()
+            if resume:
+                completed_keys = journal.get_completed_keys()
+
+        occurrences = RunJournal.get_task_occurrences(tasks)
+
+        wallets_to_process = []
+        for wallet_index, wallet in zip(wallet_indexes, wallets):
+            pending = [
+                (task, occurrence) for task, occurrence in zip(tasks, occurrences)
+                if RunJournal.get_entry_key(
+                    wallet_address=wallet.address,
+                    task_id=str(task.task_id),
+                    occurrence=occurrence
+                ) not in completed_keys
+            ]
+            if not pending:
+                logger.info(f"Wallet {wallet.name} already completed, skipping")
+                continue
+
+            wallets_to_process.append((wallet_index, wallet, pending))
+
+        scheduler = PacingScheduler()
+        scheduler.plan(
+            wallets_tasks=[
+                [task for task, _ in pending] for _, _, pending in wallets_to_process
+            ],
+            # Single wallet at a time keeps the random delay between wallets of sequential processing
+            sequential=concurrency == 1 and execution_order == enums.ExecutionOrder.WALLET
+        )
+
+        if execution_order == enums.ExecutionOrder.TASK:
+            windowed = [
+                (timeline_index, wallet_index, wallet, pending)
+                for timeline_index, (wallet_index, wallet, pending) in enumerate(wallets_to_process)
+            ]
+            for window_start in range(0, len(windowed), task_window_size):
+                await self._process_window_task_major(
+                    window=windowed[window_start:window_start + task_window_size],
+                    scheduler=scheduler,
+                    semaphore=semaphore,
+                    journal=journal
+                )
 
-                is_last_wallet=wallet_index == len(wallets) - 1
+        else:
+            await asyncio.gather(*[
+                self.process_wallet(
+                    wallet=wallet,
+                    wallet_index=wallet_index,
+                    tasks=[task for task, _ in pending],
+
+                    scheduler=scheduler,
+                    timeline_index=timeline_index,
+                    semaphore=semaphore,
+
+                    task_occurrences=[occurrence for _, occurrence in pending],
+                    journal=journal
+                )
+                for timeline_index, (wallet_index, wallet, pending) in enumerate(wallets_to_process)
+            ])
+
+        await HttpPool.aclose_all()
+        await asyncio.to_thread(GasStats.flush)
+
+        coalescing_stats = RequestCoalescer.get_stats()
+        logger.info(
+            f"RPC reads sent: {coalescing_stats['misses']}, "
+            f"coalesced with reads in flight: {coalescing_stats['hits']}"
+        )
+        self.dump_rpc_metrics(worker_index=worker_index)
+
+        logger.success(f"All wallets and tasks completed!")
+
+    @staticmethod
+    def dump_rpc_metrics(worker_index: Optional[int] = None):
+        """
+        Logs requests stats by host and saves stats by route to the run logs dir
+        Args:
+            worker_index: index of worker process added to file name, workers share logs dir
+        """
+        for host, host_data in RpcMetrics.get_hosts_summary().items():
+            logger.info(
+                f"{host}: {host_data['requests']} requests, "
+                f"{host_data['failed_responses']} failed responses, "
+                f"{host_data['transport_errors']} transport errors, "
+                f"total time {round(host_data['total_ms'] / 1000, 2)}s"
             )
 
+        logs_dir = ActionStorage().get_current_logs_dir() or paths.LOGS_DIR
+        if worker_index is None:
+            file_name = "rpc_metrics.json"
+        else:
+            file_name = f"rpc_metrics_worker_{worker_index + 1}.json"
+
+        try:
+            os.makedirs(logs_dir, exist_ok=True)
+            RpcMetrics.dump_summary(os.path.join(logs_dir, file_name))
+
+        except Exception as e:
+            logger.error(f"Error while saving rpc metrics: {e}")
+
     def _start_processing(
         self,
         wallets: List["WalletData"],
         tasks: List["TaskBase"],
+        concurrency: int = 1,
+
+        wallet_indexes: Optional[List[int]] = None,
+        logs_dir: Optional[str] = None,
+        logs_file_name: Optional[str] = None,
+        resume: bool = False,
+
+        execution_order: enums.ExecutionOrder = enums.ExecutionOrder.WALLET,
+        task_window_size: int = 10,
+        worker_index: Optional[int] = None,
     ):
         """
         Start processing
         """
-        asyncio.run(self._start_processing_async(wallets, tasks))
+        asyncio.run(self._start_processing_async(
+            wallets=wallets,
+            tasks=tasks,
+            concurrency=concurrency,
+
+            wallet_indexes=wallet_indexes,
+            logs_dir=logs_dir,
+            logs_file_name=logs_file_name,
+            resume=resume,
+
+            execution_order=execution_order,
+            task_window_size=task_window_size,
+            worker_index=worker_index
+        ))
 
     def is_running(self):
         """
         Is processing running
         """
-        if isinstance(self.processing_process, mp.Process):
-            is_alive = self.processing_process.is_alive()
-            if not is_alive:
-                self.processing_process = None
-            return is_alive
+        self.processing_processes = [
+            process for process in self.processing_processes
+            if process.is_alive()
+        ]
 
-        return self.processing_process is not None
+        return bool(self.processing_processes)
 
     def process(
             self,
@@ -148,9 +445,26 @@ class TasksExecutor:
 
             shuffle_wallets: bool = False,
             shuffle_tasks: bool = False,
+
+            concurrency: Optional[int] = None,
+            workers: Optional[int] = None,
+            resume: bool = False,
+            execution_order: Optional[enums.ExecutionOrder] = None,
     ):
         """
         Process
+        Args:
+            wallets: wallets to process
+            tasks: tasks to process for every wallet
+            shuffle_wallets: shuffle wallets before processing
+            shuffle_tasks: shuffle tasks before processing
+            concurrency: max amount of tasks executed at the same time by every worker,
+                app config value is used if not set
+            workers: amount of worker processes wallets are split across,
+                app config value is used if not set
+            resume: skip (wallet, task) pairs completed in the previous run
+            execution_order: wallet-major or task-major order,
+                app config value is used if not set
         """
         logger.debug("Starting tasks executor")
 
@@ -160,8 +474,53 @@ class TasksExecutor:
         if shuffle_tasks:
             random.shuffle(tasks)
 
-        self.processing_process = mp.Process(target=self._start_processing, args=(wallets, tasks))
-        self.processing_process.start()
+        app_config = Storage().app_config
+        if concurrency is None:
+            concurrency = app_config.wallets_concurrency
+
+        if workers is None:
+            workers = app_config.wallets_workers
+
+        if execution_order is None:
+            execution_order = app_config.execution_order
+        workers = max(1, min(workers, len(wallets) or 1))
+
+        if not resume and any(task.test_mode is False for task in tasks):
+            RunJournal().reset()
+
+        logs_dir = None
+        if (
+            workers > 1
+            and app_config.preserve_logs
+            and any(task.test_mode is False for task in tasks)
+        ):
+            # One logs dir for the whole run, every worker writes its own xlsx file
+            logs_dir = FileManager.create_new_logs_dir()
+
+        for worker_index in range(workers):
+            wallet_indexes = list(range(worker_index, len(wallets), workers))
+            logs_file_name = f"!all_logs_worker_{worker_index + 1}.xlsx" if logs_dir else None
+
+            process = mp.Process(
+                target=self._start_processing,
+                args=(
+                    [wallets[i] for i in wallet_indexes],
+                    tasks,
+                    concurrency,
+
+                    wallet_indexes,
+                    logs_dir,
+                    logs_file_name,
+                    resume,
+
+                    execution_order,
+                    app_config.task_window_size,
+                    worker_index if workers > 1 else None
+                )
+            )
+            process.start()
+            self.processing_processes.append(process)
+
         self.event_manager.start()
 
     def stop(self):
@@ -170,13 +529,13 @@ class TasksExecutor:
         """
         self.event_manager.stop()
 
-        if isinstance(self.processing_process, mp.Process):
-            self.processing_process.terminate()
-
-        if self.processing_process:
-            self.processing_process.terminate()
+        for process in self.processing_processes:
+            if process.is_alive():
+                process.terminate()
 
-        self.processing_process = None
+        for process in self.processing_processes:
+            process.join(timeout=5)
 
+        self.processing_processes = []
 
 tasks_executor = TasksExecutor()
@@ -0,0 +1,149 @@
+import time
+import random
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+import config
+from src.schemas.tasks.base.base import TaskBase
+
+
+class PacingScheduler:
+    """
+    Plans every wallet timeline as absolute deadlines before the run starts.
+    Tasks of a wallet keep the configured min/max delay spacing. Sequential plan
+    starts every wallet a random delay after the previous one ends, same as processing
+    wallets one by one, otherwise all wallets are due at the start and concurrency limit
+    sets the gap between them, so idle time of one wallet is used by the others.
+    """
+
+    def __init__(self):
+        self.timelines: List[List[float]] = []
+        self.sequential = False
+
+    @staticmethod
+    def get_random_delay(task: TaskBase) -> int:
+        return random.randint(
+            task.min_delay_sec,
+            task.max_delay_sec
+        )
+
+    def plan(self, wallets_tasks: List[List[TaskBase]], sequential: bool = False):
+        """
+        Plan deadlines of all wallets
+        Args:
+            wallets_tasks: tasks to process for every wallet of the run
+            sequential: start every wallet a random delay after the last task of the previous one
+        """
+        self.timelines = []
+        self.sequential = sequential
+
+        # Not sequential wallets over concurrency limit wait for a free slot, not for a planned stagger
+        wallet_start = time.monotonic()
+        for tasks in wallets_tasks:
+            deadlines = []
+            deadline = wallet_start
+            for task in tasks:
+                deadlines.append(deadline)
+                deadline += self.get_random_delay(task)
+
+            self.timelines.append(deadlines)
+
+            if sequential and tasks:
+                # Same gap as sequential processing had between two wallets
+                wallet_start = deadline
+
+    def get_deadline(self, timeline_index: int, task_index: int) -> float:
+        return self.timelines[timeline_index][task_index]
+
+    async def wait_for_deadline(self, timeline_index: int, task_index: int):
+        """
+        Sleep until the task deadline of the wallet
+        Args:
+            timeline_index: index of wallet timeline
+            task_index: index of task in the timeline
+        """
+        time_to_sleep = self.get_deadline(timeline_index, task_index) - time.monotonic()
+        if time_to_sleep <= 0:
+            return
+
+        continue_datetime = datetime.now() + timedelta(seconds=time_to_sleep)
+        logger.info(f"Time to sleep for {round(time_to_sleep)} seconds... "
+                    f"Continue at {continue_datetime.strftime('%H:%M:%S')}")
+        await asyncio.sleep(time_to_sleep)
+
+    def get_next_position(self, timeline_index: int, task_index: int) -> Optional[Tuple[int, int]]:
+        """
+        Get position of the task due after the given one, in sequential plan
+        the first task of the next wallet follows the last task of a wallet
+        Args:
+            timeline_index: index of wallet timeline
+            task_index: index of task in the timeline
+        Returns:
+            timeline index and task index, None if there is no next task
+        """
+        if task_index + 1 < len(self.timelines[timeline_index]):
+            return timeline_index, task_index + 1
+
+        if not self.sequential:
+            return None
+
+        for next_timeline_index in range(timeline_index + 1, len(self.timelines)):
+            if self.timelines[next_timeline_index]:
+                return next_timeline_index, 0
+
+        return None
+
+    def shift_deadlines(self, timeline_index: int, task_index: int, shift: float):
+        """
+        Shift deadlines starting from the given task, in sequential plan
+        timelines of the following wallets are shifted as well
+        Args:
+            timeline_index: index of wallet timeline
+            task_index: index of the first task to shift
+            shift: seconds to add to deadlines
+        """
+        last_timeline_index = len(self.timelines) - 1 if self.sequential else timeline_index
+
+        for index in range(timeline_index, last_timeline_index + 1):
+            deadlines = self.timelines[index]
+            start_index = task_index if index == timeline_index else 0
+            for deadline_index in range(start_index, len(deadlines)):
+                deadlines[deadline_index] += shift
+
+    def set_task_completed(
+            self,
+            timeline_index: int,
+            task_index: int,
+            task: TaskBase,
+            task_result: bool
+    ):
+        """
+        Re-plan the rest of the wallet timeline after task completion
+        Args:
+            timeline_index: index of wallet timeline
+            task_index: index of completed task
+            task: completed task
+            task_result: is task successful
+        """
+        next_position = self.get_next_position(timeline_index, task_index)
+        if next_position is None:
+            return
+
+        next_timeline_index, next_index = next_position
+        now = time.monotonic()
+        planned = self.timelines[next_timeline_index][next_index]
+
+        if not task_result or task.test_mode:
+            next_deadline = now + config.DEFAULT_DELAY_SEC
+        else:
+            # Task took longer than planned, keep at least the min delay after it
+            next_deadline = max(planned, now + task.min_delay_sec)
+
+        self.shift_deadlines(
+            timeline_index=next_timeline_index,
+            task_index=next_index,
+            shift=next_deadline - planned
+        )
@@ -0,0 +1,122 @@
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from modules import batch_quote
+from modules.batch_quote import ReserveSnapshot
+from modules.liquid_swap import math as liquid_swap_math
+from modules.liquid_swap import stable_math
+from modules.pancake.math import get_amount_in
+from modules.thala.math import FixedPoint64, get_pair_amount_in
+
+
+def get_snapshot(rnd: random.Random) -> ReserveSnapshot:
+    return ReserveSnapshot(
+        reserve_in=rnd.randint(10 ** 11, 10 ** 13),
+        reserve_out=rnd.randint(10 ** 11, 10 ** 13),
+        fee=rnd.choice([4, 5, 30]),
+        scale_in=10 ** 6,
+        scale_out=10 ** 8
+    )
+
+
+@pytest.fixture
+def rnd() -> random.Random:
+    return random.Random(0)
+
+
+def test_coins_out_with_fees_batch(rnd):
+    for _ in range(20):
+        snapshot = get_snapshot(rnd)
+        amounts = [rnd.randint(0, 10 ** 12) for _ in range(500)]
+
+        batch_result = batch_quote.get_coins_out_with_fees_batch(amounts, snapshot)
+        assert batch_result.dtype == np.int64
+        assert batch_result.tolist() == [
+            liquid_swap_math.get_coins_out_with_fees(
+                Decimal(amount), Decimal(snapshot.reserve_in), Decimal(snapshot.reserve_out), Decimal(snapshot.fee)
+            ) for amount in amounts
+        ]
+
+
+def test_amount_in_batch(rnd):
+    for _ in range(20):
+        snapshot = get_snapshot(rnd)
+        amounts = [rnd.randint(0, 10 ** 12) for _ in range(500)]
+
+        batch_result = batch_quote.get_amount_in_batch(amounts, snapshot)
+        assert batch_result.dtype == np.int64
+        assert batch_result.tolist() == [
+            get_amount_in(amount, snapshot.reserve_in, snapshot.reserve_out) for amount in amounts
+        ]
+
+
+def test_amount_in_batch_falls_back_to_python_ints():
+    snapshot = ReserveSnapshot(reserve_in=10 ** 17, reserve_out=10 ** 30)
+    amounts = [1, 10 ** 15, 10 ** 20]
+
+    batch_result = batch_quote.get_amount_in_batch(amounts, snapshot)
+    assert batch_result.dtype == object
+    assert batch_result.tolist() == [
+        get_amount_in(amount, snapshot.reserve_in, snapshot.reserve_out) for amount in amounts
+    ]
+
+
+def test_pair_amount_in_batch(rnd):
+    snapshot = get_snapshot(rnd)
+    ratios = [rnd.randint(0, 2 ** 64 - 1) for _ in range(1000)] + [0, 2 ** 64 - 1]
+
+    amounts_x, amounts_y = batch_quote.get_pair_amount_in_batch(ratios, snapshot)
+    assert amounts_x.dtype == np.int64
+    assert list(zip(amounts_x.tolist(), amounts_y.tolist())) == [
+        get_pair_amount_in(FixedPoint64(ratio), snapshot.reserve_in, snapshot.reserve_out) for ratio in ratios
+    ]
+
+
+def test_pair_amount_in_batch_rejects_ratio_above_one(rnd):
+    snapshot = get_snapshot(rnd)
+
+    with pytest.raises(ValueError):
+        batch_quote.get_pair_amount_in_batch([2 ** 64 + 2 ** 60], snapshot)
+
+
+def test_stable_batch(rnd):
+    snapshot = get_snapshot(rnd)
+    amounts = [rnd.randint(10 ** 3, 10 ** 10) for _ in range(500)]
+
+    assert batch_quote.get_coins_out_with_fees_stable_batch(amounts, snapshot).tolist() == [
+        stable_math.get_coins_out_with_fees_stable(
+            amount, snapshot.reserve_in, snapshot.reserve_out, snapshot.scale_in, snapshot.scale_out, snapshot.fee
+        ) for amount in amounts
+    ]
+    assert batch_quote.get_coins_in_with_fees_stable_batch(amounts, snapshot).tolist() == [
+        stable_math.get_coins_in_with_fees_stable(
+            amount, snapshot.reserve_out, snapshot.reserve_in, snapshot.scale_out, snapshot.scale_in, snapshot.fee
+        ) for amount in amounts
+    ]
+
+
+def test_empty_batch(rnd):
+    snapshot = get_snapshot(rnd)
+
+    assert batch_quote.get_coins_out_with_fees_batch([], snapshot).size == 0
+    assert batch_quote.get_amount_in_batch([], snapshot).size == 0
+
+
+def test_mul_div(rnd):
+    a = np.array([rnd.randint(0, 2 ** 62) for _ in range(2000)], dtype=np.int64)
+    c = np.array([rnd.randint(2 ** 40, 2 ** 61) for _ in range(2000)], dtype=np.int64)
+    b = 2 ** 29 + 12345
+
+    assert batch_quote.mul_div(a, b, c).tolist() == [
+        int(a_value) * b // int(c_value) for a_value, c_value in zip(a, c)
+    ]
+
+
+def test_mul_div_rejects_large_quotient():
+    a = np.array([2 ** 62], dtype=np.int64)
+    c = np.array([3], dtype=np.int64)
+
+    assert batch_quote.mul_div(a, 2 ** 20, c) is None
@@ -0,0 +1,73 @@
+import random
+from decimal import Decimal, getcontext
+
+import pytest
+
+from modules.liquid_swap import math as decimal_math
+from modules.liquid_swap import stable_math
+
+
+# Vectors of liquidswap::stable_curve Move tests
+@pytest.mark.parametrize(
+    "coin_in, scale_in, scale_out, reserve_in, reserve_out, expected",
+    [
+        (2513058000, 1000000, 100000000, 25582858050757, 2558285805075712, 251305799999),
+        (2513058000, 100000000, 1000000, 2558285805075701, 25582858050757, 25130579),
+    ]
+)
+def test_coin_out_move_vectors(coin_in, scale_in, scale_out, reserve_in, reserve_out, expected):
+    assert stable_math.coin_out(coin_in, scale_in, scale_out, reserve_in, reserve_out) == expected
+
+
+def test_coin_in_move_vector():
+    assert stable_math.coin_in(251305800000, 100000000, 1000000, 2558285805075701, 25582858050757) == 2513058000
+
+
+def test_lp_value_move_vector():
+    # 0.3 ^ 3 * 0.5 + 0.5 ^ 3 * 0.3 = 0.051
+    assert stable_math.lp_value(300000, 1000000, 500000, 1000000) == 5100000000000000000000000000000
+
+
+def test_coins_in_with_fees_covers_coins_out():
+    reserve_in, reserve_out = 25582858050757, 2558285805075712
+    coin_out = 251305799999
+
+    coin_in = stable_math.get_coins_in_with_fees_stable(coin_out, reserve_out, reserve_in, 100000000, 1000000, 5)
+    assert stable_math.get_coins_out_with_fees_stable(coin_in, reserve_in, reserve_out, 1000000, 100000000, 5) >= coin_out
+
+
+def get_random_quotes(count: int) -> list:
+    rnd = random.Random(0)
+    quotes = []
+    for _ in range(count):
+        decimals_in, decimals_out = rnd.choice([(6, 6), (6, 8), (8, 6), (8, 8)])
+        quotes.append((
+            rnd.randint(10 ** 3, 10 ** 10),
+            rnd.randint(10 ** 10, 10 ** 13),
+            rnd.randint(10 ** 10, 10 ** 13),
+            10 ** decimals_in,
+            10 ** decimals_out,
+            rnd.choice([1, 4, 5, 30])
+        ))
+
+    return quotes
+
+
+def test_coins_out_with_fees_matches_decimal():
+    # Decimal keeps 28 digits of curve value of ~1e50 and takes fee without rounding,
+    # its quotes agree with integer ones within 1e-6 of the amount plus one unit of rounding
+    for quote in get_random_quotes(2000):
+        decimal_result = int(decimal_math.get_coins_out_with_fees_stable(*[Decimal(value) for value in quote]))
+        int_result = stable_math.get_coins_out_with_fees_stable(*quote)
+
+        assert int_result > 0
+        assert abs(decimal_result - int_result) <= int_result // 10 ** 6 + 1, quote
+
+
+def test_decimal_quotes_keep_global_context():
+    precision = getcontext().prec
+    decimal_math.get_coins_out_with_fees_stable(
+        Decimal(100000000), Decimal(33345610000), Decimal(575625000000), Decimal(1000000), Decimal(100000000), Decimal(5)
+    )
+
+    assert getcontext().prec == precision
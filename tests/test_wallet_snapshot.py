@@ -0,0 +1,38 @@
+from aptos_rest_client.resource_cache import normalize_type_tag
+from aptos_rest_client.wallet_snapshot import WalletSnapshot
+
+
+TOKEN_ADDRESS = "0x05e156f1207d0ebfa19a9eeff00d62a282278fb8719f4fab3a586a0a2c0fffbe"
+
+
+def get_snapshot() -> WalletSnapshot:
+    return WalletSnapshot(
+        account_address="0x1234",
+        resources=[
+            {
+                "type": f"0x1::coin::CoinStore<{TOKEN_ADDRESS[:2] + TOKEN_ADDRESS[3:]}::coin::T>",
+                "data": {"coin": {"value": "42"}}
+            },
+            {
+                "type": "0x1::coin::CoinStore<0x1::aptos_coin::AptosCoin>",
+                "data": {"coin": {"value": "7"}}
+            },
+        ],
+        ledger_version=1
+    )
+
+
+def test_normalize_type_tag():
+    assert normalize_type_tag("0x0001::coin::CoinStore< 0x1::aptos_coin::AptosCoin >") == \
+        "0x1::coin::CoinStore<0x1::aptos_coin::AptosCoin>"
+    assert normalize_type_tag("0x1::a::B<0x00::c::D, 0xAB::e::F<u64>>") == "0x1::a::B<0x0::c::D,0xab::e::F<u64>>"
+
+
+def test_snapshot_matches_differently_formatted_types():
+    snapshot = get_snapshot()
+
+    assert snapshot.get_coin_balance(f"{TOKEN_ADDRESS}::coin::T") == 42
+    assert snapshot.is_coin_registered(f"{TOKEN_ADDRESS}::coin::T")
+    assert snapshot.get_coin_balance("0x" + "1".zfill(64) + "::aptos_coin::AptosCoin") == 7
+    assert snapshot.get_coin_balance("0x1::other::Coin") == 0
+    assert not snapshot.is_coin_registered("0x1::other::Coin")
@@ -27,7 +27,7 @@ class BalanceChecker:
             self,
             wallet_address: AccountAddress,
             token_address: str,
-    ) -> int:
+    ) -> Union[int, None]:
         try:
             balance = self.client.account_resource(
                 wallet_address,
@@ -35,9 +35,13 @@ class BalanceChecker:
             )
             return int(balance["data"]["coin"]["value"])
 
+        except ResourceNotFound:
+            # Coin is not registered
+            return 0
+
         except Exception as ex:
             logger.error(f"Error getting balance: {ex}")
-            return 0
+            return None
 
     def get_balance_decimals(self, address: AccountAddress) -> Union[int, None]:
         if not self.coin_option:
@@ -50,12 +54,12 @@ class BalanceChecker:
             wallet_address=address,
             token_address=coin_contract
         )
-        wallet_coin_balance_decimals = wallet_coin_balance / (10 ** coin_decimals)
-        if wallet_coin_balance is None:
+        if wallet_coin_balance is None or coin_decimals is None:
             logger.error(f"[{address}] - Error")
+            return None
 
-        else:
-            logger.success(f"[{address}] - {round(wallet_coin_balance_decimals, 4)} {self.coin_option.symbol.upper()}")
+        wallet_coin_balance_decimals = wallet_coin_balance / (10 ** coin_decimals)
+        logger.success(f"[{address}] - {round(wallet_coin_balance_decimals, 4)} {self.coin_option.symbol.upper()}")
 
         return wallet_coin_balance_decimals
 
@@ -0,0 +1,3 @@
+from utils.mock_node.state import MockNodeState
+from utils.mock_node.state import MockNodeError
+from utils.mock_node.server import MockNode
@@ -0,0 +1,56 @@
+import json
+import time
+import argparse
+
+from loguru import logger
+
+from utils.mock_node.state import MockNodeState
+from utils.mock_node.server import MockNode
+
+
+def get_args_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run local mock Aptos REST node")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--state", help="Path to state json file, see MockNodeState.load")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0],
+                        help="Response latency, two values for random range")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failed with error status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--commit-delay-sec", type=float, default=0.0,
+                        help="Time transaction stays pending after submit")
+
+    return parser
+
+
+def main():
+    args = get_args_parser().parse_args()
+
+    state = MockNodeState()
+    state.commit_delay_sec = args.commit_delay_sec
+    if args.state:
+        with open(args.state, "r") as file:
+            state.load(json.load(file))
+
+    latency_sec = [latency_ms / 1000 for latency_ms in args.latency_ms]
+
+    node = MockNode(
+        state=state,
+        host=args.host,
+        port=args.port,
+        latency_sec=tuple(latency_sec) if len(latency_sec) > 1 else latency_sec[0],
+        error_rate=args.error_rate,
+        error_status_code=args.error_status
+    )
+    node.start()
+    logger.info(f"Mock node is running on {node.url}")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        node.stop()
+
+
+if __name__ == '__main__':
+    main()
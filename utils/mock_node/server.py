@@ -0,0 +1,403 @@
+import re
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Dict, List, Tuple, Type, Union
+from urllib.parse import parse_qs, unquote, urlparse
+
+from aptos_sdk.bcs import Deserializer
+from aptos_sdk.transactions import SignedTransaction
+
+from aptos_rest_client.bcs_resources import BcsResource
+from aptos_rest_client.bcs_resources import CoinStore
+from aptos_rest_client.bcs_resources import BCS_CONTENT_TYPE
+from utils.mock_node.state import MockNodeError
+from utils.mock_node.state import MockNodeState
+
+
+class InjectedError:
+    def __init__(
+            self,
+            status_code: int,
+            count: Union[int, None],
+            retry_after: Union[float, None]
+    ):
+        self.status_code = status_code
+        self.count = count
+        self.retry_after = retry_after
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, with Nagle's algorithm keep-alive responses stall on delayed ACK
+    disable_nagle_algorithm = True
+    # Node holds wait_by_hash request of pending transaction up to this time
+    wait_by_hash_timeout_sec = 1.0
+
+    # (method, path pattern, route name), paths are relative to /v1
+    routes: List[Tuple[str, re.Pattern, str]] = [
+        ("GET", re.compile(r"^/?$"), "info"),
+        ("GET", re.compile(r"^/estimate_gas_price$"), "estimate_gas_price"),
+        ("GET", re.compile(r"^/accounts/(?P<address>[^/]+)$"), "account"),
+        ("GET", re.compile(r"^/accounts/(?P<address>[^/]+)/resources$"), "resources"),
+        ("GET", re.compile(r"^/accounts/(?P<address>[^/]+)/resource/(?P<resource_type>.+)$"), "resource"),
+        ("POST", re.compile(r"^/tables/(?P<handle>[^/]+)/item$"), "table_item"),
+        ("POST", re.compile(r"^/view$"), "view"),
+        ("POST", re.compile(r"^/transactions/simulate$"), "simulate"),
+        ("POST", re.compile(r"^/transactions$"), "submit"),
+        ("POST", re.compile(r"^/transactions/batch$"), "submit_batch"),
+        ("GET", re.compile(r"^/transactions/by_hash/(?P<txn_hash>[^/]+)$"), "by_hash"),
+        ("GET", re.compile(r"^/transactions/wait_by_hash/(?P<txn_hash>[^/]+)$"), "wait_by_hash"),
+    ]
+
+    # (resource type prefix, struct class) of resources served as BCS on Accept: application/x-bcs
+    bcs_structs: List[Tuple[str, Type[BcsResource]]] = [
+        ("0x1::coin::CoinStore<", CoinStore),
+    ]
+
+    @property
+    def node(self) -> "MockNode":
+        return self.server.node
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_route("GET")
+
+    def do_POST(self):
+        self.handle_route("POST")
+
+    def handle_route(self, method: str):
+        url = urlparse(self.path)
+        path = url.path
+        if path.startswith("/v1"):
+            path = path[len("/v1"):]
+
+        content_length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(content_length) if content_length else b""
+
+        for route_method, pattern, route_name in self.routes:
+            match = pattern.match(path)
+            if route_method != method or match is None:
+                continue
+
+            self.node.count_request(route_name)
+            self.node.apply_latency()
+
+            injected_error = self.node.get_injected_error(route_name)
+            if injected_error is not None:
+                self.send_injected_error(injected_error)
+                return
+
+            params = {key: unquote(value) for key, value in match.groupdict().items()}
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+            try:
+                status_code, data, headers = getattr(self, f"route_{route_name}")(params, query, body)
+
+            except MockNodeError as e:
+                self.send_json(e.status_code, e.to_json())
+                return
+
+            except Exception as e:
+                self.send_json(400, {"message": str(e), "error_code": "invalid_input", "vm_error_code": None})
+                return
+
+            if isinstance(data, bytes):
+                self.send_bcs(status_code, data, headers)
+            else:
+                self.send_json(status_code, data, headers)
+            return
+
+        self.send_json(404, {"message": f"Route {method} {path} not found", "error_code": "web_framework_error"})
+
+    def send_json(self, status_code: int, data, headers: dict = None):
+        content = json.dumps(data).encode()
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("X-Aptos-Chain-Id", str(self.node.state.chain_id))
+        self.send_header("X-Aptos-Ledger-Version", str(self.node.state.ledger_version))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def send_bcs(self, status_code: int, content: bytes, headers: dict = None):
+        self.send_response(status_code)
+        self.send_header("Content-Type", BCS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("X-Aptos-Chain-Id", str(self.node.state.chain_id))
+        self.send_header("X-Aptos-Ledger-Version", str(self.node.state.ledger_version))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def get_bcs_struct(self, resource_type: str) -> Union[Type[BcsResource], None]:
+        if BCS_CONTENT_TYPE not in (self.headers.get("Accept") or ""):
+            return None
+
+        for resource_type_prefix, struct in self.bcs_structs:
+            if resource_type.startswith(resource_type_prefix):
+                return struct
+
+        return None
+
+    def send_injected_error(self, injected_error: InjectedError):
+        headers = {}
+        if injected_error.retry_after is not None:
+            headers["Retry-After"] = str(injected_error.retry_after)
+
+        self.send_json(
+            injected_error.status_code,
+            {"message": "Injected error", "error_code": "injected_error", "vm_error_code": None},
+            headers
+        )
+
+    def route_info(self, params: dict, query: dict, body: bytes):
+        state = self.node.state
+        return 200, {
+            "chain_id": state.chain_id,
+            "epoch": "1",
+            "ledger_version": str(state.ledger_version),
+            "ledger_timestamp": str(int(time.time() * 1_000_000)),
+            "node_role": "full_node",
+        }, None
+
+    def route_estimate_gas_price(self, params: dict, query: dict, body: bytes):
+        gas_estimate = self.node.state.gas_estimate
+        return 200, {
+            "deprioritized_gas_estimate": gas_estimate,
+            "gas_estimate": gas_estimate,
+            "prioritized_gas_estimate": int(gas_estimate * 1.5),
+        }, None
+
+    def route_account(self, params: dict, query: dict, body: bytes):
+        account = self.node.state.get_account(params["address"])
+        if account is None:
+            raise MockNodeError(404, "account_not_found", f"Account not found: {params['address']}")
+
+        return 200, {
+            "sequence_number": str(account["sequence_number"]),
+            "authentication_key": params["address"],
+        }, None
+
+    def route_resources(self, params: dict, query: dict, body: bytes):
+        resources = self.node.state.get_resources(params["address"])
+        if resources is None:
+            raise MockNodeError(404, "account_not_found", f"Account not found: {params['address']}")
+
+        start = int(query.get("start", 0))
+        limit = int(query.get("limit", 1000))
+        page = resources[start:start + limit]
+
+        headers = {}
+        if start + limit < len(resources):
+            headers["X-Aptos-Cursor"] = str(start + limit)
+
+        return 200, page, headers
+
+    def route_resource(self, params: dict, query: dict, body: bytes):
+        resource_type = params["resource_type"]
+        data = self.node.state.get_resource(params["address"], resource_type)
+        if data is None:
+            raise MockNodeError(404, "resource_not_found", f"Resource not found: {resource_type}")
+
+        bcs_struct = self.get_bcs_struct(resource_type)
+        if bcs_struct is not None:
+            return 200, bcs_struct.from_resource_data(data).to_bytes(), None
+
+        return 200, {"type": resource_type, "data": data}, None
+
+    def route_table_item(self, params: dict, query: dict, body: bytes):
+        request_data = json.loads(body)
+        return 200, self.node.state.get_table_item(params["handle"], request_data["key"]), None
+
+    def route_view(self, params: dict, query: dict, body: bytes):
+        request_data = json.loads(body)
+        result = self.node.state.call_view(
+            function=request_data["function"],
+            type_arguments=request_data.get("type_arguments", []),
+            arguments=request_data.get("arguments", [])
+        )
+        return 200, result, None
+
+    def route_simulate(self, params: dict, query: dict, body: bytes):
+        signed_transaction = SignedTransaction.deserialize(Deserializer(body))
+        return 200, self.node.state.simulate(signed_transaction), None
+
+    def route_submit(self, params: dict, query: dict, body: bytes):
+        transaction = self.node.state.submit(body)
+        return 202, transaction.to_json(), None
+
+    def route_submit_batch(self, params: dict, query: dict, body: bytes):
+        deserializer = Deserializer(body)
+        signed_transactions = deserializer.sequence(SignedTransaction.deserialize)
+
+        failures = []
+        for index, signed_transaction in enumerate(signed_transactions):
+            try:
+                self.node.state.submit(signed_transaction.bytes())
+
+            except MockNodeError as e:
+                failures.append({"error": e.to_json(), "transaction_index": index})
+
+        return 206 if failures else 202, {"transaction_failures": failures}, None
+
+    def route_by_hash(self, params: dict, query: dict, body: bytes):
+        transaction = self.node.state.get_transaction(params["txn_hash"])
+        if transaction is None:
+            raise MockNodeError(404, "transaction_not_found", f"Transaction not found: {params['txn_hash']}")
+
+        return 200, transaction.to_json(), None
+
+    def route_wait_by_hash(self, params: dict, query: dict, body: bytes):
+        deadline = time.monotonic() + self.wait_by_hash_timeout_sec
+
+        transaction = self.node.state.get_transaction(params["txn_hash"])
+        while transaction is not None and transaction.version is None and time.monotonic() < deadline:
+            time.sleep(max(min(transaction.commit_at, deadline) - time.monotonic(), 0.005))
+            transaction = self.node.state.get_transaction(params["txn_hash"])
+
+        if transaction is None:
+            raise MockNodeError(404, "transaction_not_found", f"Transaction not found: {params['txn_hash']}")
+
+        return 200, transaction.to_json(), None
+
+
+class MockNodeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Default backlog of 5 resets connections of concurrent benchmark clients
+    request_queue_size = 256
+
+    def __init__(self, server_address, node: "MockNode"):
+        super().__init__(server_address, MockNodeHandler)
+        self.node = node
+
+
+class MockNode:
+    """
+    Local stand-in of Aptos REST node serving MockNodeState.
+    Latency and errors can be injected per route, request counts are kept for benchmarks.
+    Usage:
+        with MockNode() as node:
+            node.state.set_coin_balance(address, "0x1::aptos_coin::AptosCoin", 10 ** 8)
+            client = CustomRestClient(base_url=node.url)
+    """
+
+    def __init__(
+            self,
+            state: MockNodeState = None,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency_sec: Union[float, Tuple[float, float]] = 0.0,
+            error_rate: float = 0.0,
+            error_status_code: int = 503
+    ):
+        self.state = state or MockNodeState()
+        self.host = host
+        self.port = port
+
+        self.latency_sec = latency_sec
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+
+        self.requests_count: Dict[str, int] = {}
+        self.injected_errors: Dict[Union[str, None], List[InjectedError]] = {}
+        self.lock = threading.Lock()
+
+        self.server: Union[MockNodeServer, None] = None
+        self.server_thread: Union[threading.Thread, None] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> "MockNode":
+        self.server = MockNodeServer((self.host, self.port), node=self)
+        self.port = self.server.server_address[1]
+
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        return self
+
+    def stop(self):
+        if self.server is None:
+            return
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+
+    def __enter__(self) -> "MockNode":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def inject_error(
+            self,
+            status_code: int = 429,
+            route: Union[str, None] = None,
+            count: Union[int, None] = 1,
+            retry_after: Union[float, None] = None
+    ):
+        """
+        Makes next requests fail
+        :param status_code:
+        :param route: route name, e.g. "resource", "submit", all routes if not set
+        :param count: amount of failed requests, None for all until clear_injected_errors
+        :param retry_after: Retry-After header value
+        :return:
+        """
+        with self.lock:
+            self.injected_errors.setdefault(route, []).append(
+                InjectedError(status_code=status_code, count=count, retry_after=retry_after)
+            )
+
+    def clear_injected_errors(self):
+        with self.lock:
+            self.injected_errors = {}
+
+    def get_injected_error(self, route: str) -> Union[InjectedError, None]:
+        with self.lock:
+            for key in (route, None):
+                errors = self.injected_errors.get(key)
+                if not errors:
+                    continue
+
+                injected_error = errors[0]
+                if injected_error.count is not None:
+                    injected_error.count -= 1
+                    if injected_error.count <= 0:
+                        errors.pop(0)
+
+                return injected_error
+
+        if self.error_rate and random.random() < self.error_rate:
+            return InjectedError(status_code=self.error_status_code, count=1, retry_after=None)
+
+        return None
+
+    def apply_latency(self):
+        latency_sec = self.latency_sec
+        if isinstance(latency_sec, (tuple, list)):
+            latency_sec = random.uniform(*latency_sec)
+
+        if latency_sec:
+            time.sleep(latency_sec)
+
+    def count_request(self, route: str):
+        with self.lock:
+            self.requests_count[route] = self.requests_count.get(route, 0) + 1
+
+    def reset_requests_count(self):
+        with self.lock:
+            self.requests_count = {}
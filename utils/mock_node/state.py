@@ -0,0 +1,400 @@
+import re
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Union
+
+from aptos_sdk.bcs import Deserializer
+from aptos_sdk.transactions import EntryFunction
+from aptos_sdk.transactions import SignedTransaction
+
+from aptos_rest_client.resource_cache import normalize_address
+
+
+APTOS_COIN = "0x1::aptos_coin::AptosCoin"
+TRANSACTION_HASH_PREFIX = hashlib.sha3_256(b"APTOS::Transaction").digest()
+
+
+def normalize_type(type_str: str) -> str:
+    """
+    Brings type string to node format: special addresses (0x0 - 0xf) are short, other are full length
+    :param type_str:
+    :return:
+    """
+    def normalize_type_address(match: re.Match) -> str:
+        value = int(match.group(0), 16)
+        if value < 16:
+            return hex(value)
+
+        return normalize_address(match.group(0))
+
+    type_str = re.sub(r"0x[0-9a-fA-F]+", normalize_type_address, type_str.strip())
+    return re.sub(r"\s*,\s*", ", ", type_str)
+
+
+def get_transaction_hash(signed_transaction_bytes: bytes) -> str:
+    # User transaction variant of Transaction enum is 0
+    return "0x" + hashlib.sha3_256(TRANSACTION_HASH_PREFIX + b"\x00" + signed_transaction_bytes).hexdigest()
+
+
+class MockNodeError(Exception):
+    def __init__(self, status_code: int, error_code: str, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_code = error_code
+        self.message = message
+
+    def to_json(self) -> dict:
+        return {
+            "message": self.message,
+            "error_code": self.error_code,
+            "vm_error_code": None
+        }
+
+
+class MockTransaction:
+    def __init__(
+            self,
+            txn_hash: str,
+            signed_transaction: SignedTransaction,
+            commit_at: float
+    ):
+        self.hash = txn_hash
+        self.signed_transaction = signed_transaction
+        self.commit_at = commit_at
+
+        self.version: Union[int, None] = None
+        self.success = True
+        self.vm_status = "Executed successfully"
+        self.gas_used = 0
+
+    @property
+    def raw_transaction(self):
+        return self.signed_transaction.transaction
+
+    @property
+    def sender(self) -> str:
+        return normalize_address(self.raw_transaction.sender)
+
+    @property
+    def function(self) -> Union[str, None]:
+        entry_function = self.raw_transaction.payload.value
+        if not isinstance(entry_function, EntryFunction):
+            return None
+
+        return normalize_type(f"{entry_function.module}::{entry_function.function}")
+
+    def to_json(self) -> dict:
+        raw_transaction = self.raw_transaction
+        data = {
+            "type": "pending_transaction" if self.version is None else "user_transaction",
+            "hash": self.hash,
+            "sender": self.sender,
+            "sequence_number": str(raw_transaction.sequence_number),
+            "max_gas_amount": str(raw_transaction.max_gas_amount),
+            "gas_unit_price": str(raw_transaction.gas_unit_price),
+            "expiration_timestamp_secs": str(raw_transaction.expiration_timestamps_secs),
+            "payload": {"type": "entry_function_payload", "function": self.function},
+        }
+        if self.version is not None:
+            data.update({
+                "version": str(self.version),
+                "success": self.success,
+                "vm_status": self.vm_status,
+                "gas_used": str(self.gas_used),
+            })
+
+        return data
+
+
+class MockNodeState:
+    """
+    In-memory chain state of the mock node: accounts with resources and sequence numbers,
+    table items, view function results and submitted transactions.
+    Pools are resources of pool accounts, set them with set_resource.
+    Transactions are committed after commit_delay_sec, gas fee is charged in APT and
+    a handler registered for the entry function applies its effects.
+    """
+
+    def __init__(self, chain_id: int = 1):
+        self.lock = threading.RLock()
+
+        self.chain_id = chain_id
+        self.ledger_version = 1
+        self.gas_estimate = 100
+
+        self.accounts: Dict[str, dict] = {}
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self.view_results: Dict[str, Union[list, Callable]] = {}
+        self.transactions: Dict[str, MockTransaction] = {}
+
+        self.commit_delay_sec = 0.0
+        self.simulation_result = {"success": True, "vm_status": "Executed successfully", "gas_used": 500}
+
+        self.transaction_handlers: Dict[str, Callable[["MockNodeState", MockTransaction], None]] = {
+            "0x1::aptos_account::transfer": transfer_handler,
+            "0x1::coin::transfer": transfer_handler,
+        }
+
+    def load(self, data: dict):
+        """
+        Loads state from dict, used for state json files
+        {
+            "accounts": {address: {"sequence_number": int, "balances": {coin type: int}, "resources": {type: data}}},
+            "coin_infos": {coin type: {"name": str, "symbol": str, "decimals": int}},
+            "tables": {handle: [{"key": any, "value": any}]},
+            "view_results": {function: list}
+        }
+        :param data:
+        :return:
+        """
+        for address, account_data in data.get("accounts", {}).items():
+            self.set_sequence_number(address, account_data.get("sequence_number", 0))
+            for coin_type, balance in account_data.get("balances", {}).items():
+                self.set_coin_balance(address, coin_type, balance)
+            for resource_type, resource_data in account_data.get("resources", {}).items():
+                self.set_resource(address, resource_type, resource_data)
+
+        for coin_type, coin_info in data.get("coin_infos", {}).items():
+            self.set_coin_info(coin_type, **coin_info)
+
+        for handle, items in data.get("tables", {}).items():
+            for item in items:
+                self.set_table_item(handle, item["key"], item["value"])
+
+        for function, result in data.get("view_results", {}).items():
+            self.set_view_result(function, result)
+
+    def bump_ledger_version(self) -> int:
+        with self.lock:
+            self.ledger_version += 1
+            return self.ledger_version
+
+    def get_or_create_account(self, address) -> dict:
+        address = normalize_address(address)
+
+        with self.lock:
+            account = self.accounts.get(address)
+            if account is None:
+                account = {"sequence_number": 0, "resources": {}}
+                self.accounts[address] = account
+
+            return account
+
+    def get_account(self, address) -> Union[dict, None]:
+        with self.lock:
+            return self.accounts.get(normalize_address(address))
+
+    def set_sequence_number(self, address, sequence_number: int):
+        with self.lock:
+            self.get_or_create_account(address)["sequence_number"] = int(sequence_number)
+            self.bump_ledger_version()
+
+    def set_resource(self, address, resource_type: str, data: dict):
+        with self.lock:
+            self.get_or_create_account(address)["resources"][normalize_type(resource_type)] = data
+            self.bump_ledger_version()
+
+    def get_resource(self, address, resource_type: str) -> Union[dict, None]:
+        with self.lock:
+            account = self.get_account(address)
+            if account is None:
+                return None
+
+            return account["resources"].get(normalize_type(resource_type))
+
+    def get_resources(self, address) -> Union[List[dict], None]:
+        with self.lock:
+            account = self.get_account(address)
+            if account is None:
+                return None
+
+            return [
+                {"type": resource_type, "data": data}
+                for resource_type, data in account["resources"].items()
+            ]
+
+    def set_coin_balance(self, address, coin_type: str, value: int):
+        self.set_resource(
+            address,
+            f"0x1::coin::CoinStore<{coin_type}>",
+            {
+                "coin": {"value": str(int(value))},
+                "frozen": False,
+                "deposit_events": {
+                    "counter": "0",
+                    "guid": {"id": {"addr": normalize_address(address), "creation_num": "2"}}
+                },
+                "withdraw_events": {
+                    "counter": "0",
+                    "guid": {"id": {"addr": normalize_address(address), "creation_num": "3"}}
+                },
+            }
+        )
+
+    def get_coin_balance(self, address, coin_type: str) -> Union[int, None]:
+        resource = self.get_resource(address, f"0x1::coin::CoinStore<{coin_type}>")
+        if resource is None:
+            return None
+
+        return int(resource["coin"]["value"])
+
+    def add_coin_balance(self, address, coin_type: str, amount: int):
+        with self.lock:
+            balance = self.get_coin_balance(address, coin_type) or 0
+            if balance + amount < 0:
+                raise MockNodeError(400, "vm_error", "Move abort: EINSUFFICIENT_BALANCE")
+
+            self.set_coin_balance(address, coin_type, balance + amount)
+
+    def set_coin_info(
+            self,
+            coin_type: str,
+            name: str,
+            symbol: str,
+            decimals: int,
+            supply: Union[int, None] = None
+    ):
+        coin_address = normalize_type(coin_type).split("::")[0]
+        self.set_resource(
+            coin_address,
+            f"0x1::coin::CoinInfo<{coin_type}>",
+            {
+                "name": name,
+                "symbol": symbol,
+                "decimals": int(decimals),
+                "supply": {"vec": [] if supply is None else [{"integer": {"vec": [{"value": str(supply)}]}}]},
+            }
+        )
+
+    def set_table_item(self, handle: str, key: Any, value: Any):
+        with self.lock:
+            self.tables.setdefault(normalize_address(handle), {})[json.dumps(key, sort_keys=True)] = value
+            self.bump_ledger_version()
+
+    def get_table_item(self, handle: str, key: Any) -> Any:
+        with self.lock:
+            table = self.tables.get(normalize_address(handle), {})
+            table_key = json.dumps(key, sort_keys=True)
+            if table_key not in table:
+                raise MockNodeError(404, "table_item_not_found", f"Table item not found by key {key}")
+
+            return table[table_key]
+
+    def set_view_result(self, function: str, result: Union[list, Callable[[list, list], list]]):
+        """
+        Sets view function result
+        :param function:
+        :param result: result list or callable of (type_arguments, arguments)
+        :return:
+        """
+        with self.lock:
+            self.view_results[normalize_type(function)] = result
+
+    def call_view(self, function: str, type_arguments: list, arguments: list) -> list:
+        with self.lock:
+            result = self.view_results.get(normalize_type(function))
+
+        if result is None:
+            raise MockNodeError(400, "invalid_input", f"View function {function} is not set in mock node")
+
+        if callable(result):
+            return result(type_arguments, arguments)
+
+        return result
+
+    def simulate(self, signed_transaction: SignedTransaction) -> List[dict]:
+        raw_transaction = signed_transaction.transaction
+        with self.lock:
+            result = dict(self.simulation_result)
+            account = self.get_account(raw_transaction.sender)
+
+        sequence_number = account["sequence_number"] if account else 0
+        if raw_transaction.sequence_number < sequence_number:
+            result.update({"success": False, "vm_status": "SEQUENCE_NUMBER_TOO_OLD", "gas_used": 0})
+        elif raw_transaction.sequence_number > sequence_number:
+            result.update({"success": False, "vm_status": "SEQUENCE_NUMBER_TOO_NEW", "gas_used": 0})
+
+        return [{
+            "success": result["success"],
+            "vm_status": result["vm_status"],
+            "gas_used": str(result["gas_used"]),
+            "hash": get_transaction_hash(signed_transaction.bytes()),
+        }]
+
+    def submit(self, signed_transaction_bytes: bytes) -> MockTransaction:
+        signed_transaction = SignedTransaction.deserialize(Deserializer(signed_transaction_bytes))
+        raw_transaction = signed_transaction.transaction
+        txn_hash = get_transaction_hash(signed_transaction_bytes)
+
+        with self.lock:
+            if txn_hash in self.transactions:
+                return self.transactions[txn_hash]
+
+            if raw_transaction.chain_id != self.chain_id:
+                raise MockNodeError(400, "invalid_transaction_update", "Invalid chain id")
+
+            account = self.get_or_create_account(raw_transaction.sender)
+            if raw_transaction.sequence_number < account["sequence_number"]:
+                raise MockNodeError(400, "sequence_number_too_old", "Transaction sequence number is too old")
+            if raw_transaction.sequence_number > account["sequence_number"]:
+                raise MockNodeError(400, "sequence_number_too_new", "Transaction sequence number is too new")
+
+            account["sequence_number"] += 1
+            transaction = MockTransaction(
+                txn_hash=txn_hash,
+                signed_transaction=signed_transaction,
+                commit_at=time.monotonic() + self.commit_delay_sec
+            )
+            self.transactions[txn_hash] = transaction
+
+            return transaction
+
+    def get_transaction(self, txn_hash: str) -> Union[MockTransaction, None]:
+        with self.lock:
+            transaction = self.transactions.get(txn_hash)
+            if transaction is not None and transaction.version is None and time.monotonic() >= transaction.commit_at:
+                self.commit(transaction)
+
+            return transaction
+
+    def commit(self, transaction: MockTransaction):
+        with self.lock:
+            transaction.gas_used = int(self.simulation_result["gas_used"])
+            fee = transaction.gas_used * transaction.raw_transaction.gas_unit_price
+
+            try:
+                handler = self.transaction_handlers.get(transaction.function)
+                if handler is not None:
+                    handler(self, transaction)
+
+            except MockNodeError as e:
+                transaction.success = False
+                transaction.vm_status = e.message
+
+            if self.get_coin_balance(transaction.sender, APTOS_COIN) is not None:
+                self.add_coin_balance(
+                    transaction.sender,
+                    APTOS_COIN,
+                    -min(fee, self.get_coin_balance(transaction.sender, APTOS_COIN))
+                )
+
+            transaction.version = self.bump_ledger_version()
+
+
+def transfer_handler(state: MockNodeState, transaction: MockTransaction):
+    """
+    Applies 0x1::aptos_account::transfer and 0x1::coin::transfer
+    :param state:
+    :param transaction:
+    :return:
+    """
+    entry_function: EntryFunction = transaction.raw_transaction.payload.value
+    coin_type = normalize_type(str(entry_function.ty_args[0])) if entry_function.ty_args else APTOS_COIN
+
+    recipient = "0x" + entry_function.args[0].hex()
+    amount = int.from_bytes(entry_function.args[1], "little")
+
+    state.add_coin_balance(transaction.sender, coin_type, -amount)
+    state.add_coin_balance(recipient, coin_type, amount)
@@ -1,4 +1,3 @@
-import config
 import random
 
 from enum import Enum
@@ -200,4 +199,3 @@ def print_module_config(task: TaskBase):
         print(f"{Fore.LIGHTMAGENTA_EX}APTOS - 0xa673abe0e02def0bf6915eb91bbc9172b6f56662150c069f4cd44adcecf9c8f3"
               f"{Fore.RESET}\n")
 
-    print(f"{Fore.LIGHTMAGENTA_EX}Starting in {config.DEFAULT_DELAY_SEC} sec...{Fore.RESET}\n")
@@ -6,6 +6,13 @@ from loguru import logger
 
 def write_wallet_action_to_xlsx():
     action_storage = ActionStorage()
+
+    # Wallets may be processed concurrently, the whole file is rewritten on each call
+    with action_storage.lock:
+        _write_wallet_action_to_xlsx(action_storage)
+
+
+def _write_wallet_action_to_xlsx(action_storage):
     all_actions = action_storage.get_all_actions()
 
     if not all_actions:
@@ -32,7 +39,10 @@ def write_wallet_action_to_xlsx():
             data["Status"].append(action.status)
 
         df = pd.DataFrame(data)
-        df.to_excel(f"{action_storage.get_current_logs_dir()}\\!all_logs.xlsx", index=False)
+        df.to_excel(
+            f"{action_storage.get_current_logs_dir()}\\{action_storage.get_current_logs_file_name()}",
+            index=False
+        )
 
     except Exception as e:
         logger.error(f"Error while logging all actions to xlsx: {e}")